@@ -4,12 +4,21 @@ import base64
 import json
 import logging
 import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 import jwt
 
 from .config import get_settings
+from .push_token_pruning import (
+    APNS_BAD_TOKEN_REASON,
+    APNS_ENVIRONMENT_RETRY_REASONS,
+    classify_apns_failure,
+    invalid_push_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +30,10 @@ _cached_jwt: str | None = None
 _cached_jwt_expires: float = 0
 JWT_LIFETIME_SECONDS = 50 * 60
 
+# 배치 지연 히스토그램 버킷 상한(ms). 마지막 칸은 그 이상.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+RECENT_BATCHES = 20
+
 # HTTP/2 keep-alive 커넥션 재사용 전역 클라이언트.
 # 요청마다 새로 만들면 TLS handshake 비용이 누적돼 워치 푸시 지연으로 이어진다.
 _http_client: httpx.AsyncClient | None = None
@@ -89,59 +102,351 @@ async def send_push(
     # watchOS는 별도 번들 ID 사용
     topic = f"{settings.apns_bundle_id}.watchkitapp" if platform == "watchos" else settings.apns_bundle_id
 
-    headers = {
+    apns_payload = {
+        "aps": {"content-available": 1},
+        **payload,
+    }
+    outcome = await _post_silent(
+        _get_http_client(),
+        device_token,
+        json.dumps(apns_payload),
+        _silent_headers(jwt_token, topic),
+        sandbox=sandbox,
+    )
+    return outcome.ok
+
+
+def _silent_headers(jwt_token: str, topic: str) -> dict[str, str]:
+    return {
         "authorization": f"bearer {jwt_token}",
         "apns-topic": topic,
         "apns-push-type": "background",
         "apns-priority": "5",
+        "content-type": "application/json",
     }
 
-    apns_payload = {
-        "aps": {"content-available": 1},
-        **payload,
-    }
 
-    client = _get_http_client()
+@dataclass
+class _PushOutcome:
+    ok: bool
+    status: int | None = None
+    reason: str = ""
+    sandbox: bool = False  # 실제로 성공/실패가 확정된 환경
+    requests: int = 1
+    invalid_reason: str | None = None  # 다시 보내도 안 되는 토큰이면 사유 (pruning 대상)
 
-    # 먼저 지정된 환경으로 시도, 실패 시 반대 환경으로 폴백
-    environments = [sandbox, not sandbox]
-    for try_sandbox in environments:
+
+def _response_reason(body: str) -> str:
+    try:
+        return json.loads(body).get("reason", "") or ""
+    except Exception:
+        return ""
+
+
+def _record_if_invalid(
+    token: str,
+    status_code: int | None,
+    reason: str,
+    *,
+    both_environments: bool = False,
+) -> str | None:
+    invalid_reason = classify_apns_failure(status_code, reason, both_environments=both_environments)
+    if invalid_reason is not None:
+        invalid_push_tokens.record(token, invalid_reason, source="apns")
+    return invalid_reason
+
+
+async def _post_silent(
+    client: httpx.AsyncClient,
+    device_token: str,
+    content: str | bytes,
+    headers: dict[str, str],
+    *,
+    sandbox: bool,
+) -> _PushOutcome:
+    """silent push 1건 전송. 먼저 지정된 환경으로 시도, 환경 불일치면 반대 환경으로 폴백.
+
+    BadDeviceToken 도 환경을 잘못 저장한 토큰일 수 있어 반대 환경으로 한 번 더 보내고,
+    두 환경 모두 BadDeviceToken 일 때만 죽은 토큰으로 기록한다.
+    """
+    topic = headers.get("apns-topic")
+    requests = 0
+    first_reason = ""
+    for try_sandbox in (sandbox, not sandbox):
         base_url = APNS_SANDBOX_URL if try_sandbox else APNS_PRODUCTION_URL
         url = f"{base_url}/3/device/{device_token}"
+        requests += 1
 
         try:
-            response = await client.post(
-                url,
-                content=json.dumps(apns_payload),
-                headers={**headers, "content-type": "application/json"},
-            )
+            response = await client.post(url, content=content, headers=headers)
 
             if response.status_code == 200:
                 # 환경이 바뀌었으면 DB 업데이트를 위해 로그
                 if try_sandbox != sandbox:
                     logger.info("[APNs] Push succeeded with fallback env: sandbox=%s token=%s...", try_sandbox, device_token[:16])
-                return True
+                return _PushOutcome(ok=True, status=200, sandbox=try_sandbox, requests=requests)
 
             body = response.text
-            reason = ""
-            try:
-                reason = json.loads(body).get("reason", "")
-            except Exception:
-                pass
-
-            # 환경 불일치면 반대 환경으로 재시도
-            if reason in ("BadEnvironmentKeyInToken",) and try_sandbox == sandbox:
-                logger.info("[APNs] Environment mismatch, retrying with sandbox=%s token=%s...", not sandbox, device_token[:16])
+            reason = _response_reason(body)
+
+            # 환경 불일치(또는 다른 환경의 토큰)면 반대 환경으로 재시도
+            if reason in APNS_ENVIRONMENT_RETRY_REASONS and try_sandbox == sandbox:
+                logger.info("[APNs] %s, retrying with sandbox=%s token=%s...", reason, not sandbox, device_token[:16])
+                first_reason = reason
                 continue
 
             logger.warning("[APNs] Push failed: status=%s body=%s token=%s... sandbox=%s topic=%s", response.status_code, body, device_token[:16], try_sandbox, topic)
-            return False
+            invalid_reason = _record_if_invalid(
+                device_token,
+                response.status_code,
+                reason,
+                both_environments=first_reason == APNS_BAD_TOKEN_REASON,
+            )
+            return _PushOutcome(
+                ok=False,
+                status=response.status_code,
+                reason=reason,
+                sandbox=try_sandbox,
+                requests=requests,
+                invalid_reason=invalid_reason,
+            )
 
         except Exception:
             logger.exception("[APNs] Push request error: token=%s...", device_token[:16])
-            return False
+            return _PushOutcome(ok=False, reason="RequestError", sandbox=try_sandbox, requests=requests)
 
-    return False
+    return _PushOutcome(ok=False, sandbox=not sandbox, requests=requests)
+
+
+@dataclass
+class SilentPushTarget:
+    token: str
+    my_team: str
+    use_sandbox: bool
+    platform: str = "ios"
+
+
+@dataclass
+class SilentPushBatchResult:
+    targets: int = 0
+    sent: int = 0
+    failed: int = 0
+    requests: int = 0
+    failed_tokens: list[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    # 저장된 환경과 반대 환경에서 성공한 토큰 → 실제 is_sandbox (호출자가 DB/캐시에 반영)
+    environment_changes: dict[str, bool] = field(default_factory=dict)
+
+
+class _PayloadTemplate:
+    """공통 payload 를 1회만 직렬화하고, 토큰마다 다른 my_team 만 끝에 이어 붙인다.
+
+    payload 에 my_team 키가 없어야 한다. my_team 값별 결과는 배치 안에서 재사용 (응원팀 수만큼만 만든다).
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        encoded = json.dumps({"aps": {"content-available": 1}, **payload}, separators=(",", ":"))
+        self._prefix = encoded[:-1]
+        self._bodies: dict[str, bytes] = {}
+
+    def render(self, my_team: str) -> bytes:
+        body = self._bodies.get(my_team)
+        if body is None:
+            body = f'{self._prefix},"my_team":{json.dumps(my_team)}}}'.encode("utf-8")
+            self._bodies[my_team] = body
+        return body
+
+
+class _LatencyHistogram:
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.samples: list[float] = []
+
+    def observe(self, latency_ms: float) -> None:
+        self.samples.append(latency_ms)
+        for index, upper in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= upper:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    def percentile(self, ratio: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))], 1)
+
+    def as_dict(self) -> dict[str, int]:
+        labels = [f"le{upper}" for upper in LATENCY_BUCKETS_MS] + [f"gt{LATENCY_BUCKETS_MS[-1]}"]
+        return dict(zip(labels, self.counts))
+
+
+class ApnsDispatcher:
+    """silent push 배치 전송기 (visible push 도 같은 동시 요청 상한을 공유).
+
+    - 토큰당 task 를 만들지 않고, 최대 max_concurrency 개 worker 가 대상 목록을 나눠 소비한다.
+      여러 배치(경기)가 동시에 돌아도 전체 동시 요청 수는 max_concurrency 를 넘지 않는다 (backpressure).
+    - 한 토큰의 여러 payload(이벤트)는 같은 worker 가 순서대로 보낸다.
+    - payload/헤더는 배치당 1회만 만든다.
+    """
+
+    def __init__(self, max_concurrency: int = 100) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self.recent_batches: deque[dict[str, Any]] = deque(maxlen=RECENT_BATCHES)
+        self.stats: dict[str, int] = {
+            "batches": 0,
+            "targets": 0,
+            "requests": 0,
+            "sent": 0,
+            "failed": 0,
+            "env_fallbacks": 0,
+            "visible_sent": 0,
+            "visible_failed": 0,
+        }
+
+    async def send_silent(
+        self,
+        targets: list[SilentPushTarget],
+        payloads: list[dict[str, Any]],
+        *,
+        label: str = "silent",
+    ) -> SilentPushBatchResult:
+        result = SilentPushBatchResult(targets=len(targets))
+        if not targets or not payloads:
+            return result
+        settings = get_settings()
+        jwt_token = _create_jwt_token()
+        if jwt_token is None:
+            result.failed = len(targets)
+            result.failed_tokens = [target.token for target in targets]
+            return result
+
+        templates = [_PayloadTemplate(payload) for payload in payloads]
+        headers_by_platform = {
+            platform: _silent_headers(
+                jwt_token,
+                f"{settings.apns_bundle_id}.watchkitapp" if platform == "watchos" else settings.apns_bundle_id,
+            )
+            for platform in {target.platform for target in targets}
+        }
+        client = _get_http_client()
+        semaphore = self._get_semaphore()
+        histogram = _LatencyHistogram()
+        pending: Iterator[SilentPushTarget] = iter(targets)
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            for target in pending:
+                ok = True
+                sandbox = target.use_sandbox
+                for template in templates:
+                    async with semaphore:
+                        sent_at = time.perf_counter()
+                        outcome = await _post_silent(
+                            client,
+                            target.token,
+                            template.render(target.my_team),
+                            headers_by_platform[target.platform],
+                            sandbox=sandbox,
+                        )
+                        histogram.observe((time.perf_counter() - sent_at) * 1000)
+                    result.requests += outcome.requests
+                    if outcome.ok and outcome.sandbox != sandbox:
+                        # 같은 배치의 다음 이벤트부터는 맞는 환경으로 바로 보낸다.
+                        self.stats["env_fallbacks"] += 1
+                        sandbox = outcome.sandbox
+                        result.environment_changes[target.token] = sandbox
+                    if not outcome.ok:
+                        ok = False
+                        if outcome.invalid_reason is not None:
+                            break  # 해지된 토큰에 남은 이벤트를 보내지 않는다
+                if ok:
+                    result.sent += 1
+                else:
+                    result.failed += 1
+                    result.failed_tokens.append(target.token)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrency, len(targets)))))
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._record_batch(label, result, histogram)
+        return result
+
+    async def send_visible(
+        self,
+        tokens_with_sandbox: list[tuple[str, bool]],
+        *,
+        title: str,
+        body: str,
+        data: dict[str, Any] | None = None,
+        category: str | None = None,
+    ) -> list[str]:
+        """visible push 를 silent 배치와 같은 동시 요청 상한 안에서 전송. 실패 토큰 반환.
+
+        silent 배치처럼 토큰당 task 를 만들지 않고 고정 개수 worker 가 대상 목록을 나눠 소비한다.
+        """
+        if not tokens_with_sandbox:
+            return []
+        semaphore = self._get_semaphore()
+        pending: Iterator[tuple[str, bool]] = iter(tokens_with_sandbox)
+        failed: list[str] = []
+
+        async def worker() -> None:
+            for token, is_sandbox in pending:
+                try:
+                    async with semaphore:
+                        ok = await send_visible_push(
+                            token, title=title, body=body, data=data, use_sandbox=is_sandbox, category=category,
+                        )
+                except Exception:
+                    logger.exception("[APNs-visible] send error token=%s...", token[:16])
+                    ok = False
+                if not ok:
+                    failed.append(token)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrency, len(tokens_with_sandbox)))))
+        self.stats["visible_sent"] += len(tokens_with_sandbox) - len(failed)
+        self.stats["visible_failed"] += len(failed)
+        return failed
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "max_concurrency": self.max_concurrency,
+            "recent_batches": list(self.recent_batches),
+        }
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphore 는 처음 쓰인 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만든다.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _record_batch(self, label: str, result: SilentPushBatchResult, histogram: _LatencyHistogram) -> None:
+        self.stats["batches"] += 1
+        self.stats["targets"] += result.targets
+        self.stats["requests"] += result.requests
+        self.stats["sent"] += result.sent
+        self.stats["failed"] += result.failed
+        summary = {
+            "label": label,
+            "targets": result.targets,
+            "requests": result.requests,
+            "sent": result.sent,
+            "failed": result.failed,
+            "elapsedMs": result.elapsed_ms,
+            "p50Ms": histogram.percentile(0.5),
+            "p99Ms": histogram.percentile(0.99),
+            "histogram": histogram.as_dict(),
+        }
+        self.recent_batches.append(summary)
+        logger.info(
+            "[APNs] batch %s targets=%s sent=%s failed=%s elapsed=%.0fms p50=%s p99=%s",
+            label, result.targets, result.sent, result.failed, result.elapsed_ms, summary["p50Ms"], summary["p99Ms"],
+        )
 
 
 async def send_live_activity_push(
@@ -150,6 +455,7 @@ async def send_live_activity_push(
     *,
     event_type: str = "update",  # "update" or "end"
     timestamp: int | None = None,
+    priority: int = 10,  # 5 는 Apple 의 업데이트 예산을 덜 쓰는 대신 전달이 늦을 수 있음
 ) -> bool:
     """ActivityKit Live Activity push 전송"""
     settings = get_settings()
@@ -166,7 +472,7 @@ async def send_live_activity_push(
         "authorization": f"bearer {jwt_token}",
         "apns-topic": f"{settings.apns_bundle_id}.push-type.liveactivity",
         "apns-push-type": "liveactivity",
-        "apns-priority": "10",
+        "apns-priority": str(priority),
     }
 
     apns_payload = {
@@ -193,6 +499,7 @@ async def send_live_activity_push(
             "[APNs-LA] Push failed: status=%s body=%s token=%s...",
             response.status_code, response.text, push_token[:16],
         )
+        _record_if_invalid(push_token, response.status_code, _response_reason(response.text))
         return False
 
     except Exception:
@@ -257,6 +564,7 @@ async def send_visible_push(
 
     client = _get_http_client()
     environments = [sandbox, not sandbox]
+    first_reason = ""
     for try_sandbox in environments:
         base_url = APNS_SANDBOX_URL if try_sandbox else APNS_PRODUCTION_URL
         url = f"{base_url}/3/device/{device_token}"
@@ -269,17 +577,20 @@ async def send_visible_push(
             if response.status_code == 200:
                 return True
 
-            reason = ""
-            try:
-                reason = json.loads(response.text).get("reason", "")
-            except Exception:
-                pass
-            if reason == "BadEnvironmentKeyInToken" and try_sandbox == sandbox:
+            reason = _response_reason(response.text)
+            if reason in APNS_ENVIRONMENT_RETRY_REASONS and try_sandbox == sandbox:
+                first_reason = reason
                 continue
             logger.warning(
                 "[APNs-visible] send failed status=%s body=%s token=%s... sandbox=%s",
                 response.status_code, response.text, device_token[:16], try_sandbox,
             )
+            _record_if_invalid(
+                device_token,
+                response.status_code,
+                reason,
+                both_environments=first_reason == APNS_BAD_TOKEN_REASON,
+            )
             return False
         except Exception:
             logger.exception("[APNs-visible] request error token=%s...", device_token[:16])
@@ -0,0 +1,140 @@
+"""gzip / brotli 응답 압축 ASGI 미들웨어.
+
+- 클라이언트 Accept-Encoding 에 따라 br(brotli 패키지가 있을 때) > gzip 순으로 고른다.
+- 본문이 minimum_size 이상이고 JSON/텍스트일 때만 압축한다. 작은 응답은 압축 비용이 이득보다 크다.
+- 한 번에 끝나는 응답만 압축하고, 스트리밍(more_body) 응답과 WebSocket 은 그대로 통과시킨다.
+- 압축하면 strong ETag 를 weak 로 바꾼다 (표현이 달라지므로, nginx 와 같은 처리).
+"""
+import gzip
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli as _brotli
+except ModuleNotFoundError:
+    try:
+        import brotlicffi as _brotli
+    except ModuleNotFoundError:
+        _brotli = None
+
+BROTLI_AVAILABLE = _brotli is not None
+DEFAULT_MINIMUM_SIZE = 1024
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+# 미들웨어 인스턴스는 Starlette 가 내부에서 만들므로 통계는 모듈 단위로 모은다.
+compression_stats: dict[str, Any] = {
+    "compressed": 0,
+    "skipped_small": 0,
+    "bytes_in": 0,
+    "bytes_out": 0,
+    "by_encoding": {"br": 0, "gzip": 0},
+}
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    accepted: set[str] = set()
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = max(0, minimum_size)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.stats = compression_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough or start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if message.get("more_body", False) or not self._should_compress(headers, body):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self._compress(encoding, body)
+            self.stats["compressed"] += 1
+            self.stats["bytes_in"] += len(body)
+            self.stats["bytes_out"] += len(compressed)
+            self.stats["by_encoding"][encoding] += 1
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["etag"] = f"W/{etag}"
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, headers: MutableHeaders, body: bytes) -> bool:
+        if "content-encoding" in headers:
+            return False
+        if not headers.get("content-type", "").startswith(_COMPRESSIBLE_TYPES):
+            return False
+        if len(body) < self.minimum_size:
+            self.stats["skipped_small"] += 1
+            return False
+        return True
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return _brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+
+def snapshot_stats() -> dict[str, Any]:
+    bytes_in = compression_stats["bytes_in"]
+    return {
+        **compression_stats,
+        "by_encoding": dict(compression_stats["by_encoding"]),
+        "brotli_available": BROTLI_AVAILABLE,
+        "ratio": round(compression_stats["bytes_out"] / bytes_in, 3) if bytes_in else None,
+    }
@@ -20,7 +20,17 @@ class Settings(BaseSettings):
     db_pool_recycle_sec: int = 1800
     redis_url: str | None = None
     redis_pubsub_channel: str = "basehaptic:live_events"
+    # True: 경기별 채널(<redis_pubsub_channel>:<gameId>)로 publish, 소켓이 있는 경기만 구독.
+    # 공용 채널만 듣는 구버전 인스턴스가 남아 있으면 그쪽 소켓이 멈추므로, 전 인스턴스가 이 버전이 된 뒤에 켠다.
+    redis_pubsub_per_game: bool = False
     instance_id: str | None = None
+    # 읽기 경로 프로세스 메모리 캐시 (Redis 앞단). ingest 시 relay 로 무효화되고, TTL 은 안전망.
+    read_cache_max_entries: int = 2048
+    read_cache_ttl_sec: float = 5.0
+    # 응답 직렬화/압축. fast_json_responses 는 opt-in (orjson 직렬화 + 큰 응답은 미리 직렬화한 bytes).
+    fast_json_responses: bool = False
+    response_compression: bool = True
+    response_compression_min_bytes: int = 1024  # 이보다 작은 응답은 압축하지 않음
     crawler_api_key: str = "dev-crawler-key"
     cors_allow_origins: str = "*"
 
@@ -34,9 +44,18 @@ class Settings(BaseSettings):
     apns_team_id: str = ""
     apns_bundle_id: str = "com.basehaptic.app"
     apns_use_sandbox: bool = False
+    # silent push 배치의 동시 요청 상한 (apns._get_http_client 의 max_connections=200 이하로)
+    apns_max_concurrent_requests: int = 100
+    # 경기별 silent push 합치기. 켜면 window 안에 들어온 이벤트를 push 1번(event_types 목록)으로 보낸다.
+    # event_types 를 읽는 iOS/워치 앱이 충분히 배포되기 전에는 끈다 (구버전은 마지막 event_type 만 재생).
+    push_coalesce_events: bool = False
+    push_coalesce_window_ms: int = 250
+    # 점수 변경이 아닌 Live Activity 업데이트의 경기별 최소 전송 간격
+    live_activity_min_interval_sec: float = 5.0
 
     # FCM (Firebase Cloud Messaging)
     fcm_service_account_json: str | None = None  # Service Account JSON 전체를 문자열로
+    fcm_max_concurrent_requests: int = 50  # HTTP v1 동시 요청 수 (프로세스 전체)
 
     @property
     def cors_origins(self) -> list[str]:
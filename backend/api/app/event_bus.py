@@ -1,17 +1,78 @@
 import asyncio
+import json
 import logging
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from fastapi import WebSocket
 
+try:
+    import orjson
+except ImportError:  # orjson 은 선택 의존성 — 없으면 표준 json 으로 인코딩
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 연결당 전송 대기 프레임 상한. 넘으면 느린 클라이언트로 보고 연결을 끊는다 (재접속 시 재동기화).
+DEFAULT_MAX_PENDING_FRAMES = 64
+# 같은 연결에서 새 프레임이 오면 대기 중인 이전 프레임을 버려도 되는 타입 (최신 값만 의미 있음).
+SUPERSEDABLE_FRAME_TYPES = frozenset({"state", "pong"})
+SLOW_CONSUMER_CLOSE_CODE = 1013  # Try Again Later
+
+
+def encode_message(message: dict[str, Any]) -> str:
+    """WS 텍스트 프레임 인코딩. starlette send_json 과 같은 compact/ensure_ascii=False 출력."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass
+class _OutboundFrame:
+    frame_type: str
+    text: str
+    enqueued_at: float
+    # safe_send 가 전송 완료를 기다릴 때만 있다. 보냈으면 True, 못 보내고 버려지면 False.
+    delivered: asyncio.Future[bool] | None = None
+
+
+def _resolve(frame: _OutboundFrame, ok: bool) -> None:
+    if frame.delivered is not None and not frame.delivered.done():
+        frame.delivered.set_result(ok)
+
+
+class _ConnectionWriter:
+    """연결 1개의 bounded 송신 큐 + writer task. broadcast 는 enqueue 만 하고 기다리지 않는다."""
+
+    def __init__(self, websocket: WebSocket, channel: str | None) -> None:
+        self.websocket = websocket
+        self.channel = channel
+        self.queue: deque[_OutboundFrame] = deque()
+        self.wakeup = asyncio.Event()
+        self.closed = False
+        # True 면 큐에 쌓기만 하고 보내지 않는다 (재접속 replay 를 live 프레임보다 먼저 보내기 위함).
+        self.held = False
+        self.task: asyncio.Task[None] | None = None
+
+    def lag_seconds(self, now: float) -> float:
+        return now - self.queue[0].enqueued_at if self.queue else 0.0
+
 
 class GameEventBus:
-    def __init__(self) -> None:
+    def __init__(self, max_pending_frames: int = DEFAULT_MAX_PENDING_FRAMES) -> None:
+        self.max_pending_frames = max(1, max_pending_frames)
         self._connections: dict[str, set[WebSocket]] = defaultdict(set)
-        self._send_locks: dict[int, asyncio.Lock] = {}
+        self._writers: dict[int, _ConnectionWriter] = {}
         self._lock = asyncio.Lock()
+        # 채널(gameId 등)의 첫 소켓 등록 / 마지막 소켓 해제 시 호출 (Redis per-game 구독 연동).
+        self._on_channel_active: Callable[[str], None] | None = None
+        self._on_channel_idle: Callable[[str], None] | None = None
         self.stats: dict[str, int] = {
             "register": 0,
             "disconnect": 0,
@@ -20,6 +81,9 @@ class GameEventBus:
             "send_ok": 0,
             "send_fail": 0,
             "broadcast_no_targets": 0,
+            "frames_encoded": 0,
+            "frames_superseded": 0,
+            "slow_consumer_evicted": 0,
         }
 
     async def connect(self, websocket: WebSocket) -> bool:
@@ -30,36 +94,61 @@ class GameEventBus:
             logger.info("ws accept aborted (client disconnected during handshake): %s", exc)
             return False
 
-    async def register(self, game_id: str, websocket: WebSocket) -> None:
+    def set_channel_listener(
+        self,
+        on_active: Callable[[str], None] | None,
+        on_idle: Callable[[str], None] | None,
+    ) -> None:
+        self._on_channel_active = on_active
+        self._on_channel_idle = on_idle
+
+    async def register(self, game_id: str, websocket: WebSocket, *, hold: bool = False) -> None:
+        """hold=True 면 `release()` 전까지 이 연결로 오는 broadcast 를 큐에만 쌓는다."""
         async with self._lock:
+            is_new_channel = not self._connections.get(game_id)
             self._connections[game_id].add(websocket)
-            self._send_locks.setdefault(id(websocket), asyncio.Lock())
+            if is_new_channel and self._on_channel_active is not None:
+                self._on_channel_active(game_id)
+            writer = self._writer_for(websocket)
+            writer.channel = game_id
+            writer.held = hold
             self.stats["register"] += 1
 
+    async def release(self, websocket: WebSocket, messages: list[dict]) -> bool:
+        """messages 를 hold 동안 쌓인 프레임보다 앞에 넣고 전송을 시작한다."""
+        writer = self._writers.get(id(websocket))
+        if writer is None or writer.closed:
+            return False
+        now = time.monotonic()
+        frames = [
+            _OutboundFrame(frame_type=str(message.get("type") or ""), text=self._encode(message), enqueued_at=now)
+            for message in messages
+        ]
+        writer.queue.extendleft(reversed(frames))
+        writer.held = False
+        writer.wakeup.set()
+        if len(writer.queue) > self.max_pending_frames:
+            self._evict_slow_consumer(writer)
+            return False
+        return True
+
     async def disconnect(self, game_id: str, websocket: WebSocket) -> None:
         async with self._lock:
-            connections = self._connections.get(game_id)
-            if connections:
-                connections.discard(websocket)
-                if not connections:
-                    self._connections.pop(game_id, None)
-            self._send_locks.pop(id(websocket), None)
+            self._discard(game_id, websocket)
             self.stats["disconnect"] += 1
 
     async def safe_send(self, websocket: WebSocket, message: dict) -> bool:
-        lock = self._send_locks.get(id(websocket))
-        if lock is None:
-            lock = asyncio.Lock()
-            self._send_locks[id(websocket)] = lock
-        async with lock:
-            try:
-                await websocket.send_json(message)
-                self.stats["send_ok"] += 1
-                return True
-            except Exception as exc:
-                self.stats["send_fail"] += 1
-                logger.debug("ws send_json failed (client gone): %s", exc)
-                return False
+        """연결의 송신 큐에 넣고 writer task 가 실제로 보낼 때까지 기다린다.
+
+        보냈으면 True. 등록되지 않았거나 이미 끊긴(evict 포함) 연결이거나, 보내기 전에 버려지면 False.
+        """
+        writer = self._writers.get(id(websocket))
+        if writer is None or writer.closed:
+            return False
+        delivered: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        frame_type = str(message.get("type") or "")
+        self._enqueue(writer, frame_type, self._encode(message), delivered=delivered)
+        return await delivered
 
     async def broadcast(self, game_id: str, message: dict) -> None:
         # Snapshot without holding _lock (accept theoretical read-during-write; Python dict/set iteration copies a view)
@@ -72,28 +161,143 @@ class GameEventBus:
             self.stats["broadcast_no_targets"] += 1
             return
 
-        async def _send(ws: WebSocket) -> WebSocket | None:
-            ok = await self.safe_send(ws, message)
-            return None if ok else ws
+        # 구독자 수와 무관하게 1회만 인코딩하고, 각 연결 큐에 넣기만 한다 (느린 연결이 broadcast 를 막지 않음).
+        frame_type = str(message.get("type") or "")
+        text = self._encode(message)
+        for websocket in targets:
+            # 스냅샷 이후 끊긴 연결은 writer 가 이미 없다 (새로 만들지 않는다).
+            writer = self._writers.get(id(websocket))
+            if writer is not None:
+                self._enqueue(writer, frame_type, text)
+
+    def _writer_for(self, websocket: WebSocket) -> _ConnectionWriter:
+        # register 에서만 만든다. 끊긴 소켓에 writer task 를 다시 띄우지 않도록 전송 경로는 get 만 쓴다.
+        writer = self._writers.get(id(websocket))
+        if writer is None:
+            writer = _ConnectionWriter(websocket, channel=None)
+            writer.task = asyncio.create_task(self._run_writer(writer))
+            self._writers[id(websocket)] = writer
+        return writer
+
+    def _enqueue(
+        self,
+        writer: _ConnectionWriter,
+        frame_type: str,
+        text: str,
+        *,
+        delivered: asyncio.Future[bool] | None = None,
+    ) -> bool:
+        frame = _OutboundFrame(frame_type=frame_type, text=text, enqueued_at=time.monotonic(), delivered=delivered)
+        if writer.closed:
+            _resolve(frame, False)
+            return False
+        if frame_type in SUPERSEDABLE_FRAME_TYPES and writer.queue:
+            kept: deque[_OutboundFrame] = deque()
+            for item in writer.queue:
+                if item.frame_type == frame_type:
+                    _resolve(item, False)
+                    self.stats["frames_superseded"] += 1
+                else:
+                    kept.append(item)
+            writer.queue = kept
+        writer.queue.append(frame)
+        writer.wakeup.set()
+        if len(writer.queue) > self.max_pending_frames:
+            self._evict_slow_consumer(writer)
+            return False
+        return True
+
+    async def _run_writer(self, writer: _ConnectionWriter) -> None:
+        frame: _OutboundFrame | None = None
+        try:
+            while not writer.closed:
+                if writer.held or not writer.queue:
+                    writer.wakeup.clear()
+                    await writer.wakeup.wait()
+                    continue
+                frame = writer.queue.popleft()
+                try:
+                    await writer.websocket.send_text(frame.text)
+                    self.stats["send_ok"] += 1
+                    _resolve(frame, True)
+                except Exception as exc:
+                    self.stats["send_fail"] += 1
+                    _resolve(frame, False)
+                    logger.debug("ws send_text failed (client gone): %s", exc)
+                    await self._drop(writer)
+                    return
+        except asyncio.CancelledError:
+            if frame is not None:
+                _resolve(frame, False)
+        finally:
+            for pending in writer.queue:
+                _resolve(pending, False)
+            writer.queue.clear()
+
+    def _evict_slow_consumer(self, writer: _ConnectionWriter) -> None:
+        self.stats["slow_consumer_evicted"] += 1
+        logger.info(
+            "ws slow consumer evicted channel=%s pending=%s lag=%.1fs",
+            writer.channel,
+            len(writer.queue),
+            writer.lag_seconds(time.monotonic()),
+        )
+        writer.closed = True
+        if writer.task is not None:
+            writer.task.cancel()
+        asyncio.create_task(self._close_evicted(writer))
+
+    async def _close_evicted(self, writer: _ConnectionWriter) -> None:
+        await self._drop(writer)
+        try:
+            await writer.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception as exc:
+            logger.debug("ws close after eviction failed: %s", exc)
+
+    async def _drop(self, writer: _ConnectionWriter) -> None:
+        writer.closed = True
+        async with self._lock:
+            if writer.channel is not None:
+                self._discard(writer.channel, writer.websocket)
+            else:
+                self._writers.pop(id(writer.websocket), None)
 
-        results = await asyncio.gather(*[_send(ws) for ws in targets])
-        stale = [ws for ws in results if ws is not None]
+    def _discard(self, channel: str, websocket: WebSocket) -> None:
+        connections = self._connections.get(channel)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                self._connections.pop(channel, None)
+                if self._on_channel_idle is not None:
+                    self._on_channel_idle(channel)
+        writer = self._writers.pop(id(websocket), None)
+        if writer is not None:
+            writer.closed = True
+            writer.wakeup.set()
 
-        if stale:
-            async with self._lock:
-                connections = self._connections.get(game_id, set())
-                for ws in stale:
-                    connections.discard(ws)
-                    self._send_locks.pop(id(ws), None)
-                if not connections:
-                    self._connections.pop(game_id, None)
+    def _encode(self, message: dict) -> str:
+        self.stats["frames_encoded"] += 1
+        return encode_message(message)
 
-    def snapshot_stats(self) -> dict[str, int | dict[str, int]]:
+    def snapshot_stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        writers = list(self._writers.values())
+        lagging = sorted((w for w in writers if w.queue), key=lambda w: w.lag_seconds(now), reverse=True)
         return {
             **self.stats,
             "connection_games": len(self._connections),
             "connections_total": sum(len(s) for s in self._connections.values()),
-            "send_locks": len(self._send_locks),
+            "writers": len(writers),
+            "queued_frames": sum(len(w.queue) for w in writers),
+            "connections_lagging": len(lagging),
+            "slowest_connections": [
+                {
+                    "channel": w.channel,
+                    "queuedFrames": len(w.queue),
+                    "lagMs": round(w.lag_seconds(now) * 1000),
+                }
+                for w in lagging[:10]
+            ],
         }
 
 
@@ -2,6 +2,10 @@
 
 APNs 와 동일한 인터페이스 (send_visible_push) 를 제공하여
 main.py 에서 platform 분기로 호출한다.
+
+여러 토큰은 httpx 비동기 클라이언트(HTTP/2, 커넥션 풀 1개 재사용)로 HTTP v1 `messages:send` 를 직접 호출한다.
+동시 요청 수는 프로세스 전체에서 `fcm_max_concurrent_requests` 로 제한한다. SDK 의 `send_each_for_multicast` 는
+메시지 수만큼 스레드를 띄우므로 쓰지 않는다. firebase_admin 은 서비스 계정 인증(access token)에만 쓴다.
 """
 from __future__ import annotations
 
@@ -9,20 +13,38 @@ import asyncio
 import json
 import logging
 import threading
+import time
+from datetime import UTC
 from typing import Any
 
+import httpx
+
 from .config import get_settings
+from .push_token_pruning import classify_fcm_error_code, invalid_push_tokens
 
 logger = logging.getLogger(__name__)
 
+FCM_SEND_CHUNK_SIZE = 500  # 한 번에 만드는 전송 코루틴 수 (동시 요청 수는 semaphore 가 제한)
+FCM_HTTP_V1_URL = "https://fcm.googleapis.com/v1/projects/{project_id}/messages:send"
+ANDROID_CHANNEL_ID = "game_alerts"
+
 _app_lock = threading.Lock()
 _initialized = False
 _init_error: str | None = None
+_credential: Any = None
+_project_id: str | None = None
+
+_http_client: httpx.AsyncClient | None = None
+# HTTP v1 동시 요청 상한은 프로세스 전체 기준 (여러 경기 fan-out 이 동시에 돌아도 합쳐서 제한).
+_http_semaphore: asyncio.Semaphore | None = None
+_http_semaphore_loop: asyncio.AbstractEventLoop | None = None
+_access_token: str | None = None
+_access_token_expires: float = 0
 
 
 def _ensure_initialized() -> bool:
     """firebase_admin 앱을 1회 초기화. 환경변수 미설정 시 False 반환."""
-    global _initialized, _init_error
+    global _initialized, _init_error, _credential, _project_id
     if _initialized:
         return True
     if _init_error is not None:
@@ -47,6 +69,8 @@ def _ensure_initialized() -> bool:
             cred = credentials.Certificate(cred_dict)
             if not firebase_admin._apps:
                 firebase_admin.initialize_app(cred)
+            _credential = cred
+            _project_id = cred_dict.get("project_id")
             _initialized = True
             logger.info("[FCM] firebase_admin initialized project=%s", cred_dict.get("project_id"))
             return True
@@ -56,6 +80,27 @@ def _ensure_initialized() -> bool:
             return False
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _http_client
+
+
+def _get_http_semaphore() -> asyncio.Semaphore:
+    # Semaphore 는 처음 쓰인 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만든다.
+    global _http_semaphore, _http_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _http_semaphore is None or _http_semaphore_loop is not loop:
+        _http_semaphore = asyncio.Semaphore(max(1, get_settings().fcm_max_concurrent_requests))
+        _http_semaphore_loop = loop
+    return _http_semaphore
+
+
 async def send_visible_push(
     fcm_token: str,
     *,
@@ -64,33 +109,8 @@ async def send_visible_push(
     data: dict[str, str] | None = None,
 ) -> bool:
     """단일 Android 디바이스에 visible 푸시 전송."""
-    if not _ensure_initialized():
-        return False
-    return await asyncio.to_thread(_send_blocking, fcm_token, title, body, data or {})
-
-
-def _send_blocking(token: str, title: str, body: str, data: dict[str, str]) -> bool:
-    try:
-        from firebase_admin import messaging
-
-        message = messaging.Message(
-            token=token,
-            notification=messaging.Notification(title=title, body=body),
-            data={k: str(v) for k, v in data.items()},
-            android=messaging.AndroidConfig(
-                priority="high",
-                notification=messaging.AndroidNotification(
-                    channel_id="game_alerts",
-                    default_sound=True,
-                ),
-            ),
-        )
-        message_id = messaging.send(message)
-        logger.info("[FCM] sent message_id=%s token=%s...", message_id, token[:16])
-        return True
-    except Exception as exc:
-        logger.warning("[FCM] send failed token=%s... error=%s", token[:16], exc)
-        return False
+    failed = await send_visible_push_to_tokens([fcm_token], title=title, body=body, data=data)
+    return not failed
 
 
 async def send_visible_push_to_tokens(
@@ -100,15 +120,97 @@ async def send_visible_push_to_tokens(
     body: str,
     data: dict[str, str] | None = None,
 ) -> list[str]:
-    """여러 Android 디바이스에 visible push 병렬 전송. 실패 토큰 반환."""
+    """여러 Android 디바이스에 visible push 를 HTTP v1 로 전송. 실패 토큰 반환."""
     if not tokens:
         return []
-    results = await asyncio.gather(
-        *(send_visible_push(t, title=title, body=body, data=data) for t in tokens),
-        return_exceptions=True,
-    )
+    if not _ensure_initialized():
+        return list(tokens)
+
+    str_data = {k: str(v) for k, v in (data or {}).items()}
     failed: list[str] = []
-    for token, result in zip(tokens, results):
-        if isinstance(result, BaseException) or result is False:
-            failed.append(token)
+    for start in range(0, len(tokens), FCM_SEND_CHUNK_SIZE):
+        chunk = tokens[start:start + FCM_SEND_CHUNK_SIZE]
+        chunk_failed = await _send_http_v1(chunk, title=title, body=body, data=str_data)
+        logger.info("[FCM] http v1 sent=%s failed=%s", len(chunk) - len(chunk_failed), len(chunk_failed))
+        failed.extend(chunk_failed)
     return failed
+
+
+async def _send_http_v1(
+    tokens: list[str],
+    *,
+    title: str,
+    body: str,
+    data: dict[str, str],
+) -> list[str]:
+    try:
+        # 만료 직전에만 실제 refresh 가 일어나므로 기본 to_thread 풀로 충분하다.
+        access_token = await asyncio.to_thread(_get_access_token_blocking)
+    except Exception:
+        logger.exception("[FCM] access token refresh failed")
+        return list(tokens)
+
+    url = FCM_HTTP_V1_URL.format(project_id=_project_id)
+    headers = {"authorization": f"Bearer {access_token}", "content-type": "application/json"}
+    base_message = {
+        "notification": {"title": title, "body": body},
+        "data": data,
+        "android": {
+            "priority": "high",
+            "notification": {"channel_id": ANDROID_CHANNEL_ID, "default_sound": True},
+        },
+    }
+    client = _get_http_client()
+    semaphore = _get_http_semaphore()
+
+    async def send_one(token: str) -> bool:
+        content = json.dumps({"message": {**base_message, "token": token}}, ensure_ascii=False)
+        async with semaphore:
+            try:
+                response = await client.post(url, content=content.encode("utf-8"), headers=headers)
+            except Exception as exc:
+                logger.warning("[FCM] http v1 request error token=%s... error=%s", token[:16], exc)
+                return False
+        if response.status_code == 200:
+            return True
+        error_code = _http_v1_error_code(response.text)
+        logger.warning(
+            "[FCM] http v1 send failed status=%s code=%s token=%s...",
+            response.status_code, error_code, token[:16],
+        )
+        invalid_reason = classify_fcm_error_code(error_code)
+        if invalid_reason is not None:
+            invalid_push_tokens.record(token, invalid_reason, source="fcm")
+        return False
+
+    results = await asyncio.gather(*(send_one(token) for token in tokens))
+    return [token for token, ok in zip(tokens, results) if not ok]
+
+
+def _get_access_token_blocking() -> str:
+    # Certificate.get_access_token() 은 호출마다 refresh 하므로 만료 전까지 재사용한다.
+    global _access_token, _access_token_expires
+    now = time.time()
+    if _access_token and now < _access_token_expires:
+        return _access_token
+    info = _credential.get_access_token()
+    expiry = now + 3000
+    if info.expiry is not None:
+        # google-auth 는 tz 없는 UTC datetime 을 돌려준다.
+        expiry_at = info.expiry if info.expiry.tzinfo is not None else info.expiry.replace(tzinfo=UTC)
+        expiry = expiry_at.timestamp()
+    _access_token = info.access_token
+    _access_token_expires = expiry - 60
+    return _access_token
+
+
+def _http_v1_error_code(body: str) -> str:
+    """HTTP v1 오류 응답의 FcmError.errorCode (없으면 error.status)."""
+    try:
+        error = json.loads(body).get("error") or {}
+    except Exception:
+        return ""
+    for detail in error.get("details") or ():
+        if isinstance(detail, dict) and detail.get("errorCode"):
+            return str(detail["errorCode"])
+    return str(error.get("status") or "")
@@ -0,0 +1,146 @@
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_MAX_GAMES = 512
+DEFAULT_MAX_EVENTS_PER_GAME = 200
+
+
+@dataclass
+class _ReplayEntry:
+    # floor 초과 cursor 의 이 경기 이벤트는 빠짐없이 events 에 있다.
+    floor: int
+    epoch: Any
+    events: deque[dict[str, Any]] = field(default_factory=deque)  # cursor 오름차순
+
+    @property
+    def head(self) -> int:
+        return self.events[-1]["cursor"] if self.events else self.floor
+
+
+class GameEventReplayBuffer:
+    """경기별 최근 이벤트 ring buffer. WS `?after=<cursor>` 재접속 replay 용.
+
+    entry 는 "floor 이후 이벤트를 모두 갖고 있다" 는 것이 보장될 때만 만들어진다.
+    - DB 조회 결과로 seed (조회 범위 전체가 잘리지 않았을 때만)
+    - ingest/Redis 로 받은 이벤트 append. cursor 는 전역 증가값이라 배치 첫 cursor - 1 을 floor 로 쓴다.
+      더 작은 cursor 가 늦게 도착하면 그 가정이 깨진 것이라 entry 를 버린다.
+
+    epoch 는 "이 워커가 해당 경기 이벤트를 빠짐없이 받고 있는 구간" 의 식별자다 (Redis 재구독 등으로 바뀜).
+    epoch 가 None 이면 받는 중이 아니므로 아무것도 저장/응답하지 않고, 바뀌면 기존 entry 를 버린다.
+    이벤트 루프에서만 호출한다 (lock 없음).
+    """
+
+    def __init__(
+        self,
+        max_games: int = DEFAULT_MAX_GAMES,
+        max_events_per_game: int = DEFAULT_MAX_EVENTS_PER_GAME,
+    ) -> None:
+        self.max_games = max(1, max_games)
+        self.max_events_per_game = max(1, max_events_per_game)
+        self._entries: OrderedDict[str, _ReplayEntry] = OrderedDict()
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "seeded": 0,
+            "appended": 0,
+            "dropped": 0,
+            "reordered": 0,
+            "late_discards": 0,
+        }
+
+    def replay(self, game_id: str, after: int, *, epoch: Any) -> list[dict[str, Any]] | None:
+        """after 초과 이벤트 목록. 버퍼로 보장할 수 없으면 None (DB 로 조회해야 함)."""
+        entry = self._entry(game_id, epoch)
+        if entry is None or after < entry.floor:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(game_id)
+        self.stats["hits"] += 1
+        return [event for event in entry.events if event["cursor"] > after]
+
+    def seed(self, game_id: str, *, floor: int, events: list[dict[str, Any]], epoch: Any) -> None:
+        """DB 에서 읽은 `cursor > floor` 이벤트 전체(오름차순)를 반영."""
+        if epoch is None:
+            return
+        entry = self._entry(game_id, epoch)
+        seeded = _ReplayEntry(floor=floor, epoch=epoch, events=deque(events))
+        if entry is not None:
+            # 조회하는 동안 append 가 먼저 entry 를 만들었을 수 있다. 두 구간이 이어지면 합치고,
+            # 아니면 더 최신 구간을 남긴다.
+            if seeded.floor <= entry.head and entry.floor <= seeded.head:
+                by_cursor = {event["cursor"]: event for event in seeded.events}
+                by_cursor.update((event["cursor"], event) for event in entry.events)
+                seeded.floor = min(seeded.floor, entry.floor)
+                seeded.events = deque(by_cursor[cursor] for cursor in sorted(by_cursor))
+            elif entry.head > seeded.head:
+                return
+        self.stats["seeded"] += 1
+        self._store(game_id, seeded)
+
+    def append(self, game_id: str, events: list[dict[str, Any]], *, epoch: Any) -> None:
+        """새로 insert 된 이벤트를 반영.
+
+        background broadcast / 워커 간 Redis publish 는 순서가 뒤바뀌어 도착할 수 있다.
+        head 이하라도 floor 초과의 처음 보는 cursor 면 제자리에 끼워 넣고,
+        floor 이하 cursor 가 늦게 오면 "floor 이후 빠짐없음" 을 보장할 수 없으므로 entry 를 버린다 (DB 조회로).
+        """
+        if epoch is None or not events:
+            return
+        events = sorted(events, key=lambda event: event["cursor"])
+        entry = self._entry(game_id, epoch)
+        if entry is None:
+            entry = _ReplayEntry(floor=events[0]["cursor"] - 1, epoch=epoch)
+            self._store(game_id, entry)
+        for event in events:
+            cursor = event["cursor"]
+            if cursor > entry.head:
+                entry.events.append(event)
+                self.stats["appended"] += 1
+                continue
+            if cursor <= entry.floor:
+                self.stats["late_discards"] += 1
+                self.discard(game_id)
+                return
+            index = bisect_left([known["cursor"] for known in entry.events], cursor)
+            if entry.events[index]["cursor"] != cursor:
+                entry.events.insert(index, event)
+                self.stats["appended"] += 1
+                self.stats["reordered"] += 1
+        self._trim(entry)
+        self._entries.move_to_end(game_id)
+
+    def discard(self, game_id: str) -> None:
+        if self._entries.pop(game_id, None) is not None:
+            self.stats["dropped"] += 1
+
+    def snapshot_stats(self) -> dict[str, int]:
+        return {
+            **self.stats,
+            "games": len(self._entries),
+            "events": sum(len(entry.events) for entry in self._entries.values()),
+        }
+
+    def _entry(self, game_id: str, epoch: Any) -> _ReplayEntry | None:
+        entry = self._entries.get(game_id)
+        if entry is None:
+            return None
+        if epoch is None or entry.epoch != epoch:
+            self.discard(game_id)
+            return None
+        return entry
+
+    def _store(self, game_id: str, entry: _ReplayEntry) -> None:
+        self._trim(entry)
+        self._entries[game_id] = entry
+        self._entries.move_to_end(game_id)
+        while len(self._entries) > self.max_games:
+            self._entries.popitem(last=False)
+
+    def _trim(self, entry: _ReplayEntry) -> None:
+        while len(entry.events) > self.max_events_per_game:
+            entry.floor = entry.events.popleft()["cursor"]
+
+
+game_event_replay = GameEventReplayBuffer()
@@ -0,0 +1,160 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .models import GameEvent, GamePitcherStat
+from .schemas import EventType
+
+DEFAULT_MAX_GAMES = 512
+
+
+@dataclass
+class GameStateProjection:
+    """build_game_state 가 games row 외에 필요로 하는 파생 값.
+
+    version 은 이 값이 반영된 시점의 games.updated_at. 다른 워커가 같은 경기를 ingest 하면
+    updated_at 이 달라지므로 읽는 쪽에서 불일치를 감지해 DB 에서 다시 만든다.
+    """
+
+    version: datetime | None
+    last_event_cursor: int | None = None
+    last_event_source_id: str | None = None
+    last_event_type: str | None = None
+    last_event_at: datetime | None = None
+    # player_name -> 가장 최근 등판(appearance_order 최대) 의 pitches_thrown
+    pitch_counts: dict[str, int | None] = field(default_factory=dict)
+
+
+def pitch_counts_from_rows(rows: list[tuple[str, int | None, int | None]]) -> dict[str, int | None]:
+    """(player_name, appearance_order, pitches_thrown) 목록 → 이름별 최근 등판 투구수.
+
+    DB 조회의 `ORDER BY appearance_order DESC NULLS LAST` 와 같은 우선순위를 따른다.
+    """
+    best: dict[str, tuple[int, int | None]] = {}
+    for player_name, appearance_order, pitches_thrown in rows:
+        rank = appearance_order if appearance_order is not None else -1
+        current = best.get(player_name)
+        if current is None or rank > current[0]:
+            best[player_name] = (rank, pitches_thrown)
+    return {name: pitches for name, (_, pitches) in best.items()}
+
+
+def _version_key(version: datetime | None) -> datetime | None:
+    # SQLite 는 tz 정보 없이 돌려주므로 ingest 직후(in-memory, aware)와 재조회 값을 같게 비교한다.
+    if version is None:
+        return None
+    if version.tzinfo is None:
+        return version.replace(tzinfo=UTC)
+    return version.astimezone(UTC)
+
+
+class GameStateProjectionStore:
+    """경기별 GameStateProjection 의 프로세스 메모리 저장소 (LRU).
+
+    - ingest: `apply_ingest` 로 insert 된 이벤트/투수 기록을 증분 반영 (쿼리 없음)
+    - 조회: `get` 이 version 불일치/미보유면 None → `load` 가 game_events/game_pitcher_stats 에서 재구성
+    """
+
+    def __init__(self, max_games: int = DEFAULT_MAX_GAMES) -> None:
+        self.max_games = max(1, max_games)
+        self._entries: OrderedDict[str, GameStateProjection] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "loads": 0,
+            "applied": 0,
+            "invalidated": 0,
+        }
+
+    def get(self, game_id: str, version: datetime | None) -> GameStateProjection | None:
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None or entry.version != _version_key(version):
+                return None
+            self._entries.move_to_end(game_id)
+            self.stats["hits"] += 1
+            return entry
+
+    def load(self, db: Session, game_id: str, version: datetime | None) -> GameStateProjection:
+        latest_event = db.execute(
+            select(GameEvent.cursor, GameEvent.source_event_id, GameEvent.event_type, GameEvent.event_time)
+            .where(GameEvent.game_id == game_id)
+            .order_by(GameEvent.cursor.desc())
+            .limit(1)
+        ).first()
+        pitcher_rows = db.execute(
+            select(GamePitcherStat.player_name, GamePitcherStat.appearance_order, GamePitcherStat.pitches_thrown)
+            .where(GamePitcherStat.game_id == game_id)
+        ).all()
+
+        entry = GameStateProjection(version=_version_key(version), pitch_counts=pitch_counts_from_rows(pitcher_rows))
+        if latest_event is not None:
+            entry.last_event_cursor, entry.last_event_source_id, entry.last_event_type, entry.last_event_at = latest_event
+        with self._lock:
+            self.stats["loads"] += 1
+            self._store(game_id, entry)
+        return entry
+
+    def apply_ingest(
+        self,
+        game_id: str,
+        *,
+        previous_version: datetime | None,
+        version: datetime | None,
+        inserted_events: list[GameEvent],
+        event_types: dict[str, str],
+        pitch_counts: dict[str, int | None] | None,
+    ) -> None:
+        """한 번의 snapshot ingest 결과를 반영.
+
+        inserted_events 는 cursor 오름차순, event_types 는 이번 스냅샷의 sourceEventId → 정규화된 type
+        (중복 이벤트의 OTHER → 구체 type backfill 반영용), pitch_counts 는 pitcherStats 가 온 경우에만.
+        projection 이 ingest 직전 상태(previous_version)가 아니면 증분 반영이 불가능하므로 버린다.
+        """
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                return
+            if entry.version != _version_key(previous_version):
+                self._entries.pop(game_id, None)
+                self.stats["invalidated"] += 1
+                return
+
+            if inserted_events:
+                latest = inserted_events[-1]
+                if entry.last_event_cursor is None or latest.cursor > entry.last_event_cursor:
+                    entry.last_event_cursor = latest.cursor
+                    entry.last_event_source_id = latest.source_event_id
+                    entry.last_event_type = latest.event_type
+                    entry.last_event_at = latest.event_time
+            upgraded_type = event_types.get(entry.last_event_source_id or "")
+            other = EventType.OTHER.value
+            if entry.last_event_type == other and upgraded_type and upgraded_type != other:
+                entry.last_event_type = upgraded_type
+            if pitch_counts is not None:
+                entry.pitch_counts = pitch_counts
+            entry.version = _version_key(version)
+            self._entries.move_to_end(game_id)
+            self.stats["applied"] += 1
+
+    def invalidate(self, game_id: str) -> None:
+        with self._lock:
+            if self._entries.pop(game_id, None) is not None:
+                self.stats["invalidated"] += 1
+
+    def snapshot_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self.stats, "games": len(self._entries)}
+
+    def _store(self, game_id: str, entry: GameStateProjection) -> None:
+        self._entries[game_id] = entry
+        self._entries.move_to_end(game_id)
+        while len(self._entries) > self.max_games:
+            self._entries.popitem(last=False)
+
+
+game_state_projections = GameStateProjectionStore()
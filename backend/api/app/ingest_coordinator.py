@@ -0,0 +1,197 @@
+import logging
+import random
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock(int4, int4) 의 첫 번째 키. init_db 의 단일 키 락과 공간을 분리한다.
+INGEST_LOCK_NAMESPACE = "basehaptic_snapshot_ingest"
+
+
+@dataclass
+class PendingSnapshot:
+    payload: Any
+    done: bool = False
+    result: Any = None
+
+
+@dataclass
+class _GameLockEntry:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    holders: int = 0  # 대기 중 + 보유 중인 요청 수. 0 이 되면 entry 를 제거한다.
+    pending: list[PendingSnapshot] = field(default_factory=list)
+
+
+@dataclass
+class SnapshotClaim:
+    """`claim()` 으로 락을 잡은 요청의 몫.
+
+    batch 는 이 요청이 한 번에 써야 할 대기 스냅샷들(자기 것 포함, 도착 순서).
+    비어 있으면 앞선 writer 가 이미 병합해 썼으므로 ticket.result 를 그대로 쓰면 된다.
+    """
+
+    ticket: PendingSnapshot
+    batch: list[PendingSnapshot]
+    resolved: bool = False
+
+    @property
+    def absorbed(self) -> bool:
+        return not self.batch
+
+    @property
+    def payloads(self) -> list[Any]:
+        return [item.payload for item in self.batch]
+
+    def resolve(self, result: Any) -> None:
+        for item in self.batch:
+            item.result = result
+            item.done = True
+        self.resolved = True
+
+
+class SnapshotIngestCoordinator:
+    """gameId 단위 snapshot ingest 직렬화.
+
+    - 워커 내부: gameId 별 threading.Lock. 대기/보유 요청이 없으면 즉시 제거되어 누적되지 않는다.
+    - 워커 간(PostgreSQL): 트랜잭션 시작 시 gameId advisory xact lock 을 잡아, 같은 경기의
+      writer 는 row lock timeout 대신 DB 의 advisory lock 큐에서 순서대로 대기한다.
+      commit/rollback 시 자동 해제된다.
+    - advisory lock 이 없는(SQLite) 경우 lock timeout 재시도는 jitter 를 섞은 backoff 후에 한다.
+      같은 경기를 기다리던 writer 들이 동시에 타임아웃되어 곧바로 다시 몰리지 않게 하기 위함.
+    - stats 는 여러 요청 스레드가 함께 갱신하므로 항상 _guard 아래에서만 바꾼다.
+    """
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[str, _GameLockEntry] = {}
+        self._rng = rng or random.Random()
+        self.stats: dict[str, int] = {
+            "acquired": 0,
+            "contended": 0,
+            "evicted": 0,
+            "advisory_locks": 0,
+            "coalesced": 0,
+            "retry_backoffs": 0,
+        }
+
+    @contextmanager
+    def hold(self, game_ids: Iterable[str]) -> Iterator[None]:
+        # 데드락 방지를 위해 항상 gameId 정렬 순서로 잡는다.
+        ordered = sorted(set(game_ids))
+        checked_out: list[str] = []
+        acquired: list[str] = []
+        try:
+            for game_id in ordered:
+                entry = self._checkout(game_id)
+                checked_out.append(game_id)
+                if not entry.lock.acquire(blocking=False):
+                    self._count("contended")
+                    entry.lock.acquire()
+                acquired.append(game_id)
+                self._count("acquired")
+            yield
+        finally:
+            for game_id in reversed(acquired):
+                self._locks[game_id].lock.release()
+            for game_id in checked_out:
+                self._checkin(game_id)
+
+    @contextmanager
+    def claim(self, game_id: str, payload: Any) -> Iterator[SnapshotClaim]:
+        """latest-wins coalescing 용 단건 락.
+
+        요청은 먼저 대기열에 스냅샷을 올리고 락을 기다린다. 락을 잡은 요청이 그 시점까지 쌓인
+        스냅샷을 모두 가져가 한 번에 쓰므로, 뒤에 기다리던 요청은 자기 차례에 할 일이 없다.
+        쓰기가 실패하면 함께 가져갔던 다른 요청의 스냅샷은 대기열 앞에 되돌린다.
+        """
+        entry = self._checkout(game_id)
+        ticket = PendingSnapshot(payload=payload)
+        with self._guard:
+            entry.pending.append(ticket)
+        try:
+            if not entry.lock.acquire(blocking=False):
+                self._count("contended")
+                entry.lock.acquire()
+            with self._guard:
+                self.stats["acquired"] += 1
+                batch: list[PendingSnapshot] = []
+                if not ticket.done:
+                    batch, entry.pending = entry.pending, []
+            claim = SnapshotClaim(ticket=ticket, batch=batch)
+            try:
+                yield claim
+            finally:
+                if claim.resolved:
+                    self._count("coalesced", max(0, len(batch) - 1))
+                elif batch:
+                    with self._guard:
+                        entry.pending[:0] = [item for item in batch if item is not ticket]
+                entry.lock.release()
+        finally:
+            self._checkin(game_id)
+
+    def lock_transaction(self, db: Session, game_ids: Iterable[str]) -> bool:
+        """현재 트랜잭션에 gameId advisory lock 을 건다. PostgreSQL 이 아니면 no-op(False)."""
+        if not self.uses_advisory_lock(db):
+            return False
+        for game_id in sorted(set(game_ids)):
+            db.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:namespace), hashtext(:game_id))"),
+                {"namespace": INGEST_LOCK_NAMESPACE, "game_id": game_id},
+            )
+            self._count("advisory_locks")
+        return True
+
+    def retry_delay(self, base_delay: float) -> float:
+        """lock timeout 재시도 전 대기 시간. base_delay 의 절반 ~ 전체 사이에서 고른다(equal jitter).
+
+        하한을 두어 DB 에 바로 다시 부딪히는 busy retry 를 막고, 나머지 절반을 흩어
+        같은 경기 writer 들의 재시도 시점이 겹치지 않게 한다.
+        """
+        half = max(0.0, base_delay) / 2
+        with self._guard:
+            delay = half + self._rng.uniform(0.0, half)
+            self.stats["retry_backoffs"] += 1
+        return delay
+
+    @staticmethod
+    def uses_advisory_lock(db: Session) -> bool:
+        bind = db.get_bind()
+        return bind is not None and bind.dialect.name == "postgresql"
+
+    def snapshot_stats(self) -> dict[str, int]:
+        with self._guard:
+            return {**self.stats, "active_games": len(self._locks)}
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._guard:
+            self.stats[key] += amount
+
+    def _checkout(self, game_id: str) -> _GameLockEntry:
+        with self._guard:
+            entry = self._locks.get(game_id)
+            if entry is None:
+                entry = _GameLockEntry()
+                self._locks[game_id] = entry
+            entry.holders += 1
+            return entry
+
+    def _checkin(self, game_id: str) -> None:
+        with self._guard:
+            entry = self._locks.get(game_id)
+            if entry is None:
+                return
+            entry.holders -= 1
+            if entry.holders <= 0:
+                self._locks.pop(game_id, None)
+                self.stats["evicted"] += 1
+
+
+ingest_coordinator = SnapshotIngestCoordinator()
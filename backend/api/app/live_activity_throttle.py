@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_INTERVAL_SEC = 5.0
+DEFAULT_MAX_GAMES = 512
+PRIORITY_IMMEDIATE = 10
+PRIORITY_BUDGETED = 5
+
+SendFn = Callable[[str, dict[str, Any], str, int], Awaitable[None]]
+
+
+@dataclass
+class _GameEntry:
+    last_sent: dict[str, Any] | None = None
+    last_sent_at: float = 0.0
+    pending: dict[str, Any] | None = None  # rate limit 로 미뤄 둔 최신 content_state
+    waiting: bool = False
+
+
+class LiveActivityThrottle:
+    """경기별 Live Activity content_state diff + rate limit.
+
+    content_state 는 경기의 모든 토큰에 같으므로 경기 단위로 판단한다.
+    - 직전에 보낸 content_state 와 같으면 보내지 않는다 (observedAt 만 바뀐 snapshot 등).
+    - 점수가 바뀌면 바로 priority 10 으로 보낸다.
+    - 그 외 변경은 priority 5 이고, 경기별 min_interval 안이면 미뤘다가 구간 끝에 최신 상태 1번만 보낸다.
+    - `end` 는 항상 바로 보내고 경기 상태를 지운다.
+    미룬 상태의 대기/전송은 이 객체가 들고 있는 task 에서 하고 submit 은 바로 반환한다. 호출자는 ingest 요청의
+    BackgroundTasks 라서, 여기서 기다리면 같은 요청의 다른 경기 broadcast/push 까지 interval 만큼 밀린다.
+    lifespan 종료 시 `close()` 가 남은 대기를 깨워 미룬 상태를 바로 보내고 기다린다.
+    이벤트 루프에서만 호출한다 (lock 없음).
+    """
+
+    def __init__(
+        self,
+        send: SendFn,
+        *,
+        min_interval_sec: float = DEFAULT_MIN_INTERVAL_SEC,
+        max_games: int = DEFAULT_MAX_GAMES,
+    ) -> None:
+        self._send = send
+        self.min_interval_sec = max(0.0, min_interval_sec)
+        self.max_games = max(1, max_games)
+        self._games: OrderedDict[str, _GameEntry] = OrderedDict()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closing: asyncio.Event | None = None
+        self.stats: dict[str, int] = {
+            "submits": 0,
+            "sent_immediate": 0,
+            "sent_budgeted": 0,
+            "sent_trailing": 0,
+            "sent_end": 0,
+            "skipped_unchanged": 0,
+            "deferred": 0,
+            "send_errors": 0,
+        }
+
+    async def submit(self, game_id: str, content_state: dict[str, Any], event_type: str = "update") -> None:
+        self.stats["submits"] += 1
+        if event_type == "end":
+            self._games.pop(game_id, None)
+            self.stats["sent_end"] += 1
+            await self._deliver(game_id, content_state, event_type, PRIORITY_IMMEDIATE)
+            return
+
+        entry = self._entry(game_id)
+        if content_state == (entry.pending or entry.last_sent):
+            self.stats["skipped_unchanged"] += 1
+            return
+
+        if _score_changed(entry.last_sent, content_state):
+            entry.pending = None
+            self.stats["sent_immediate"] += 1
+            await self._send_now(game_id, entry, content_state, PRIORITY_IMMEDIATE)
+            return
+
+        wait_sec = entry.last_sent_at + self.min_interval_sec - time.monotonic()
+        if wait_sec <= 0 and not entry.waiting:
+            self.stats["sent_budgeted"] += 1
+            await self._send_now(game_id, entry, content_state, PRIORITY_BUDGETED)
+            return
+
+        entry.pending = content_state
+        self.stats["deferred"] += 1
+        if entry.waiting:
+            return
+        entry.waiting = True
+        if self._closing is None:
+            self._closing = asyncio.Event()
+        task = asyncio.create_task(self._send_trailing(game_id, entry, max(0.0, wait_sec), self._closing))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """대기 중인 trailing 전송을 interval 끝까지 기다리지 않고 바로 보내고, 끝날 때까지 기다린다."""
+        if self._closing is not None:
+            self._closing.set()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Event 는 처음 쓰인 이벤트 루프에 묶이므로 다음 submit 에서 새로 만든다.
+        self._closing = None
+
+    async def _send_trailing(self, game_id: str, entry: _GameEntry, wait_sec: float, closing: asyncio.Event) -> None:
+        try:
+            if wait_sec > 0:
+                try:
+                    await asyncio.wait_for(closing.wait(), timeout=wait_sec)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            entry.waiting = False
+        # 기다리는 사이 점수 변경/end 로 이미 보냈거나 경기 상태가 지워졌으면 pending 이 없다.
+        if self._games.get(game_id) is not entry or entry.pending is None:
+            return
+        pending, entry.pending = entry.pending, None
+        if pending == entry.last_sent:
+            self.stats["skipped_unchanged"] += 1
+            return
+        self.stats["sent_trailing"] += 1
+        await self._send_now(game_id, entry, pending, PRIORITY_BUDGETED)
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "games": len(self._games),
+            "pending_games": sum(1 for entry in self._games.values() if entry.pending is not None),
+            "inflight_tasks": len(self._tasks),
+            "min_interval_sec": self.min_interval_sec,
+        }
+
+    async def _send_now(self, game_id: str, entry: _GameEntry, content_state: dict[str, Any], priority: int) -> None:
+        # 보내기 전에 기록해 두어야 전송 중 들어온 같은 상태를 다시 보내지 않는다.
+        entry.last_sent = content_state
+        entry.last_sent_at = time.monotonic()
+        await self._deliver(game_id, content_state, "update", priority)
+
+    async def _deliver(self, game_id: str, content_state: dict[str, Any], event_type: str, priority: int) -> None:
+        try:
+            await self._send(game_id, content_state, event_type, priority)
+        except Exception:
+            self.stats["send_errors"] += 1
+            logger.exception("live activity send failed game_id=%s event=%s", game_id, event_type)
+
+    def _entry(self, game_id: str) -> _GameEntry:
+        entry = self._games.get(game_id)
+        if entry is None:
+            entry = _GameEntry()
+            self._games[game_id] = entry
+            while len(self._games) > self.max_games:
+                self._games.popitem(last=False)
+        self._games.move_to_end(game_id)
+        return entry
+
+
+def _score_changed(previous: dict[str, Any] | None, current: dict[str, Any]) -> bool:
+    if previous is None:
+        return False
+    return (
+        previous.get("homeScore") != current.get("homeScore")
+        or previous.get("awayScore") != current.get("awayScore")
+    )
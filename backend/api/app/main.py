@@ -1,28 +1,49 @@
 from contextlib import asynccontextmanager
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from typing import Annotated, Any
 import asyncio
+import base64
 import hashlib
+import json
 import httpx
 import jwt
 import logging
 import secrets
 import time
-import threading
 
-from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy import and_, delete, or_, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
+from .compression import CompressionMiddleware
+from .compression import snapshot_stats as compression_snapshot_stats
 from .config import get_settings
 from .cheer_signals import build_cheer_signals, stadium_payloads
 from .db import SessionLocal, get_db, init_db
 from .event_bus import event_bus
+from .game_event_replay import game_event_replay
+from .game_state_projection import game_state_projections
+from .ingest_coordinator import ingest_coordinator
+from .live_activity_throttle import LiveActivityThrottle
+from .push_coalescer import GamePushCoalescer
+from .push_token_pruning import invalid_push_tokens
 from .models import (
     CheerEvent,
     DeviceToken,
@@ -33,15 +54,19 @@ from .models import (
     TeamCheckinSeason,
     TeamSubscriptionToken,
 )
+from .read_cache import SingleFlight, TwoTierCache
 from .redis_bus import RedisBroadcastRelay
+from .responses import default_response_class, prerendered
 from .apns import (
+    ApnsDispatcher,
+    SilentPushTarget,
     send_live_activity_push,
-    send_push,
     send_push_to_tokens,
-    send_visible_push_to_tokens as send_apns_visible_push_to_tokens,
 )
 from .fcm import send_visible_push_to_tokens as send_fcm_visible_push_to_tokens
 from .schemas import (
+    CrawlerSnapshotBatchRequest,
+    CrawlerSnapshotBatchResult,
     CrawlerSnapshotRequest,
     CrawlerTeamRecordRequest,
     DeviceTokenRequest,
@@ -59,7 +84,9 @@ from .services import (
     build_game_state,
     get_team_record,
     insert_events,
+    merge_snapshots,
     normalize_status,
+    record_snapshot_projection,
     sync_snapshot_details,
     to_team_record_out,
     to_event_out,
@@ -77,14 +104,24 @@ logging.basicConfig(
     force=True,
 )
 logger = logging.getLogger(__name__)
-_snapshot_ingest_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
-
 SNAPSHOT_INGEST_RETRY_DELAYS_SECONDS = (0.2, 0.5, 1.0)
+WS_INITIAL_EVENTS = 20
+WS_REPLAY_MAX_EVENTS = 500
+WS_REPLAY_FRAME_EVENTS = 100
 redis_relay = RedisBroadcastRelay(
     redis_url=settings.redis_url,
     channel=settings.redis_pubsub_channel,
     source_instance_id=settings.instance_id,
+    per_game_channels=settings.redis_pubsub_per_game,
 )
+event_bus.set_channel_listener(redis_relay.watch, redis_relay.unwatch)
+read_cache = TwoTierCache(
+    redis_relay,
+    max_entries=settings.read_cache_max_entries,
+    ttl_sec=settings.read_cache_ttl_sec,
+)
+_game_initial_loads = SingleFlight()  # WS on-connect 초기 데이터 조회 (gameId 단위)
+apns_dispatcher = ApnsDispatcher(max_concurrency=settings.apns_max_concurrent_requests)
 
 
 def _is_snapshot_lock_timeout(exc: DBAPIError) -> bool:
@@ -124,21 +161,62 @@ async def _broadcast_live_message(game_id: str, message: dict[str, Any]) -> None
 
 
 async def _on_redis_live_message(game_id: str, message: dict[str, Any]) -> None:
+    if read_cache.handle_relay_message(message):
+        return
+    if message.get("type") == "events":
+        _remember_game_events(game_id, (message.get("payload") or {}).get("items") or [])
     await event_bus.broadcast(game_id, message)
 
 
+async def _broadcast_game_events(game_id: str, items: list[dict[str, Any]]) -> None:
+    _remember_game_events(game_id, items)
+    await _broadcast_live_message(game_id, {"type": "events", "payload": {"items": items}})
+
+
+def _replay_epoch(game_id: str) -> Any:
+    # Redis 미사용(단일 인스턴스)이면 모든 이벤트가 이 워커의 ingest 로만 들어오므로 항상 유효.
+    if not redis_relay.enabled:
+        return 0
+    return redis_relay.channel_epoch(game_id)
+
+
+def _remember_game_events(game_id: str, items: list[Any]) -> None:
+    events = [item for item in items if isinstance(item, dict) and isinstance(item.get("cursor"), int)]
+    events.sort(key=lambda item: item["cursor"])
+    game_event_replay.append(game_id, events, epoch=_replay_epoch(game_id))
+
+
+_GAME_STATE_CACHE_KEY = "game:state:{game_id}"
+# Redis list (이벤트 1개 = JSON 원소 1개). 예전 JSON blob 키(game:events:*)와 타입이 달라 이름을 바꿨다.
+_GAME_EVENTS_CACHE_KEY = "game:recent-events:{game_id}"
+_GAME_LIST_CACHE_PREFIX = "games:"  # 로컬 캐시 전용 (조회 조건 조합이 많아 Redis 에 두지 않음)
+_TEAM_RECORD_CACHE_TTL_SEC = 3600
+
+
 async def _cache_game_data(
     game_id: str,
     state_payload: dict[str, Any],
     new_events_payload: list[dict[str, Any]],
 ) -> None:
-    await redis_relay.set_cache(f"game:state:{game_id}", state_payload)
-    if new_events_payload:
-        # Merge new events into existing cache (keep latest 20)
-        existing = await redis_relay.get_cache(f"game:events:{game_id}")
-        existing_items = (existing.get("items") if existing else None) or []
-        merged = existing_items + new_events_payload
-        await redis_relay.set_cache(f"game:events:{game_id}", {"items": merged[-20:]})
+    state_key = _GAME_STATE_CACHE_KEY.format(game_id=game_id)
+    # state SET + 최근 이벤트 리스트 RPUSH/LTRIM/EXPIRE 를 한 파이프라인으로 (read-modify-write 없음)
+    await redis_relay.set_cache_with_list(
+        state_key,
+        state_payload,
+        list_key=_GAME_EVENTS_CACHE_KEY.format(game_id=game_id),
+        items=new_events_payload,
+        max_items=WS_INITIAL_EVENTS,
+    )
+    # Redis 에 쓴 뒤에 무효화해야 다른 워커가 옛 값을 다시 읽어 로컬에 담지 않는다.
+    await read_cache.invalidate(keys=[state_key], prefixes=[_GAME_LIST_CACHE_PREFIX])
+    read_cache.set_local(state_key, state_payload)
+    _game_initial_loads.discard([game_id])
+
+
+async def _cache_team_record_messages(messages: dict[str, dict[str, Any]]) -> None:
+    for cache_key, message in messages.items():
+        await redis_relay.set_cache(cache_key, message, ttl_sec=_TEAM_RECORD_CACHE_TTL_SEC)
+    await read_cache.invalidate(keys=list(messages))
 
 
 def _team_record_channel(*, category_id: str, season_code: str, team_id: str) -> str:
@@ -162,10 +240,14 @@ async def lifespan(_: FastAPI):
     try:
         yield
     finally:
+        await push_coalescer.close()
+        await live_activity_throttle.close()
         await redis_relay.stop()
 
 
-app = FastAPI(title=settings.app_name, lifespan=lifespan)
+app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=default_response_class())
+if settings.response_compression:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.response_compression_min_bytes)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -223,6 +305,8 @@ async def health_verbose() -> dict[str, Any]:
         "service": "backend-api",
         "environment": settings.environment,
         "redis": redis_detail if not redis_connected else "connected",
+        "read_cache": read_cache.snapshot_stats(),
+        "response_compression": compression_snapshot_stats(),
         "time": datetime.now(UTC),
     }
 
@@ -237,34 +321,145 @@ async def debug_relay_stats() -> dict[str, Any]:
         "source_instance_id": redis_relay._source_instance_id,
         "redis_subscribed_at": redis_relay.subscribed_at,
         "redis_stats": dict(redis_relay.stats),
+        "redis_subscribed_channels": redis_relay.subscribed_channels,
         "event_bus_stats": event_bus.snapshot_stats(),
+        "ingest_coordinator_stats": ingest_coordinator.snapshot_stats(),
+        "game_state_projection_stats": game_state_projections.snapshot_stats(),
+        "game_event_replay_stats": game_event_replay.snapshot_stats(),
+        "ws_initial_load_stats": {**_game_initial_loads.stats, "inflight": _game_initial_loads.inflight},
+        "apns_dispatcher_stats": apns_dispatcher.snapshot_stats(),
+        "push_token_pruning_stats": invalid_push_tokens.snapshot_stats(),
+        "push_coalescer_stats": push_coalescer.snapshot_stats(),
+        "live_activity_throttle_stats": live_activity_throttle.snapshot_stats(),
     }
 
 
 @app.get("/games", response_model=list[GameSummaryOut])
-def list_games(
+async def list_games(
+    request: Request,
+    response: Response,
     status: GameStatus | None = None,
     game_date: date | None = Query(default=None, alias="date"),
     limit: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db),
-) -> list[GameSummaryOut]:
+    cursor: str | None = None,
+) -> Any:
+    """경기 목록 ((gameDate, id) 내림차순, keyset 페이지네이션).
+
+    다음 페이지 cursor 는 `X-Next-Cursor` 헤더로 준다. 페이지마다 strong ETag 를 붙이고
+    `If-None-Match` 가 맞으면 304 로 응답한다. 목록은 ingest 때 무효화되는 로컬 캐시에서 읽는다.
+    """
+    try:
+        after = _decode_game_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor") from None
+
+    if game_date is not None:
+        # 하루 경기는 몇 개뿐이라 날짜별 전체 목록을 캐시해 두고 상태 필터/페이지는 메모리에서 자른다.
+        rows = await read_cache.get_or_load(
+            f"{_GAME_LIST_CACHE_PREFIX}date:{game_date.isoformat()}",
+            lambda: asyncio.to_thread(_load_game_summaries, None, game_date, None),
+            use_redis=False,
+        )
+        if status is not None:
+            rows = [row for row in rows if row["summary"]["status"] == status.value]
+        if after is not None:
+            rows = [row for row in rows if tuple(row["key"]) < after]
+        page = _game_list_page(rows, limit)
+    else:
+        status_key = status.value if status is not None else ""
+        page = await read_cache.get_or_load(
+            f"{_GAME_LIST_CACHE_PREFIX}page:{status_key}:{limit}:{cursor or ''}",
+            lambda: asyncio.to_thread(
+                lambda: _game_list_page(_load_game_summaries(status, None, limit + 1, after), limit)
+            ),
+            use_redis=False,
+        )
+
+    headers = {"ETag": page["etag"], "Cache-Control": "no-cache"}
+    if page["nextCursor"]:
+        headers["X-Next-Cursor"] = page["nextCursor"]
+    if _etag_matches(request.headers.get("if-none-match"), page["etag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return page["items"]
+
+
+def _encode_game_cursor(game_date: str, game_id: str) -> str:
+    raw = json.dumps([game_date, game_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_game_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        game_date, game_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if game_date:
+            date.fromisoformat(game_date)
+        return str(game_date), str(game_id)
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+def _game_list_page(rows: list[dict[str, Any]], limit: int) -> dict[str, Any]:
+    """정렬된 row 목록에서 한 페이지. ETag 는 페이지의 최신 updated_at + (id, updated_at) 목록 digest."""
+    page_rows = rows[:limit]
+    versions = [[row["key"][1], row["updated_at"]] for row in page_rows]
+    latest = max((updated_at for _, updated_at in versions), default="")
+    digest = hashlib.sha1(json.dumps(versions, separators=(",", ":")).encode("utf-8")).hexdigest()[:16]
+    return {
+        "items": [row["summary"] for row in page_rows],
+        "nextCursor": _encode_game_cursor(*page_rows[-1]["key"]) if len(rows) > limit else None,
+        "etag": f'"{"".join(ch for ch in latest if ch.isdigit()) or "0"}-{digest}"',
+    }
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _load_game_summaries(
+    status: GameStatus | None,
+    game_date: date | None,
+    limit: int | None,
+    after: tuple[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """(game_date, id) 내림차순 row 목록. row = {"key": [game_date, id], "updated_at": ..., "summary": ...}
+
+    updated_at 은 live ingest 마다 바뀌어 페이지를 넘기는 사이 경기가 페이지 사이를 옮겨 다니므로,
+    cursor 는 바뀌지 않는 (game_date, id) 로 건다. game_date 가 없는 경기는 "" 로 보아 맨 뒤에 온다.
+    """
+    sort_date = func.coalesce(Game.game_date, "")
     query = select(Game)
     if status is not None:
         query = query.where(Game.status == status.value)
-    if game_date is not None:
-        iso_date = game_date.isoformat()
-        prefix = game_date.strftime("%Y%m%d")
+    if after is not None:
+        after_date, after_id = after
         query = query.where(
             or_(
-                Game.game_date == iso_date,
-                and_(Game.game_date.is_(None), Game.id.like(f"{prefix}%")),
+                sort_date < after_date,
+                and_(sort_date == after_date, Game.id < after_id),
             )
         )
+    if game_date is not None:
+        # game_date 는 근거가 있으면 upsert 시 채워진다 (services.resolve_game_date, 기존 행은 scripts/backfill_game_date.py).
+        query = query.where(Game.game_date == game_date.isoformat())
 
-    query = query.order_by(Game.updated_at.desc()).limit(limit)
+    query = query.order_by(sort_date.desc(), Game.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
 
-    games = db.execute(query).scalars().all()
-    return [to_game_summary(game) for game in games]
+    with SessionLocal() as db:
+        games = db.execute(query).scalars().all()
+        return [
+            {
+                "key": [game.game_date or "", game.id],
+                "updated_at": game.updated_at.isoformat(timespec="microseconds"),
+                "summary": to_game_summary(game).model_dump(mode="json"),
+            }
+            for game in games
+        ]
 
 
 @app.get("/games/{game_id}", response_model=GameSummaryOut)
@@ -276,11 +471,14 @@ def get_game(game_id: str, db: Session = Depends(get_db)) -> GameSummaryOut:
 
 
 @app.get("/games/{game_id}/state", response_model=GameStateOut)
-def get_game_state(game_id: str, db: Session = Depends(get_db)) -> GameStateOut:
-    game = db.get(Game, game_id)
-    if game is None:
+async def get_game_state(game_id: str) -> dict[str, Any]:
+    state_payload = await read_cache.get_or_load(
+        _GAME_STATE_CACHE_KEY.format(game_id=game_id),
+        lambda: asyncio.to_thread(_load_game_state_payload, game_id),
+    )
+    if state_payload is None:
         raise HTTPException(status_code=404, detail="game not found")
-    return build_game_state(db, game)
+    return state_payload
 
 
 @app.get("/games/{game_id}/events", response_model=EventsResponse)
@@ -303,10 +501,10 @@ def get_game_events(
 
     chunk = rows[:limit]
     next_cursor = chunk[-1].cursor if len(rows) > limit and chunk else None
-    return EventsResponse(
+    return prerendered(EventsResponse(
         items=[to_event_out(row) for row in chunk],
         nextCursor=next_cursor,
-    )
+    ))
 
 
 # MARK: - Account Deletion
@@ -474,12 +672,17 @@ def unregister_live_activity_token(
 @app.post("/team-subscriptions")
 def register_team_subscription(
     payload: TeamSubscriptionRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> dict[str, str]:
     """응원팀 단위 글로벌 푸시 구독 등록.
 
     한 디바이스(=token) 가 응원팀을 변경하면 my_team 만 갱신.
     """
+    # 응원팀을 바꾼 경우 이전 팀의 구독자 인덱스도 무효화해야 한다.
+    previous_team = db.execute(
+        select(TeamSubscriptionToken.my_team).where(TeamSubscriptionToken.token == payload.token)
+    ).scalar_one_or_none()
     if db.bind is not None and db.bind.dialect.name == "postgresql":
         from sqlalchemy.dialects.postgresql import insert as pg_insert
 
@@ -513,18 +716,23 @@ def register_team_subscription(
                 is_sandbox=payload.is_sandbox,
             ))
     db.commit()
+    background_tasks.add_task(_invalidate_team_subscriber_cache, {payload.my_team, previous_team or ""})
     return {"status": "ok"}
 
 
 @app.delete("/team-subscriptions/{token}")
 def unregister_team_subscription(
     token: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> dict[str, str]:
-    db.execute(
-        delete(TeamSubscriptionToken).where(TeamSubscriptionToken.token == token)
-    )
+    teams = db.execute(
+        delete(TeamSubscriptionToken)
+        .where(TeamSubscriptionToken.token == token)
+        .returning(TeamSubscriptionToken.my_team)
+    ).scalars().all()
     db.commit()
+    background_tasks.add_task(_invalidate_team_subscriber_cache, set(teams))
     return {"status": "ok"}
 
 
@@ -591,6 +799,44 @@ async def _invalidate_live_activity_token_cache(game_id: str) -> None:
     await redis_relay.delete_cache(_LIVE_ACTIVITY_TOKEN_CACHE_KEY.format(game_id=game_id))
 
 
+# 응원팀 구독자 인덱스. 구독 등록/해지/정리 때 명시적으로 무효화하므로 TTL 은 길게 둔다.
+TEAM_SUBSCRIBER_CACHE_TTL_SEC = 3600
+_TEAM_SUBSCRIBER_CACHE_KEY = "team_subscribers:{team}"
+_team_subscriber_loads = SingleFlight()  # 같은 팀 경기가 동시에 시작해도 DB 조회 1회
+
+
+async def _cached_team_subscribers(team: str) -> list[tuple[str, str, str, bool]]:
+    """팀(영문 코드 / 한글 / 마스코트 라벨)의 응원팀 구독 토큰. (token, my_team, platform, is_sandbox)"""
+    cache_key = _TEAM_SUBSCRIBER_CACHE_KEY.format(team=_team_index_key(team))
+    cached = await redis_relay.get_cache(cache_key)
+    if cached is not None:
+        items = cached.get("items") if isinstance(cached, dict) else None
+        if isinstance(items, list):
+            return [
+                (str(row[0]), str(row[1]), str(row[2]), bool(row[3]))
+                for row in items
+                if isinstance(row, (list, tuple)) and len(row) == 4
+            ]
+
+    async def load() -> list[tuple[str, str, str, bool]]:
+        rows = await asyncio.to_thread(_load_team_subscriptions, _team_index_candidates(_team_index_key(team)))
+        await redis_relay.set_cache(
+            cache_key,
+            {"items": [list(row) for row in rows]},
+            ttl_sec=TEAM_SUBSCRIBER_CACHE_TTL_SEC,
+        )
+        return rows
+
+    return await _team_subscriber_loads.run(cache_key, load)
+
+
+async def _invalidate_team_subscriber_cache(teams: set[str]) -> None:
+    keys = {_TEAM_SUBSCRIBER_CACHE_KEY.format(team=_team_index_key(team)) for team in teams if team}
+    _team_subscriber_loads.discard(keys)
+    for key in keys:
+        await redis_relay.delete_cache(key)
+
+
 # 배포된 워치(2026-04-05 커밋 30720af 이후)는 home_team/away_team을 마스코트로
 # 변환(displayTeamName)해서 my_team(team code, "DOOSAN")과 단순 비교하는 회귀가 있음.
 # 앱 재배포 없이 해결하려면 백엔드가 APNs payload를 보낼 때 my_team을
@@ -685,6 +931,17 @@ def _team_codes_for_match(raw: str | None) -> set[str]:
     return candidates
 
 
+def _team_index_key(raw: str) -> str:
+    """구독자 인덱스 key. 같은 팀의 여러 라벨(DOOSAN / 두산 / 베어스)이 같은 key 가 된다."""
+    return _resolve_mascot(raw) or raw.strip().upper()
+
+
+def _team_index_candidates(index_key: str) -> set[str]:
+    """인덱스 key(마스코트)에 해당하는 my_team 후보: 영문 코드 + 한글 별칭 + 마스코트."""
+    aliases = {alias for alias, mascot in _TEAM_ALIAS_TO_MASCOT.items() if mascot == index_key}
+    return _team_codes_for_match(index_key) | aliases
+
+
 def _load_team_subscriptions(my_teams: set[str]) -> list[tuple[str, str, str, bool]]:
     """응원팀이 my_teams 에 포함된 구독 토큰 조회. (token, my_team, platform, is_sandbox)"""
     if not my_teams:
@@ -701,6 +958,10 @@ def _load_team_subscriptions(my_teams: set[str]) -> list[tuple[str, str, str, bo
         return [(r.token, r.my_team, r.platform, bool(r.is_sandbox)) for r in rows]
 
 
+# 경기 시작 알림 1단계(stage)당 플랫폼별 토큰 수
+GAME_START_PUSH_STAGE_SIZE = 500
+
+
 async def _send_game_start_notification(
     game_id: str,
     home_team: str,
@@ -710,12 +971,19 @@ async def _send_game_start_notification(
 
     제목은 양 팀 마스코트 ("[트윈스] vs [베어스]"), 본문은 수신자 응원팀을
     강조 ("베어스 경기가 시작되었습니다!"). 응원팀별로 그룹화해 전송한다.
+
+    구독자는 팀별 인덱스 캐시에서 읽고, 전송은 GAME_START_PUSH_STAGE_SIZE 단위로 나눠 순서대로 보낸다.
+    여러 경기가 동시에 시작해도 APNs 동시 요청은 apns_dispatcher 상한을 넘지 않는다.
     """
-    target_codes = _team_codes_for_match(home_team) | _team_codes_for_match(away_team)
-    if not target_codes:
+    teams = {_team_index_key(team) for team in (home_team, away_team) if team and team.strip()}
+    if not teams:
         return
 
-    subscriptions = await asyncio.to_thread(_load_team_subscriptions, target_codes)
+    subscriptions = list({
+        row[0]: row
+        for team in sorted(teams)
+        for row in await _cached_team_subscribers(team)
+    }.values())
     if not subscriptions:
         return
 
@@ -733,7 +1001,6 @@ async def _send_game_start_notification(
     for token, my_team, platform, is_sandbox in subscriptions:
         grouped[my_team].append((token, (platform or "ios").lower(), bool(is_sandbox)))
 
-    tasks: list[Any] = []
     total_ios = 0
     total_android = 0
     for my_team, group in grouped.items():
@@ -748,29 +1015,29 @@ async def _send_game_start_notification(
             else:
                 ios_targets.append((token, is_sandbox))
 
-        if ios_targets:
-            tasks.append(
-                send_apns_visible_push_to_tokens(
-                    ios_targets,
+        for start in range(0, max(len(ios_targets), len(android_tokens)), GAME_START_PUSH_STAGE_SIZE):
+            ios_stage = ios_targets[start:start + GAME_START_PUSH_STAGE_SIZE]
+            android_stage = android_tokens[start:start + GAME_START_PUSH_STAGE_SIZE]
+            stage: list[Any] = []
+            if ios_stage:
+                stage.append(apns_dispatcher.send_visible(
+                    ios_stage,
                     title=title,
                     body=body,
                     data=data,
                     category="OPEN_LIVE_GAME",
-                )
-            )
-            total_ios += len(ios_targets)
-        if android_tokens:
-            tasks.append(
-                send_fcm_visible_push_to_tokens(android_tokens, title=title, body=body, data=data)
-            )
-            total_android += len(android_tokens)
+                ))
+            if android_stage:
+                stage.append(send_fcm_visible_push_to_tokens(android_stage, title=title, body=body, data=data))
+            await asyncio.gather(*stage, return_exceptions=True)
+        total_ios += len(ios_targets)
+        total_android += len(android_tokens)
 
-    if tasks:
-        await asyncio.gather(*tasks, return_exceptions=True)
     logger.info(
         "[game-start-push] gameId=%s ios=%d android=%d teams=%s",
         game_id, total_ios, total_android, sorted(grouped.keys()),
     )
+    await _prune_invalid_push_tokens()
 
 
 async def _send_push_for_game_events(
@@ -778,15 +1045,21 @@ async def _send_push_for_game_events(
     state_payload: dict[str, Any],
     event_payloads: list[dict[str, Any]],
 ) -> None:
-    """게임 이벤트 발생 시 구독된 디바이스에 silent push 전송"""
+    """게임 이벤트 발생 시 구독된 디바이스에 silent push 전송 (합치기를 켜면 이벤트 목록을 push 1번으로)"""
     token_rows = await _cached_push_tokens(game_id)
     if not token_rows:
         return
 
-    token_info = {t[0]: {"my_team": t[1], "is_sandbox": t[2], "platform": t[3]} for t in token_rows}
-    tokens = list(token_info.keys())
+    targets = {
+        token: SilentPushTarget(
+            token=token,
+            my_team=_normalize_my_team_for_watch(my_team),
+            use_sandbox=is_sandbox,
+            platform=platform,
+        )
+        for token, my_team, is_sandbox, platform in token_rows
+    }
 
-    # 이벤트가 있으면 각 이벤트에 대해 push, 없으면 상태 업데이트만
     # 누적 투구수: nullable. iOS 측은 -1 sentinel 로 nil 표현. 키 자체가 빠지면
     # AppDelegate 가 nil 로 forwarding 해 워치에서 투구수가 사라진다 — 항상 포함.
     pitcher_pitch_count = state_payload.get("pitcherPitchCount")
@@ -809,28 +1082,95 @@ async def _send_push_for_game_events(
         "pitcher_pitch_count": pitcher_pitch_count if pitcher_pitch_count is not None else -1,
     }
 
-    async def _fanout(push_payload: dict[str, Any]) -> None:
-        coros = []
-        for token in tokens:
-            info = token_info[token]
-            payload_with_team = {**push_payload, "my_team": _normalize_my_team_for_watch(info["my_team"])}
-            coros.append(send_push(
-                token,
-                payload_with_team,
-                use_sandbox=info["is_sandbox"],
-                platform=info["platform"],
-            ))
-        await asyncio.gather(*coros, return_exceptions=True)
-
-    if event_payloads:
-        for event in event_payloads:
-            await _fanout({
+    if not event_payloads:
+        payloads = [base_payload]
+    elif settings.push_coalesce_events:
+        # 이벤트 여러 개를 push 1번으로 보낸다. event_types 는 발생 순서대로의 전체 목록,
+        # event_type / event_cursor 는 단일 이벤트만 읽는 구버전 앱을 위해 마지막 이벤트 기준으로 유지.
+        last_event = event_payloads[-1]
+        payloads = [{
+            **base_payload,
+            "event_type": last_event.get("type", ""),
+            "event_cursor": last_event.get("cursor", 0),
+            "event_types": [event.get("type", "") for event in event_payloads],
+        }]
+    else:
+        payloads = [
+            {
                 **base_payload,
                 "event_type": event.get("type", ""),
                 "event_cursor": event.get("cursor", 0),
-            })
-    else:
-        await _fanout(base_payload)
+            }
+            for event in event_payloads
+        ]
+    # 토큰별 my_team 만 다르므로 payload 는 이벤트당 1회 직렬화, 한 토큰의 이벤트는 순서대로 전송
+    result = await apns_dispatcher.send_silent(list(targets.values()), payloads, label=f"game:{game_id}")
+    if result.environment_changes:
+        await _persist_apns_environments(game_id, token_rows, result.environment_changes)
+    await _prune_invalid_push_tokens()
+
+
+push_coalescer = GamePushCoalescer(
+    _send_push_for_game_events,
+    window_sec=settings.push_coalesce_window_ms / 1000,
+)
+
+
+# IN 절 하나에 넣을 토큰 수 상한
+_TOKEN_UPDATE_CHUNK_SIZE = 500
+
+
+def _update_token_environments(changes: dict[str, bool]) -> set[str]:
+    """APNs 환경 폴백으로 확인된 is_sandbox 를 device_tokens / team_subscription_tokens 에 일괄 반영.
+
+    같은 토큰이 여러 경기에 구독돼 있을 수 있어 토큰 기준으로 갱신하고, 바뀐 device_tokens 의 game_id 를 반환.
+    """
+    game_ids: set[str] = set()
+    with SessionLocal() as db:
+        for is_sandbox in (True, False):
+            tokens = [token for token, sandbox in changes.items() if sandbox is is_sandbox]
+            for start in range(0, len(tokens), _TOKEN_UPDATE_CHUNK_SIZE):
+                chunk = tokens[start:start + _TOKEN_UPDATE_CHUNK_SIZE]
+                game_ids.update(db.execute(
+                    update(DeviceToken)
+                    .where(DeviceToken.token.in_(chunk), DeviceToken.is_sandbox != is_sandbox)
+                    .values(is_sandbox=is_sandbox)
+                    .returning(DeviceToken.game_id)
+                ).scalars())
+                db.execute(
+                    update(TeamSubscriptionToken)
+                    .where(TeamSubscriptionToken.token.in_(chunk), TeamSubscriptionToken.is_sandbox != is_sandbox)
+                    .values(is_sandbox=is_sandbox)
+                )
+        db.commit()
+    return game_ids
+
+
+async def _persist_apns_environments(
+    game_id: str,
+    token_rows: list[tuple[str, str | None, bool, str]],
+    changes: dict[str, bool],
+) -> None:
+    """폴백으로 알게 된 APNs 환경을 저장해, 다음 push 부터는 요청 1번으로 끝나게 한다."""
+    try:
+        game_ids = await asyncio.to_thread(_update_token_environments, changes)
+    except Exception:
+        logger.exception("[APNs] environment persist failed game_id=%s tokens=%s", game_id, len(changes))
+        return
+    logger.info("[APNs] persisted environment for %s tokens (games=%s)", len(changes), len(game_ids))
+
+    # 방금 보낸 경기는 캐시를 다시 읽지 않고 고쳐 쓰고, 같은 토큰을 가진 다른 경기 캐시는 무효화.
+    patched = [
+        [token, my_team, changes.get(token, is_sandbox), platform]
+        for token, my_team, is_sandbox, platform in token_rows
+    ]
+    await redis_relay.set_cache(
+        _PUSH_TOKEN_CACHE_KEY.format(game_id=game_id),
+        {"items": patched},
+        ttl_sec=PUSH_TOKEN_CACHE_TTL_SEC,
+    )
+    for other_game_id in game_ids - {game_id}:
+        await _invalidate_push_token_cache(other_game_id)
 
 
 def _load_live_activity_tokens(game_id: str) -> list[str]:
@@ -847,9 +1187,8 @@ async def _send_live_activity_update(
     state_payload: dict[str, Any],
     event_type: str = "update",
 ) -> None:
-    """Live Activity push로 잠금화면 업데이트"""
-    tokens = await _cached_live_activity_tokens(game_id)
-    if not tokens:
+    """Live Activity push로 잠금화면 업데이트 (변경 없으면 생략, 점수 변경 외에는 경기별 rate limit)"""
+    if not await _cached_live_activity_tokens(game_id):
         return
 
     last_event_type = state_payload.get("lastEventType")
@@ -868,30 +1207,106 @@ async def _send_live_activity_update(
         "status": state_payload.get("status", "LIVE"),
         "lastEventType": last_event_type,
     }
+    await live_activity_throttle.submit(game_id, content_state, event_type)
 
+
+async def _push_live_activity(
+    game_id: str,
+    content_state: dict[str, Any],
+    event_type: str,
+    priority: int,
+) -> None:
+    # rate limit 으로 미뤄졌다 보낼 수도 있어 토큰은 보내는 시점에 다시 읽는다.
+    tokens = await _cached_live_activity_tokens(game_id)
+    if not tokens:
+        return
     await asyncio.gather(
-        *(send_live_activity_push(token, content_state, event_type=event_type) for token in tokens),
+        *(
+            send_live_activity_push(token, content_state, event_type=event_type, priority=priority)
+            for token in tokens
+        ),
         return_exceptions=True,
     )
+    await _prune_invalid_push_tokens()
+
+
+live_activity_throttle = LiveActivityThrottle(
+    _push_live_activity,
+    min_interval_sec=settings.live_activity_min_interval_sec,
+)
+
+
+def _delete_push_tokens(tokens: list[str]) -> tuple[dict[str, int], set[str], set[str], set[str]]:
+    """죽은 토큰을 세 토큰 테이블에서 일괄 삭제.
+
+    (테이블별 삭제 수, device_tokens game_id, live_activity game_id, team_subscription my_team)
+    """
+    counts = {"device_tokens": 0, "live_activity_tokens": 0, "team_subscription_tokens": 0}
+    push_game_ids: set[str] = set()
+    live_activity_game_ids: set[str] = set()
+    subscription_teams: set[str] = set()
+    with SessionLocal() as db:
+        for start in range(0, len(tokens), _TOKEN_UPDATE_CHUNK_SIZE):
+            chunk = tokens[start:start + _TOKEN_UPDATE_CHUNK_SIZE]
+            deleted_push = db.execute(
+                delete(DeviceToken).where(DeviceToken.token.in_(chunk)).returning(DeviceToken.game_id)
+            ).scalars().all()
+            deleted_live_activity = db.execute(
+                delete(LiveActivityToken).where(LiveActivityToken.token.in_(chunk)).returning(LiveActivityToken.game_id)
+            ).scalars().all()
+            deleted_subscriptions = db.execute(
+                delete(TeamSubscriptionToken)
+                .where(TeamSubscriptionToken.token.in_(chunk))
+                .returning(TeamSubscriptionToken.my_team)
+            ).scalars().all()
+            counts["device_tokens"] += len(deleted_push)
+            counts["live_activity_tokens"] += len(deleted_live_activity)
+            counts["team_subscription_tokens"] += len(deleted_subscriptions)
+            push_game_ids.update(deleted_push)
+            live_activity_game_ids.update(deleted_live_activity)
+            subscription_teams.update(deleted_subscriptions)
+        db.commit()
+    return counts, push_game_ids, live_activity_game_ids, subscription_teams
+
+
+async def _prune_invalid_push_tokens() -> None:
+    """APNs/FCM 가 영구 실패로 응답한 토큰을 삭제하고 토큰 캐시를 무효화 (fan-out 직후 호출)."""
+    pending = invalid_push_tokens.drain()
+    if not pending:
+        return
+    try:
+        counts, push_game_ids, live_activity_game_ids, subscription_teams = await asyncio.to_thread(
+            _delete_push_tokens, list(pending),
+        )
+    except Exception:
+        logger.exception("[push-prune] delete failed tokens=%s", len(pending))
+        return
+    invalid_push_tokens.record_pruned(counts)
+    for game_id in push_game_ids:
+        await _invalidate_push_token_cache(game_id)
+    for game_id in live_activity_game_ids:
+        await _invalidate_live_activity_token_cache(game_id)
+    if subscription_teams:
+        await _invalidate_team_subscriber_cache(subscription_teams)
+    logger.info(
+        "[push-prune] tokens=%s deleted=%s reasons=%s",
+        len(pending), counts, sorted(set(pending.values())),
+    )
 
 
 @app.get("/team-records/{team_id}", response_model=TeamRecordOut)
-def get_team_record_by_team(
+async def get_team_record_by_team(
     team_id: str,
     category_id: str = Query(default="kbo", alias="categoryId"),
     season_code: str | None = Query(default=None, alias="seasonCode"),
-    db: Session = Depends(get_db),
-) -> TeamRecordOut:
+) -> dict[str, Any]:
     normalized_season_code = (season_code or str(datetime.now(UTC).year)).strip()
-    row = get_team_record(
-        db,
-        category_id=category_id.strip(),
-        season_code=normalized_season_code,
-        team_id=team_id.strip(),
+    message = await _load_team_record_initial_data_cached(
+        category_id.strip(), normalized_season_code, team_id.strip(),
     )
-    if row is None:
+    if message is None:
         raise HTTPException(status_code=404, detail="team record not found")
-    return to_team_record_out(row)
+    return message["payload"]
 
 
 @app.post("/internal/crawler/games/{game_id}/snapshot", response_model=IngestResult)
@@ -905,78 +1320,135 @@ def ingest_crawler_snapshot(
     if x_api_key is None or not secrets.compare_digest(x_api_key, settings.crawler_api_key):
         raise HTTPException(status_code=401, detail="invalid crawler api key")
 
-    game_lock = _snapshot_ingest_locks[game_id]
-    with game_lock:
-        return _ingest_crawler_snapshot_locked(game_id=game_id, payload=payload, background_tasks=background_tasks, db=db)
+    # latest-wins: 락을 기다리는 동안 쌓인 같은 경기 스냅샷은 락을 잡은 요청이 병합해 한 번에 쓴다.
+    with ingest_coordinator.claim(game_id, payload) as claim:
+        if claim.absorbed:
+            # 앞선 요청이 이 스냅샷까지 병합해 썼고 broadcast/push 도 그쪽에서 예약했다.
+            return _to_ingest_result(claim.ticket.result, received_events=len(payload.events))
+        (applied,) = _apply_snapshots_with_retries(db, [(game_id, merge_snapshots(claim.payloads))])
+        claim.resolve(applied)
 
+    _schedule_snapshot_side_effects(background_tasks, applied)
+    return _to_ingest_result(applied, received_events=len(payload.events))
 
-def _ingest_crawler_snapshot_locked(
-    *,
-    game_id: str,
-    payload: CrawlerSnapshotRequest,
+
+@app.post("/internal/crawler/snapshots", response_model=CrawlerSnapshotBatchResult)
+def ingest_crawler_snapshot_batch(
+    payload: CrawlerSnapshotBatchRequest,
     background_tasks: BackgroundTasks,
-    db: Session,
-) -> IngestResult:
-    game: Game | None = None
-    inserted_events: list[GameEvent] = []
-    duplicate_count = 0
-    state_payload: dict[str, Any] | None = None
-    inserted_event_payload: list[dict[str, Any]] = []
-    response_status: GameStatus | None = None
-    response_updated_at: datetime | None = None
+    db: Session = Depends(get_db),
+    x_api_key: Annotated[str | None, Header(alias="X-API-Key")] = None,
+) -> CrawlerSnapshotBatchResult:
+    """여러 경기 스냅샷을 한 요청/한 트랜잭션으로 적용.
 
+    경기별 락은 단건 ingest 와 같은 `ingest_coordinator` 를 사용하고, 데드락을
+    피하기 위해 gameId 정렬 순서로 잡는다. 같은 gameId 가 여러 번 오면 요청 순서대로 적용.
+    """
+    if x_api_key is None or not secrets.compare_digest(x_api_key, settings.crawler_api_key):
+        raise HTTPException(status_code=401, detail="invalid crawler api key")
+
+    items = [(item.gameId, item.snapshot) for item in payload.items]
+    with ingest_coordinator.hold(game_id for game_id, _ in items):
+        applied_items = _apply_snapshots_with_retries(db, items)
+
+    results: list[IngestResult] = []
+    for applied in applied_items:
+        _schedule_snapshot_side_effects(background_tasks, applied)
+        results.append(_to_ingest_result(applied))
+    return CrawlerSnapshotBatchResult(items=results)
+
+
+@dataclass
+class _AppliedSnapshot:
+    game_id: str
+    received_events: int
+    duplicate_events: int
+    state_payload: dict[str, Any]
+    inserted_event_payload: list[dict[str, Any]]
+    status: GameStatus
+    updated_at: datetime
+    just_became_live: bool
+
+
+def _apply_snapshot(db: Session, *, game_id: str, payload: CrawlerSnapshotRequest) -> _AppliedSnapshot:
+    # upsert 가 같은 row 를 identity map 에서 다시 꺼내므로 추가 쿼리는 없다.
+    previous_game = db.get(Game, game_id)
+    previous_updated_at = previous_game.updated_at if previous_game is not None else None
+    game = upsert_game_from_snapshot(db, game_id=game_id, payload=payload)
+    inserted_events, duplicate_count = insert_events(
+        db,
+        game_id=game_id,
+        events=payload.events,
+        fallback_pitcher=payload.pitcher,
+        fallback_batter=payload.batter,
+    )
+    sync_snapshot_details(db, game_id=game_id, payload=payload)
+    record_snapshot_projection(
+        game, previous_updated_at=previous_updated_at, payload=payload, inserted_events=inserted_events,
+    )
+    current_state = build_game_state(db, game)
+    return _AppliedSnapshot(
+        game_id=game.id,
+        received_events=len(payload.events),
+        duplicate_events=duplicate_count,
+        state_payload=current_state.model_dump(mode="json"),
+        inserted_event_payload=[to_event_out(item).model_dump(mode="json") for item in inserted_events],
+        status=normalize_status(game.status),
+        updated_at=game.updated_at,
+        just_became_live=bool(getattr(game, "_just_became_live", False)),
+    )
+
+
+def _apply_snapshots_with_retries(
+    db: Session,
+    items: list[tuple[str, CrawlerSnapshotRequest]],
+) -> list[_AppliedSnapshot]:
+    game_ids = list(dict.fromkeys(game_id for game_id, _ in items))
+    log_game_id = ",".join(game_ids)
+    queued_in_db = ingest_coordinator.uses_advisory_lock(db)
     for attempt in range(len(SNAPSHOT_INGEST_RETRY_DELAYS_SECONDS) + 1):
         try:
-            game = upsert_game_from_snapshot(db, game_id=game_id, payload=payload)
-            inserted_events, duplicate_count = insert_events(
-                db,
-                game_id=game_id,
-                events=payload.events,
-                fallback_pitcher=payload.pitcher,
-                fallback_batter=payload.batter,
-            )
-            sync_snapshot_details(db, game_id=game_id, payload=payload)
-            current_state = build_game_state(db, game)
-            current_state_payload = current_state.model_dump(mode="json")
-            current_event_payload = [to_event_out(item).model_dump(mode="json") for item in inserted_events]
-            response_status = normalize_status(game.status)
-            response_updated_at = game.updated_at
+            # PostgreSQL: 워커 간 같은 경기 writer 는 advisory lock 큐에서 순서대로 대기.
+            ingest_coordinator.lock_transaction(db, game_ids)
+            applied_items = [_apply_snapshot(db, game_id=game_id, payload=payload) for game_id, payload in items]
             db.commit()
-            state_payload = current_state_payload
-            inserted_event_payload = current_event_payload
-            break
+            return applied_items
         except DBAPIError as exc:
-            rollback_ok = _rollback_session_safely(db, game_id=game_id, attempt=attempt + 1)
+            rollback_ok = _rollback_session_safely(db, game_id=log_game_id, attempt=attempt + 1)
             if not rollback_ok:
                 raise HTTPException(status_code=503, detail="snapshot ingest busy; retry shortly") from exc
             if not _is_snapshot_lock_timeout(exc):
                 raise
 
             if attempt >= len(SNAPSHOT_INGEST_RETRY_DELAYS_SECONDS):
-                logger.error("snapshot ingest lock timeout exhausted: game_id=%s", game_id)
+                logger.error("snapshot ingest lock timeout exhausted: game_id=%s", log_game_id)
                 raise HTTPException(status_code=503, detail="snapshot ingest busy; retry shortly") from exc
 
-            delay = SNAPSHOT_INGEST_RETRY_DELAYS_SECONDS[attempt]
+            # PostgreSQL: 재시도는 advisory lock 큐 재진입 자체가 대기이므로 요청 스레드에서 sleep 하지 않는다.
+            # SQLite: DB 큐가 없으니 jitter 를 섞은 backoff 후 다시 시도해 busy retry 를 피한다.
+            delay = 0.0 if queued_in_db else ingest_coordinator.retry_delay(SNAPSHOT_INGEST_RETRY_DELAYS_SECONDS[attempt])
             logger.warning(
                 "snapshot ingest lock timeout; retrying game_id=%s attempt=%s delay=%.1fs",
-                game_id,
+                log_game_id,
                 attempt + 1,
                 delay,
             )
-            time.sleep(delay)
+            if delay > 0:
+                time.sleep(delay)
+
+    raise HTTPException(status_code=500, detail="snapshot ingest failed")
 
-    if game is None or state_payload is None or response_status is None or response_updated_at is None:
-        raise HTTPException(status_code=500, detail="snapshot ingest failed")
+
+def _schedule_snapshot_side_effects(background_tasks: BackgroundTasks, applied: _AppliedSnapshot) -> None:
+    game_id = applied.game_id
+    state_payload = applied.state_payload
+    inserted_event_payload = applied.inserted_event_payload
 
     # NOTE: 배포된 iOS의 .update 경로가 state.homeTeamId.teamName(마스코트만)을
     # 워치로 전달해 myTeam 비교가 깨지는 버그가 있어, 정상 동작하는 .state 경로로
     # 흐르도록 events + state 두 메시지로 분리해서 broadcast.
     if inserted_event_payload:
-        background_tasks.add_task(
-            _broadcast_live_message,
-            game_id,
-            {"type": "events", "payload": {"items": inserted_event_payload}},
-        )
+        background_tasks.add_task(_broadcast_game_events, game_id, inserted_event_payload)
     background_tasks.add_task(
         _broadcast_live_message,
         game_id,
@@ -988,14 +1460,13 @@ def _ingest_crawler_snapshot_locked(
         _cache_game_data, game_id, state_payload, inserted_event_payload,
     )
 
-    # APNs silent push 전송 (백그라운드에서도 워치로 이벤트 전달)
+    # APNs silent push 전송 (백그라운드에서도 워치로 이벤트 전달). 합치기를 켜면 짧은 window 안의 이벤트는 push 1번으로.
     if inserted_event_payload:
-        background_tasks.add_task(
-            _send_push_for_game_events, game_id, state_payload, inserted_event_payload,
-        )
+        send_push = push_coalescer.submit if settings.push_coalesce_events else _send_push_for_game_events
+        background_tasks.add_task(send_push, game_id, state_payload, inserted_event_payload)
 
     # 경기 시작(SCHEDULED→LIVE) 1회 한정 visible push (응원팀 구독자에게)
-    if getattr(game, "_just_became_live", False):
+    if applied.just_became_live:
         background_tasks.add_task(
             _send_game_start_notification,
             game_id,
@@ -1013,13 +1484,15 @@ def _ingest_crawler_snapshot_locked(
         _send_live_activity_update, game_id, state_payload_with_event, la_event,
     )
 
+
+def _to_ingest_result(applied: _AppliedSnapshot, *, received_events: int | None = None) -> IngestResult:
     return IngestResult(
-        gameId=game.id,
-        receivedEvents=len(payload.events),
-        insertedEvents=len(inserted_event_payload),
-        duplicateEvents=duplicate_count,
-        status=response_status,
-        updatedAt=response_updated_at,
+        gameId=applied.game_id,
+        receivedEvents=applied.received_events if received_events is None else received_events,
+        insertedEvents=len(applied.inserted_event_payload),
+        duplicateEvents=applied.duplicate_events,
+        status=applied.status,
+        updatedAt=applied.updated_at,
     )
 
 
@@ -1036,6 +1509,7 @@ def ingest_crawler_team_records(
     upsert_result = upsert_team_records(db, payload)
     db.commit()
 
+    cached_messages: dict[str, dict[str, Any]] = {}
     for row in upsert_result.changed_records:
         channel = _team_record_channel(
             category_id=row.category_id,
@@ -1044,6 +1518,9 @@ def ingest_crawler_team_records(
         )
         message = _team_record_message(row=to_team_record_out(row))
         background_tasks.add_task(_broadcast_live_message, channel, message)
+        cached_messages[_team_record_cache_key(row.category_id, row.season_code, row.team_id)] = message
+    if cached_messages:
+        background_tasks.add_task(_cache_team_record_messages, cached_messages)
 
     return TeamRecordIngestResult(
         categoryId=payload.categoryId,
@@ -1062,36 +1539,127 @@ def _load_game_initial_data(game_id: str) -> tuple[dict[str, Any] | None, list[d
             return None, []
         state_payload = build_game_state(db, game).model_dump(mode="json")
         recent_events = db.execute(
-            select(GameEvent).where(GameEvent.game_id == game_id).order_by(GameEvent.cursor.desc()).limit(20)
+            select(GameEvent)
+            .where(GameEvent.game_id == game_id)
+            .order_by(GameEvent.cursor.desc())
+            .limit(WS_INITIAL_EVENTS)
         ).scalars().all()
         events_payload = [to_event_out(event).model_dump(mode="json") for event in reversed(recent_events)]
     return state_payload, events_payload
 
 
 async def _load_game_initial_data_cached(game_id: str) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
-    """Try Redis cache first, fall back to DB."""
-    state = await redis_relay.get_cache(f"game:state:{game_id}")
-    events_data = await redis_relay.get_cache(f"game:events:{game_id}")
+    """Try Redis cache first, fall back to DB.
+
+    경기 시작 직후 동시 접속이 몰리면 같은 gameId 의 조회는 1회만 실행하고 결과를 공유한다
+    (Redis 왕복/DB 커넥션을 접속 수만큼 쓰지 않음). 결과 dict/list 는 공유되므로 수정하지 않는다.
+    """
+    return await _game_initial_loads.run(game_id, lambda: _fetch_game_initial_data(game_id))
+
+
+async def _fetch_game_initial_data(game_id: str) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    state, cached_events = await redis_relay.get_cache_with_list(
+        _GAME_STATE_CACHE_KEY.format(game_id=game_id),
+        list_key=_GAME_EVENTS_CACHE_KEY.format(game_id=game_id),
+        max_items=WS_INITIAL_EVENTS,
+    )
     if state is not None:
-        events = (events_data.get("items") if events_data else None) or []
-        return state, events
+        # 워커별 background task 순서가 뒤바뀔 수 있어 cursor 기준으로 정렬/중복 제거
+        by_cursor = {item.get("cursor"): item for item in cached_events}
+        events = [by_cursor[cursor] for cursor in sorted(by_cursor, key=lambda cursor: cursor or 0)]
+        return state, events[-WS_INITIAL_EVENTS:]
     # Cache miss → fall back to DB
-    return await asyncio.to_thread(_load_game_initial_data, game_id)
+    epoch = _replay_epoch(game_id)
+    state, events = await asyncio.to_thread(_load_game_initial_data, game_id)
+    if state is not None:
+        # 최근 WS_INITIAL_EVENTS 개 미만이면 경기 전체 이벤트, 아니면 가장 오래된 것 이후 전체를 가진 셈이다.
+        floor = events[0]["cursor"] - 1 if len(events) >= WS_INITIAL_EVENTS else 0
+        game_event_replay.seed(game_id, floor=floor, events=events, epoch=epoch)
+    return state, events
+
+
+def _load_game_state_payload(game_id: str) -> dict[str, Any] | None:
+    with SessionLocal() as db:
+        game = db.get(Game, game_id)
+        if game is None:
+            return None
+        return build_game_state(db, game).model_dump(mode="json")
+
+
+def _load_game_replay(game_id: str, after: int, limit: int) -> tuple[dict[str, Any] | None, list[dict[str, Any]], bool]:
+    """WS `?after=` 재접속의 DB fallback (idx_game_events_game_cursor). (state, after 초과 이벤트, 잘렸는지)"""
+    with SessionLocal() as db:
+        game = db.get(Game, game_id)
+        if game is None:
+            return None, [], False
+        state_payload = build_game_state(db, game).model_dump(mode="json")
+        rows = db.execute(
+            select(GameEvent)
+            .where(GameEvent.game_id == game_id, GameEvent.cursor > after)
+            .order_by(GameEvent.cursor.asc())
+            .limit(limit + 1)
+        ).scalars().all()
+        events_payload = [to_event_out(event).model_dump(mode="json") for event in rows[:limit]]
+    return state_payload, events_payload, len(rows) > limit
+
+
+async def _load_game_replay_messages(game_id: str, after: int) -> list[dict[str, Any]]:
+    """state + after 이후 놓친 이벤트. replay buffer → DB 순으로 찾는다.
+
+    WS_REPLAY_MAX_EVENTS 를 넘으면 앞부분만 보내고 마지막 프레임에 nextCursor 를 실어
+    나머지는 `GET /games/{id}/events?after=` 로 받게 한다.
+    """
+    epoch = _replay_epoch(game_id)
+    events = game_event_replay.replay(game_id, after, epoch=epoch)
+    truncated = False
+    if events is None:
+        state, events, truncated = await asyncio.to_thread(
+            _load_game_replay, game_id, after, WS_REPLAY_MAX_EVENTS,
+        )
+        if state is None:
+            return []
+        if not truncated:
+            game_event_replay.seed(game_id, floor=after, events=events, epoch=epoch)
+    else:
+        state = await read_cache.get_or_load(
+            _GAME_STATE_CACHE_KEY.format(game_id=game_id),
+            lambda: asyncio.to_thread(_load_game_state_payload, game_id),
+        )
+        if state is None:
+            return []
+
+    if len(events) > WS_REPLAY_MAX_EVENTS:
+        events = events[:WS_REPLAY_MAX_EVENTS]
+        truncated = True
+    messages: list[dict[str, Any]] = [{"type": "state", "payload": state}]
+    for start in range(0, len(events), WS_REPLAY_FRAME_EVENTS):
+        messages.append({"type": "events", "payload": {"items": events[start:start + WS_REPLAY_FRAME_EVENTS]}})
+    if truncated and events:
+        messages[-1]["payload"]["nextCursor"] = events[-1]["cursor"]
+    return messages
 
 
 @app.websocket("/ws/games/{game_id}")
-async def websocket_game_stream(websocket: WebSocket, game_id: str) -> None:
+async def websocket_game_stream(
+    websocket: WebSocket,
+    game_id: str,
+    after: int | None = Query(default=None, ge=0),
+) -> None:
     if not await event_bus.connect(websocket):
         return
-    await event_bus.register(game_id, websocket)
+    # after 가 있으면 replay 를 보낼 때까지 live 프레임을 쌓아 두어, 순서가 replay → live 가 되게 한다.
+    await event_bus.register(game_id, websocket, hold=after is not None)
     try:
-        state_payload, events_payload = await _load_game_initial_data_cached(game_id)
-        if state_payload is not None:
-            await event_bus.safe_send(websocket, {"type": "state", "payload": state_payload})
-        if events_payload:
-            await event_bus.safe_send(
-                websocket, {"type": "events", "payload": {"items": events_payload}}
-            )
+        if after is not None:
+            await event_bus.release(websocket, await _load_game_replay_messages(game_id, after))
+        else:
+            state_payload, events_payload = await _load_game_initial_data_cached(game_id)
+            if state_payload is not None:
+                await event_bus.safe_send(websocket, {"type": "state", "payload": state_payload})
+            if events_payload:
+                await event_bus.safe_send(
+                    websocket, {"type": "events", "payload": {"items": events_payload}}
+                )
 
         while True:
             await websocket.receive_text()
@@ -1118,16 +1686,17 @@ def _load_team_record_initial_data(
         return _team_record_message(row=to_team_record_out(row))
 
 
+def _team_record_cache_key(category_id: str, season_code: str, team_id: str) -> str:
+    return f"team-record:{category_id}:{season_code}:{team_id}"
+
+
 async def _load_team_record_initial_data_cached(
     category_id: str, season_code: str, team_id: str,
 ) -> dict[str, Any] | None:
-    """Try Redis cache first, fall back to DB."""
-    cache_key = f"team-record:{category_id}:{season_code}:{team_id}"
-    cached = await redis_relay.get_cache(cache_key)
-    if cached is not None:
-        return cached
-    return await asyncio.to_thread(
-        _load_team_record_initial_data, category_id, season_code, team_id,
+    """Local cache → Redis (ingest 가 기록) → DB."""
+    return await read_cache.get_or_load(
+        _team_record_cache_key(category_id, season_code, team_id),
+        lambda: asyncio.to_thread(_load_team_record_initial_data, category_id, season_code, team_id),
     )
 
 
@@ -1389,4 +1958,4 @@ def get_my_cheer_events(
         }
         for r in rows
     ]
-    return {"user_id": user_id, "count": len(items), "items": items}
+    return prerendered({"user_id": user_id, "count": len(items), "items": items})
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SEC = 0.25
+
+FlushFn = Callable[[str, dict[str, Any], list[dict[str, Any]]], Awaitable[None]]
+
+
+@dataclass
+class _PendingPush:
+    state_payload: dict[str, Any]
+    events: dict[int, dict[str, Any]] = field(default_factory=dict)  # cursor -> event
+    submits: int = 1
+
+
+class GamePushCoalescer:
+    """경기별 silent push 합치기. window 동안 들어온 이벤트를 push 1번(최신 state + 이벤트 목록)으로 보낸다.
+
+    window 를 여는 첫 submit 이 대기/flush 를 별도 task 로 띄우고 바로 반환한다. 요청의 BackgroundTasks 에서
+    window 만큼 기다리면 뒤에 걸린 경기 시작/Live Activity 작업까지 밀리기 때문이다.
+    그 사이 같은 경기 submit 은 이벤트만 보탠다. flush 가 시작된 뒤 들어온 이벤트는 다음 window 로 간다.
+    task 는 이 객체가 들고 있고, lifespan 종료 시 `close()` 가 남은 window 를 바로 flush 하고 기다린다.
+    이벤트 루프에서만 호출한다 (lock 없음).
+    """
+
+    def __init__(self, flush: FlushFn, *, window_sec: float = DEFAULT_WINDOW_SEC) -> None:
+        self._flush = flush
+        self.window_sec = max(0.0, window_sec)
+        self._pending: dict[str, _PendingPush] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closing: asyncio.Event | None = None
+        self.stats: dict[str, int] = {
+            "submits": 0,
+            "merged": 0,
+            "flushes": 0,
+            "events": 0,
+            "flush_errors": 0,
+        }
+
+    async def submit(self, game_id: str, state_payload: dict[str, Any], events: list[dict[str, Any]]) -> None:
+        self.stats["submits"] += 1
+        pending = self._pending.get(game_id)
+        if pending is not None:
+            # ingest 는 경기별로 순서대로 처리되므로 나중에 온 state 가 최신
+            pending.state_payload = state_payload
+            pending.events.update((int(event.get("cursor") or 0), event) for event in events)
+            pending.submits += 1
+            self.stats["merged"] += 1
+            return
+
+        pending = _PendingPush(state_payload=state_payload)
+        pending.events.update((int(event.get("cursor") or 0), event) for event in events)
+        self._pending[game_id] = pending
+        if self._closing is None:
+            self._closing = asyncio.Event()
+        task = asyncio.create_task(self._flush_after_window(game_id, pending, self._closing))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """열린 window 를 기다리지 않고 바로 flush 하고, 진행 중인 flush 가 끝날 때까지 기다린다."""
+        if self._closing is not None:
+            self._closing.set()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Event 는 처음 쓰인 이벤트 루프에 묶이므로 다음 submit 에서 새로 만든다.
+        self._closing = None
+
+    async def _flush_after_window(self, game_id: str, pending: _PendingPush, closing: asyncio.Event) -> None:
+        if self.window_sec > 0:
+            try:
+                await asyncio.wait_for(closing.wait(), timeout=self.window_sec)
+            except asyncio.TimeoutError:
+                pass
+        if self._pending.get(game_id) is pending:
+            self._pending.pop(game_id, None)
+
+        ordered = [pending.events[cursor] for cursor in sorted(pending.events)]
+        self.stats["flushes"] += 1
+        self.stats["events"] += len(ordered)
+        try:
+            await self._flush(game_id, pending.state_payload, ordered)
+        except Exception:
+            self.stats["flush_errors"] += 1
+            logger.exception("push flush failed game_id=%s events=%s", game_id, len(ordered))
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        flushes = self.stats["flushes"]
+        return {
+            **self.stats,
+            "window_ms": round(self.window_sec * 1000),
+            "pending_games": len(self._pending),
+            "inflight_tasks": len(self._tasks),
+            "events_per_push": round(self.stats["events"] / flushes, 2) if flushes else None,
+        }
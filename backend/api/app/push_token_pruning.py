@@ -0,0 +1,80 @@
+"""APNs/FCM 응답으로 확인된 죽은 토큰 수집.
+
+전송 모듈(apns/fcm)은 실패를 분류해 `invalid_push_tokens` 에 기록만 하고,
+main 의 push fan-out 이 끝난 뒤 한 번에 꺼내 device_tokens / live_activity_tokens /
+team_subscription_tokens 에서 일괄 삭제한다.
+"""
+import threading
+from collections import Counter
+
+# 재시도해도 성공할 수 없는 실패만 삭제 대상으로 본다.
+# (DeviceTokenNotForTopic 은 플랫폼/번들 설정 오류일 수 있어 제외, FCM InvalidArgument 는 payload 오류와 구분 불가해 제외)
+APNS_PERMANENT_REASONS = frozenset({"Unregistered", "ExpiredToken"})
+# sandbox/production 환경을 잘못 저장한 토큰도 BadDeviceToken 을 받는다.
+# 반대 환경으로 재시도해서 두 환경 모두 거절했을 때만 영구 실패로 본다.
+APNS_ENVIRONMENT_RETRY_REASONS = frozenset({"BadEnvironmentKeyInToken", "BadDeviceToken"})
+APNS_BAD_TOKEN_REASON = "BadDeviceToken"
+# HTTP v1 응답의 FcmError.errorCode
+FCM_PERMANENT_ERROR_CODES = {
+    "UNREGISTERED": "Unregistered",
+    "SENDER_ID_MISMATCH": "SenderIdMismatch",
+}
+
+
+def classify_apns_failure(status_code: int | None, reason: str, *, both_environments: bool = False) -> str | None:
+    """영구 실패면 사유 문자열, 아니면 None. APNs 410 은 reason 과 무관하게 해지된 토큰.
+
+    BadDeviceToken 은 두 환경 모두에서 거절됐을 때(`both_environments`)만 영구 실패다.
+    """
+    if status_code == 410:
+        return reason or "Unregistered"
+    if reason in APNS_PERMANENT_REASONS:
+        return reason
+    if reason == APNS_BAD_TOKEN_REASON and both_environments:
+        return reason
+    return None
+
+
+def classify_fcm_error_code(error_code: str) -> str | None:
+    return FCM_PERMANENT_ERROR_CODES.get(error_code)
+
+
+class InvalidTokenBuffer:
+    """죽은 토큰 버퍼. 스레드에서 도는 전송 경로가 있을 수 있어 lock 으로 보호한다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[str, str] = {}
+        self.reasons: Counter[str] = Counter()
+        self.stats: dict[str, int] = {
+            "recorded": 0,
+            "prune_runs": 0,
+            "pruned_device_tokens": 0,
+            "pruned_live_activity_tokens": 0,
+            "pruned_team_subscription_tokens": 0,
+        }
+
+    def record(self, token: str, reason: str, *, source: str) -> None:
+        with self._lock:
+            if token not in self._pending:
+                self._pending[token] = reason
+                self.reasons[f"{source}:{reason}"] += 1
+                self.stats["recorded"] += 1
+
+    def drain(self) -> dict[str, str]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def record_pruned(self, counts: dict[str, int]) -> None:
+        with self._lock:
+            self.stats["prune_runs"] += 1
+            for table, count in counts.items():
+                self.stats[f"pruned_{table}"] += count
+
+    def snapshot_stats(self) -> dict[str, object]:
+        with self._lock:
+            return {**self.stats, "pending": len(self._pending), "reasons": dict(self.reasons)}
+
+
+invalid_push_tokens = InvalidTokenBuffer()
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from .redis_bus import RedisBroadcastRelay
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_LOCAL_TTL_SEC = 5.0
+# 다른 워커에 로컬 캐시 무효화를 알리는 relay 메시지 (공용 채널로만 publish)
+INVALIDATE_MESSAGE_TYPE = "cache_invalidate"
+INVALIDATE_CHANNEL_KEY = "read-cache"
+
+_MISSING = object()
+
+
+class SingleFlight:
+    """같은 key 로 동시에 들어온 async 작업을 1회 실행으로 합친다.
+
+    먼저 온 호출이 task 를 만들고, 끝나기 전에 온 호출은 같은 결과(또는 예외)를 받는다.
+    task 는 호출자와 분리돼 있어 먼저 온 호출자가 취소돼도 나머지는 결과를 받는다. 결과는 보관하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self.stats: dict[str, int] = {"runs": 0, "coalesced": 0}
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+            self.stats["runs"] += 1
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def discard(self, keys: Iterable[str] = (), prefixes: tuple[str, ...] = ()) -> None:
+        """이후 호출은 진행 중인 task 에 합류하지 않고 새로 실행한다 (무효화 직후 옛 결과 공유 방지)."""
+        for key in keys:
+            self._inflight.pop(key, None)
+        if prefixes:
+            for key in [key for key in self._inflight if key.startswith(prefixes)]:
+                self._inflight.pop(key, None)
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("single-flight task failed: key=%s error=%s", key, task.exception())
+
+
+class TwoTierCache:
+    """읽기 경로용 2단 캐시: 프로세스 메모리(TTL + LRU) → Redis → loader(DB).
+
+    - Redis 에는 읽기 쪽에서 쓰지 않는다. 값은 ingest 쪽이 써 두고(예: game:state:*), 읽기는 조회만 한다.
+      느린 읽기가 방금 ingest 가 쓴 최신 값을 덮어쓰는 일이 없다.
+    - 같은 key 의 동시 miss 는 loader 1회로 합친다 (SingleFlight).
+    - `invalidate` 는 로컬 항목을 지우고 Redis relay 공용 채널로 다른 워커에도 알린다.
+      load 중에 무효화가 일어나면 그 결과는 로컬에 저장하지 않는다.
+    이벤트 루프에서만 호출한다 (lock 없음).
+    """
+
+    def __init__(
+        self,
+        relay: RedisBroadcastRelay,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_sec: float = DEFAULT_LOCAL_TTL_SEC,
+    ) -> None:
+        self._relay = relay
+        self.max_entries = max(1, max_entries)
+        self.ttl_sec = max(0.0, ttl_sec)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._flight = SingleFlight()
+        self._epoch = 0
+        self.stats: dict[str, int] = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "loads": 0,
+            "invalidations": 0,
+            "remote_invalidations": 0,
+            "evicted": 0,
+        }
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        use_redis: bool = True,
+    ) -> Any:
+        """loader 결과가 None 이면 (404 등) 캐시하지 않는다."""
+        value = self._get_local(key)
+        if value is not _MISSING:
+            self.stats["local_hits"] += 1
+            return value
+
+        return await self._flight.run(key, lambda: self._fill(key, loader, use_redis=use_redis))
+
+    def set_local(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    async def invalidate(self, *, keys: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        keys, prefixes = list(keys), list(prefixes)
+        self._drop(keys, prefixes)
+        self.stats["invalidations"] += 1
+        await self._relay.publish(
+            INVALIDATE_CHANNEL_KEY,
+            {"type": INVALIDATE_MESSAGE_TYPE, "payload": {"keys": keys, "prefixes": prefixes}},
+            shared=True,
+        )
+
+    def handle_relay_message(self, message: dict[str, Any]) -> bool:
+        """다른 워커의 무효화 메시지면 반영하고 True."""
+        if message.get("type") != INVALIDATE_MESSAGE_TYPE:
+            return False
+        payload = message.get("payload") or {}
+        self._drop(
+            [str(key) for key in payload.get("keys") or ()],
+            [str(prefix) for prefix in payload.get("prefixes") or ()],
+        )
+        self.stats["remote_invalidations"] += 1
+        return True
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        lookups = self.stats["local_hits"] + self.stats["redis_hits"] + self.stats["loads"]
+        return {
+            **self.stats,
+            "coalesced": self._flight.stats["coalesced"],
+            "entries": len(self._entries),
+            "inflight": self._flight.inflight,
+            "local_hit_ratio": round(self.stats["local_hits"] / lookups, 3) if lookups else None,
+        }
+
+    async def _fill(self, key: str, loader: Callable[[], Awaitable[Any]], *, use_redis: bool) -> Any:
+        epoch = self._epoch
+        value = await self._relay.get_cache(key) if use_redis else None
+        if value is not None:
+            self.stats["redis_hits"] += 1
+        else:
+            self.stats["loads"] += 1
+            value = await loader()
+        if value is not None and epoch == self._epoch:
+            self.set_local(key, value)
+        return value
+
+    def _get_local(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _drop(self, keys: list[str], prefixes: list[str]) -> None:
+        self._epoch += 1
+        prefix_tuple = tuple(prefixes)
+        for key in keys:
+            self._entries.pop(key, None)
+        if prefix_tuple:
+            for key in [key for key in self._entries if key.startswith(prefix_tuple)]:
+                self._entries.pop(key, None)
+        self._flight.discard(keys, prefix_tuple)
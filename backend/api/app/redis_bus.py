@@ -35,6 +35,7 @@ class RedisBroadcastRelay:
         channel: str,
         source_instance_id: str | None = None,
         reconnect_delay_sec: float = 1.0,
+        per_game_channels: bool = False,
     ) -> None:
         self._redis_url = (redis_url or "").strip()
         self._channel = channel.strip() or "basehaptic:live_events"
@@ -44,6 +45,19 @@ class RedisBroadcastRelay:
         self._subscriber: Redis | None = None
         self._subscriber_task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        # per_game_channels: 경기(채널 키)별 Redis 채널로 publish 한다. 구독은 설정과 무관하게
+        # 공용 채널 + 이 워커에 소켓이 있는 키의 채널이다 (GameEventBus 의 register/disconnect 가 watch/unwatch 호출).
+        # 그래서 설정을 켜고 끄는 rolling restart 중에도 두 방식의 publish 를 모두 받는다.
+        self._per_game_channels = per_game_channels
+        self._watched: set[str] = set()
+        self._subscribed: set[str] = set()
+        self._pubsub: Any = None
+        self._sync_task: asyncio.Task | None = None
+        self._sync_pending = False
+        # Redis 채널 → 구독이 시작된 세대 번호. 재구독/재연결마다 바뀌어, 그 사이 메시지를 놓쳤을 수
+        # 있음을 호출자(replay buffer)가 알 수 있다.
+        self._channel_epochs: dict[str, int] = {}
+        self._epoch_counter = 0
         self.stats: dict[str, int] = {
             "publish_ok": 0,
             "publish_fail": 0,
@@ -52,6 +66,7 @@ class RedisBroadcastRelay:
             "sub_forwarded": 0,
             "sub_errors": 0,
             "sub_reconnects": 0,
+            "sub_channel_changes": 0,
         }
         self.subscribed_at: float | None = None
 
@@ -113,6 +128,11 @@ class RedisBroadcastRelay:
 
     async def stop(self) -> None:
         self._stop_event.set()
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sync_task
+            self._sync_task = None
         if self._subscriber_task is not None:
             self._subscriber_task.cancel()
             with suppress(asyncio.CancelledError):
@@ -133,8 +153,7 @@ class RedisBroadcastRelay:
         if not self.enabled or self._publisher is None:
             return
         try:
-            payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
-            await self._publisher.set(key, payload, ex=ttl_sec)
+            await self._publisher.set(key, self._encode_cache(value), ex=ttl_sec)
         except Exception:
             logger.debug("redis cache set failed: key=%s", key)
 
@@ -158,7 +177,57 @@ class RedisBroadcastRelay:
         except Exception:
             logger.debug("redis cache delete failed: key=%s", key)
 
-    async def publish(self, game_id: str, message: dict[str, Any]) -> None:
+    async def set_cache_with_list(
+        self,
+        key: str,
+        value: dict[str, Any],
+        *,
+        list_key: str,
+        items: list[dict[str, Any]],
+        max_items: int,
+        ttl_sec: int = 300,
+    ) -> None:
+        """key 에 value 를 SET 하고, list_key 리스트에 items 를 RPUSH + LTRIM(최근 max_items) + EXPIRE.
+
+        한 번의 MULTI 파이프라인이라 왕복 1회이고, 여러 워커가 동시에 써도 서로의 항목을 덮어쓰지 않는다.
+        """
+        if not self.enabled or self._publisher is None:
+            return
+        try:
+            pipe = self._publisher.pipeline()
+            pipe.set(key, self._encode_cache(value), ex=ttl_sec)
+            if items:
+                pipe.rpush(list_key, *(self._encode_cache(item) for item in items))
+                pipe.ltrim(list_key, -max_items, -1)
+            pipe.expire(list_key, ttl_sec)
+            await pipe.execute()
+        except Exception:
+            logger.debug("redis cache pipeline set failed: key=%s list_key=%s", key, list_key)
+
+    async def get_cache_with_list(
+        self,
+        key: str,
+        *,
+        list_key: str,
+        max_items: int,
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """GET key + LRANGE list_key(최근 max_items) 를 한 파이프라인으로 조회."""
+        if not self.enabled or self._publisher is None:
+            return None, []
+        try:
+            pipe = self._publisher.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.lrange(list_key, -max_items, -1)
+            raw_value, raw_items = await pipe.execute()
+            value = json.loads(raw_value) if raw_value is not None else None
+            items = [json.loads(raw) for raw in raw_items or ()]
+            return value, [item for item in items if isinstance(item, dict)]
+        except Exception:
+            logger.debug("redis cache pipeline get failed: key=%s list_key=%s", key, list_key)
+            return None, []
+
+    async def publish(self, game_id: str, message: dict[str, Any], *, shared: bool = False) -> None:
+        """shared=True 면 per-game 설정과 무관하게 모든 인스턴스가 구독하는 공용 채널로 보낸다."""
         if not self.enabled or self._publisher is None:
             return
 
@@ -172,7 +241,7 @@ class RedisBroadcastRelay:
             separators=(",", ":"),
         )
         try:
-            await self._publisher.publish(self._channel, payload)
+            await self._publisher.publish(self._channel if shared else self._channel_for(game_id), payload)
             self.stats["publish_ok"] += 1
         except (RedisConnectionError, RedisTimeoutError) as exc:
             self.stats["publish_fail"] += 1
@@ -194,7 +263,13 @@ class RedisBroadcastRelay:
                 if self._subscriber is None:
                     return
                 pubsub = self._subscriber.pubsub()
-                await pubsub.subscribe(self._channel)
+                # 공용 채널은 항상 구독 (per-game 을 안 쓰는 인스턴스의 publish 수신 + listen 유지용).
+                self._subscribed = {self._game_channel(key) for key in self._watched}
+                await pubsub.subscribe(self._channel, *self._subscribed)
+                self._pubsub = pubsub
+                self._channel_epochs = {}
+                self._mark_subscribed({self._channel, *self._subscribed})
+                self._schedule_subscription_sync()
                 self.subscribed_at = _time.time()
                 logger.warning(
                     "redis relay SUBSCRIBED channel=%s source=%s",
@@ -240,10 +315,94 @@ class RedisBroadcastRelay:
                 logger.exception("redis relay subscribe loop failed; reconnecting shortly")
                 await asyncio.sleep(self._reconnect_delay_sec)
             finally:
+                self._pubsub = None
+                self._subscribed = set()
+                self._channel_epochs = {}
                 if pubsub is not None:
                     with suppress(Exception):
                         await pubsub.aclose()
 
+    def watch(self, key: str) -> None:
+        """이 워커가 key(gameId/채널)의 소켓을 갖게 됨 → 해당 Redis 채널 구독."""
+        if key in self._watched:
+            return
+        self._watched.add(key)
+        self._schedule_subscription_sync()
+
+    def unwatch(self, key: str) -> None:
+        """key 의 마지막 소켓이 빠짐 → 해당 Redis 채널 구독 해제."""
+        if key not in self._watched:
+            return
+        self._watched.discard(key)
+        self._schedule_subscription_sync()
+
+    @property
+    def subscribed_channels(self) -> int:
+        return len(self._subscribed)
+
+    def channel_epoch(self, key: str) -> tuple[int, int] | None:
+        """key 메시지를 끊김 없이 수신 중인 구독 구간의 식별자. 구독 중이 아니면 None.
+
+        다른 인스턴스는 공용/경기별 채널 중 어느 쪽으로든 publish 할 수 있어 두 채널 구독이 모두 필요하다.
+        """
+        shared_epoch = self._channel_epochs.get(self._channel)
+        game_epoch = self._channel_epochs.get(self._game_channel(key))
+        if shared_epoch is None or game_epoch is None:
+            return None
+        return shared_epoch, game_epoch
+
+    def _mark_subscribed(self, channels: set[str]) -> None:
+        for channel in channels:
+            self._epoch_counter += 1
+            self._channel_epochs[channel] = self._epoch_counter
+
+    def _game_channel(self, key: str) -> str:
+        return f"{self._channel}:{key}"
+
+    def _channel_for(self, key: str) -> str:
+        """publish 대상 채널."""
+        return self._game_channel(key) if self._per_game_channels else self._channel
+
+    def _schedule_subscription_sync(self) -> None:
+        # watch/unwatch 는 동기 호출이라 원하는 상태(_watched)만 갱신하고, 실제 (un)subscribe 는
+        # 단일 task 가 diff 로 맞춘다. 호출 순서가 뒤섞여도 최종 구독 상태는 _watched 와 같다.
+        if self._pubsub is None:
+            return
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_pending = True
+            return
+        self._sync_task = asyncio.create_task(self._sync_subscriptions(), name="redis-relay-subscription-sync")
+
+    async def _sync_subscriptions(self) -> None:
+        while True:
+            self._sync_pending = False
+            pubsub = self._pubsub
+            if pubsub is None:
+                return
+            desired = {self._game_channel(key) for key in self._watched}
+            to_add = desired - self._subscribed
+            to_remove = self._subscribed - desired
+            try:
+                if to_add:
+                    await pubsub.subscribe(*to_add)
+                if to_remove:
+                    await pubsub.unsubscribe(*to_remove)
+            except Exception as exc:
+                # 구독 루프가 재연결하면서 _watched 전체를 다시 구독한다.
+                logger.warning("redis relay subscription sync failed: %s", exc)
+                return
+            self._subscribed = (self._subscribed | to_add) - to_remove
+            self._mark_subscribed(to_add)
+            for channel in to_remove:
+                self._channel_epochs.pop(channel, None)
+            self.stats["sub_channel_changes"] += len(to_add) + len(to_remove)
+            if not self._sync_pending:
+                return
+
+    @staticmethod
+    def _encode_cache(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
     def _create_client(self) -> Redis:
         return Redis.from_url(
             self._redis_url,
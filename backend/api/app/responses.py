@@ -0,0 +1,43 @@
+"""빠른 JSON 직렬화 모드 (opt-in: BASEHAPTIC_FAST_JSON_RESPONSES).
+
+- 켜면 앱 기본 응답 클래스를 orjson 기반 `OrjsonResponse` 로 바꾼다.
+- 큰 응답 endpoint 는 `prerendered()` 로 model_dump(mode="json") 결과를 바로 bytes 로 만들어
+  response_model 재검증/재직렬화를 건너뛴다.
+fastapi.responses.ORJSONResponse 는 최신 FastAPI 에서 deprecated 라 직접 둔다.
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from .config import get_settings
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ModuleNotFoundError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+
+class OrjsonResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def fast_json_enabled() -> bool:
+    return get_settings().fast_json_responses and _ORJSON_AVAILABLE
+
+
+def default_response_class() -> type[JSONResponse]:
+    return OrjsonResponse if fast_json_enabled() else JSONResponse
+
+
+def prerendered(content: BaseModel | dict[str, Any]) -> Any:
+    """fast 모드면 직렬화를 끝낸 Response, 아니면 그대로 돌려줘 FastAPI 기본 경로를 탄다."""
+    if not fast_json_enabled():
+        return content
+    if isinstance(content, BaseModel):
+        content = content.model_dump(mode="json")
+    return OrjsonResponse(content)
@@ -154,6 +154,15 @@ class CrawlerSnapshotRequest(BaseModel):
     notes: list[CrawlerGameNoteIn] | None = None
 
 
+class CrawlerSnapshotBatchItem(BaseModel):
+    gameId: str = Field(min_length=1, max_length=64)
+    snapshot: CrawlerSnapshotRequest
+
+
+class CrawlerSnapshotBatchRequest(BaseModel):
+    items: list[CrawlerSnapshotBatchItem] = Field(min_length=1, max_length=50)
+
+
 class CrawlerTeamRecordIn(BaseModel):
     upperCategoryId: str | None = Field(default=None, max_length=32)
     categoryId: str = Field(min_length=1, max_length=32)
@@ -195,6 +204,10 @@ class IngestResult(BaseModel):
     updatedAt: IsoDatetime
 
 
+class CrawlerSnapshotBatchResult(BaseModel):
+    items: list[IngestResult]
+
+
 class TeamRecordIngestResult(BaseModel):
     categoryId: str
     seasonCode: str
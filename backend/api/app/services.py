@@ -3,14 +3,15 @@ import json
 import logging
 import re
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import JSON, and_, case, cast, delete, func, literal_column, null, or_, select, true
 from sqlalchemy.orm import Session
 
+from .game_state_projection import game_state_projections, pitch_counts_from_rows
 from .models import Game, GameBatterStat, GameEvent, GameLineupSlot, GameNote, GamePitcherStat, TeamRecord
 from .schemas import (
     BaseStatus,
@@ -238,6 +239,77 @@ def _game_date_from_game_id(game_id: str) -> str | None:
     return None
 
 
+KST = timezone(timedelta(hours=9))
+
+
+def resolve_game_date(
+    game_id: str,
+    *,
+    payload_game_date: str | None = None,
+    existing: str | None = None,
+    started_at: datetime | None = None,
+) -> str | None:
+    """games.game_date 결정. 실제 근거가 없으면 None (NULL 로 두고 날짜 조회에서 빠진다).
+
+    game id → payload.gameDate → 기존 값 → 경기 시작 시각(KST) 순.
+    started_at 은 실제로 경기가 열린 시각(live_started_at, 또는 진행 중인 LIVE snapshot 의 observedAt)만 넘긴다.
+    예정 경기는 며칠 전에도, 종료 경기는 자정을 넘겨서도 관측되고 취소/연기 경기는 열리지 않았으므로,
+    관측 시각이나 현재 시각으로 날짜를 만들면 잘못된 날에 영구히 묶인다.
+    """
+    resolved = _game_date_from_game_id(game_id) or _normalize_game_date(payload_game_date) or existing
+    if resolved:
+        return resolved
+    if started_at is None:
+        return None
+    return ensure_utc(started_at).astimezone(KST).date().isoformat()
+
+
+# 실제로 경기가 열린 상태. 이 상태에서만 시작 시각으로 game_date 를 정한다.
+_PLAYED_GAME_STATUSES = frozenset({GameStatus.LIVE.value, GameStatus.FINISHED.value})
+
+
+def backfill_game_dates(db: Session, *, batch_size: int = 500) -> dict[str, int]:
+    """game_date 가 비어 있는 기존 경기를 resolve_game_date 규칙으로 채운다 (1회성 작업용).
+
+    id 에 날짜가 없으면 실제로 열린(LIVE/FINISHED) 경기의 live_started_at 만 근거로 쓴다.
+    observed_at/created_at 은 마지막 관측 시각이라 늦게 끝난 경기는 다음 날로 잡히고,
+    예정/취소/연기 경기는 시작 시각이 없으므로 채우지 않고 `skipped` 로 센다.
+    """
+    result = {"fixed": 0, "from_game_id": 0, "from_live_started_at": 0, "skipped": 0}
+    last_id = ""
+    while True:
+        games = db.execute(
+            select(Game)
+            .where(Game.game_date.is_(None), Game.id > last_id)
+            .order_by(Game.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not games:
+            return result
+        for game in games:
+            from_game_id = _game_date_from_game_id(game.id)
+            played = game.status in _PLAYED_GAME_STATUSES
+            game.game_date = from_game_id or resolve_game_date(
+                game.id, started_at=game.live_started_at if played else None,
+            )
+            if game.game_date is None:
+                result["skipped"] += 1
+                continue
+            result["from_game_id" if from_game_id else "from_live_started_at"] += 1
+            result["fixed"] += 1
+        last_id = games[-1].id
+        db.commit()
+
+
+def _game_started_at(game: Game, next_status: GameStatus, payload: CrawlerSnapshotRequest) -> datetime | None:
+    """game_date 근거가 되는 경기 시작 시각. 처음 받은 LIVE snapshot 이면 그 관측 시각이 곧 경기 중인 시각이다."""
+    if next_status.value not in _PLAYED_GAME_STATUSES:
+        return None
+    if game.live_started_at is not None:
+        return game.live_started_at
+    return payload.observedAt if next_status is GameStatus.LIVE else None
+
+
 _GAME_END_MARKERS: tuple[str, ...] = ("승리투수", "패전투수", "세이브투수")
 
 
@@ -255,6 +327,59 @@ def _has_game_end_signal(payload: CrawlerSnapshotRequest) -> bool:
     return False
 
 
+def merge_snapshots(payloads: list[CrawlerSnapshotRequest]) -> CrawlerSnapshotRequest:
+    """대기 중인 같은 경기 스냅샷들을 1건으로 병합 (latest-wins).
+
+    - 스코어/BSO/주자 등 상태 필드: observedAt 이 가장 최신인 스냅샷 (동률이면 나중에 도착한 것)
+    - events: sourceEventId 기준 합집합, 도착 순서 유지 (같은 id 는 나중 값으로 교체)
+    - 라인업/박스스코어/노트: 비어 있지 않은 것 중 가장 최신 스냅샷 값
+
+    insert_events 는 metadata 에 투수/타자가 없으면 스냅샷의 pitcher/batter 를 쓰는데, 병합본에는 최신 값만
+    남는다. 그래서 이전 스냅샷 이벤트에는 자기 스냅샷의 pitcher/batter 를 metadata 에 미리 채워 둔다.
+    """
+    if len(payloads) == 1:
+        return payloads[0]
+
+    def freshness(item: tuple[int, CrawlerSnapshotRequest]) -> tuple[datetime, int]:
+        index, payload = item
+        observed = ensure_utc(payload.observedAt) if payload.observedAt else datetime.min.replace(tzinfo=UTC)
+        return observed, index
+
+    ordered = [payload for _, payload in sorted(enumerate(payloads), key=freshness)]
+    latest = ordered[-1]
+
+    events: dict[str, CrawlerEventIn] = {}
+    for payload in payloads:
+        for event in payload.events:
+            if payload is not latest:
+                event = _with_snapshot_players(event, payload)
+            events[event.sourceEventId] = event
+
+    details: dict[str, Any] = {}
+    for field_name in ("lineupSlots", "batterStats", "pitcherStats", "notes"):
+        for payload in reversed(ordered):
+            value = getattr(payload, field_name)
+            if value:
+                details[field_name] = value
+                break
+
+    return latest.model_copy(update={"events": list(events.values()), **details})
+
+
+def _with_snapshot_players(event: CrawlerEventIn, payload: CrawlerSnapshotRequest) -> CrawlerEventIn:
+    """이벤트 metadata 에 투수/타자가 없으면 그 이벤트가 온 스냅샷의 pitcher/batter 로 채운다."""
+    resolved: dict[str, str] = {}
+    for key, keys, fallback in (
+        ("pitcher", _METADATA_PITCHER_KEYS, payload.pitcher),
+        ("batter", _METADATA_BATTER_KEYS, payload.batter),
+    ):
+        if fallback and _metadata_player_name(event.metadata, keys) is None:
+            resolved[key] = fallback
+    if not resolved:
+        return event
+    return event.model_copy(update={"metadata": {**(event.metadata or {}), **resolved}})
+
+
 def upsert_game_from_snapshot(db: Session, game_id: str, payload: CrawlerSnapshotRequest) -> Game:
     """게임 스냅샷 upsert.
 
@@ -375,11 +500,12 @@ def upsert_game_from_snapshot(db: Session, game_id: str, payload: CrawlerSnapsho
     game.base_third = incoming_b3
     game.pitcher = payload.pitcher
     game.batter = payload.batter
-    normalized_game_date = _game_date_from_game_id(game_id)
-    if normalized_game_date is None:
-        normalized_game_date = _normalize_game_date(payload.gameDate)
-    if normalized_game_date is not None:
-        game.game_date = normalized_game_date
+    game.game_date = resolve_game_date(
+        game_id,
+        payload_game_date=payload.gameDate,
+        existing=game.game_date,
+        started_at=_game_started_at(game, next_status, payload),
+    )
     start_time = _normalize_start_time(payload.startTime)
     if start_time is None and next_status == GameStatus.SCHEDULED:
         start_time = _normalize_start_time(payload.inning)
@@ -425,6 +551,10 @@ def upsert_game_from_snapshot(db: Session, game_id: str, payload: CrawlerSnapsho
     return game
 
 
+_METADATA_PITCHER_KEYS = ("pitcher", "pitcherName", "currentPitcher", "current_pitcher")
+_METADATA_BATTER_KEYS = ("batter", "batterName", "currentBatter", "current_batter")
+
+
 def _metadata_player_name(metadata: dict[str, Any] | None, keys: tuple[str, ...]) -> str | None:
     if metadata is None:
         return None
@@ -445,53 +575,105 @@ def _metadata_player_name(metadata: dict[str, Any] | None, keys: tuple[str, ...]
     return None
 
 
-_INSERT_EVENTS_CHUNK_SIZE = 100
+# 한 INSERT 문에 넣는 최대 row 수 (row 당 bind 9개 → PG 65535 / SQLite 32766 한도 내).
+_INSERT_EVENTS_CHUNK_SIZE = 500
 
 
-def _chunked_count(db: Session, game_id: str, source_ids: list[str]) -> int:
-    total = 0
-    for i in range(0, len(source_ids), _INSERT_EVENTS_CHUNK_SIZE):
-        chunk = source_ids[i : i + _INSERT_EVENTS_CHUNK_SIZE]
-        total += db.execute(
-            select(func.count())
-            .select_from(GameEvent)
-            .where(GameEvent.game_id == game_id, GameEvent.source_event_id.in_(chunk))
-        ).scalar_one()
-    return total
+def _is_postgresql(db: Session) -> bool:
+    return db.bind is not None and db.bind.dialect.name == "postgresql"
 
 
-def _chunked_needs_merge(db: Session, game_id: str, source_ids: list[str]) -> bool:
-    """Check if any matching events need backfill (null pitcher/batter or OTHER type)."""
-    for i in range(0, len(source_ids), _INSERT_EVENTS_CHUNK_SIZE):
-        chunk = source_ids[i : i + _INSERT_EVENTS_CHUNK_SIZE]
-        count = db.execute(
-            select(func.count())
-            .select_from(GameEvent)
-            .where(
-                GameEvent.game_id == game_id,
-                GameEvent.source_event_id.in_(chunk),
-                or_(
-                    GameEvent.pitcher.is_(None),
-                    GameEvent.batter.is_(None),
-                    GameEvent.event_type == EventType.OTHER.value,
-                ),
-            )
-        ).scalar_one()
-        if count > 0:
-            return True
-    return False
+def _event_upsert_statement(db: Session, rows: list[dict[str, Any]]):
+    """game_events bulk upsert: INSERT ... ON CONFLICT (game_id, source_event_id) DO UPDATE ... RETURNING.
 
+    기존 row 에 대한 backfill 규칙은 SQL 로 표현한다.
+      - event_type 이 OTHER 이고 새 값이 OTHER 가 아니면 교체
+      - description 은 새 값이 비어 있지 않으면 교체
+      - pitcher/batter 는 기존 값이 NULL 일 때만 채움
+      - payload_json 은 기존 object 에 새 metadata 를 얕게 병합 (새 metadata 가 없으면 유지)
+    바뀌는 값이 없으면 UPDATE 자체를 건너뛰어(WHERE) row lock/WAL 을 만들지 않는다.
 
-def _chunked_load(db: Session, game_id: str, source_ids: list[str]) -> dict[str, GameEvent]:
-    result: dict[str, GameEvent] = {}
-    for i in range(0, len(source_ids), _INSERT_EVENTS_CHUNK_SIZE):
-        chunk = source_ids[i : i + _INSERT_EVENTS_CHUNK_SIZE]
-        rows = db.execute(
-            select(GameEvent).where(GameEvent.game_id == game_id, GameEvent.source_event_id.in_(chunk))
-        ).scalars().all()
-        for row in rows:
-            result[row.source_event_id] = row
-    return result
+    PG 는 jsonb `||` 로 병합하고(기존 값이 NULL/JSON null/object 가 아니면 새 값으로 교체),
+    RETURNING 에 `xmax = 0`(이번에 insert 된 row) 을 함께 돌려준다.
+    SQLite 의 json_patch 는 RFC 7396 이라 null 값 key 를 지우고 중첩 object 를 깊게 병합하므로 쓰지 않고,
+    `_merge_existing_event_payloads` 가 Python 에서 미리 병합한 값을 excluded 로 넘긴다.
+    """
+    if _is_postgresql(db):
+        from sqlalchemy.dialects.postgresql import JSONB
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        stmt = dialect_insert(GameEvent).values(rows)
+        existing_json = cast(GameEvent.payload_json, JSONB)
+        incoming_json = cast(stmt.excluded.payload_json, JSONB)
+        # jsonb `||` 는 한쪽이 object 가 아니면(JSON null, 배열 등) 배열을 만들어 버리므로 둘 다 object 일 때만 병합한다.
+        both_objects = and_(
+            func.jsonb_typeof(existing_json) == "object",
+            func.jsonb_typeof(incoming_json) == "object",
+        )
+        merged_json = case((both_objects, existing_json.op("||")(incoming_json)), else_=incoming_json)
+        payload_changed = merged_json.is_distinct_from(existing_json)
+        next_payload_json = cast(merged_json, JSON)
+        returning = (GameEvent, literal_column("(xmax = 0)").label("inserted"))
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(GameEvent).values(rows)
+        next_payload_json = stmt.excluded.payload_json
+        payload_changed = true()  # 바뀌지 않는 metadata 는 미리 NULL 로 바꿔 둔다
+        returning = (GameEvent,)
+
+    excluded = stmt.excluded
+    other = EventType.OTHER.value
+    type_backfill = and_(GameEvent.event_type == other, excluded.event_type != other)
+    description_changed = and_(excluded.description != "", excluded.description != GameEvent.description)
+    pitcher_backfill = and_(GameEvent.pitcher.is_(None), excluded.pitcher.is_not(None))
+    batter_backfill = and_(GameEvent.batter.is_(None), excluded.batter.is_not(None))
+    has_metadata = excluded.payload_json.is_not(None)
+
+    return stmt.on_conflict_do_update(
+        index_elements=[GameEvent.game_id, GameEvent.source_event_id],
+        set_={
+            "event_type": case((type_backfill, excluded.event_type), else_=GameEvent.event_type),
+            "description": case((description_changed, excluded.description), else_=GameEvent.description),
+            "pitcher": func.coalesce(GameEvent.pitcher, excluded.pitcher),
+            "batter": func.coalesce(GameEvent.batter, excluded.batter),
+            "payload_json": case((has_metadata, next_payload_json), else_=GameEvent.payload_json),
+        },
+        where=or_(
+            type_backfill,
+            description_changed,
+            pitcher_backfill,
+            batter_backfill,
+            and_(has_metadata, payload_changed),
+        ),
+    ).returning(*returning)
+
+
+def _merge_existing_event_payloads(db: Session, game_id: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """SQLite 용: 이미 있는 row 의 payload_json 에 새 metadata 를 `{**old, **new}` 로 병합한 row 목록.
+
+    병합해도 그대로면 NULL 로 바꿔 UPDATE 대상에서 빠지게 한다 (PG 의 IS DISTINCT FROM 과 같은 효과).
+    """
+    source_ids = {row["source_event_id"] for row in rows if isinstance(row["payload_json"], dict)}
+    if not source_ids:
+        return rows
+    existing = dict(
+        db.execute(
+            select(GameEvent.source_event_id, GameEvent.payload_json).where(
+                GameEvent.game_id == game_id,
+                GameEvent.source_event_id.in_(source_ids),
+            )
+        ).all()
+    )
+    merged_rows: list[dict[str, Any]] = []
+    for row in rows:
+        source_id = row["source_event_id"]
+        if source_id in existing:
+            previous = existing[source_id] if isinstance(existing[source_id], dict) else {}
+            merged = {**previous, **row["payload_json"]}
+            row = {**row, "payload_json": null() if merged == existing[source_id] else merged}
+        merged_rows.append(row)
+    return merged_rows
 
 
 def insert_events(
@@ -501,75 +683,54 @@ def insert_events(
     fallback_pitcher: str | None = None,
     fallback_batter: str | None = None,
 ) -> tuple[list[GameEvent], int]:
+    """이벤트 bulk upsert. 반환: (새로 insert 된 이벤트 cursor 순, 중복 개수).
+
+    중복(DB 에 이미 있거나 같은 배치 안에서 반복된 sourceEventId)은 insert 하지 않고,
+    기존 row 는 `_event_upsert_statement` 의 backfill 규칙으로만 갱신한다.
+    500건 단위로 statement 1개씩이라 수백 건 backfill 도 1~2 round-trip 이다.
+    """
     if not events:
         return [], 0
 
-    source_ids = [item.sourceEventId for item in events]
-    unique_source_ids = list(dict.fromkeys(source_ids))
-
-    # Fast path: chunked COUNT to detect all-duplicate case without loading full objects
-    existing_count = _chunked_count(db, game_id, unique_source_ids)
-    if existing_count >= len(unique_source_ids):
-        # All events exist. Only skip full load if no backfill is needed.
-        if not _chunked_needs_merge(db, game_id, unique_source_ids):
-            return [], len(events)
-
-    # Slow path: chunked full load for partial-duplicate / new-events case
-    existing_by_source = _chunked_load(db, game_id, unique_source_ids)
-
-    inserted: list[GameEvent] = []
-    duplicate_count = 0
-    seen_in_batch: set[str] = set()
-
+    # SQLite 의 새 row 판별용 마커: insert 된 row 만 이 created_at 을 갖는다 (update 는 created_at 을 건드리지 않음).
+    # PG 는 RETURNING (xmax = 0) 으로 판별한다.
+    batch_created_at = now_utc()
+    rows_by_source: dict[str, dict[str, Any]] = {}
     for event_in in sorted(events, key=lambda item: ensure_utc(item.occurredAt)):
-        source_id = event_in.sourceEventId
-        normalized_event_type = normalize_event_type(event_in.type).value
-        event_pitcher = _metadata_player_name(
-            event_in.metadata,
-            ("pitcher", "pitcherName", "currentPitcher", "current_pitcher"),
-        ) or fallback_pitcher
-        event_batter = _metadata_player_name(
-            event_in.metadata,
-            ("batter", "batterName", "currentBatter", "current_batter"),
-        ) or fallback_batter
-        existing_event = existing_by_source.get(source_id)
-        if existing_event is not None:
-            duplicate_count += 1
-            if existing_event.event_type == EventType.OTHER.value and normalized_event_type != EventType.OTHER.value:
-                existing_event.event_type = normalized_event_type
-            if event_in.description and existing_event.description != event_in.description:
-                existing_event.description = event_in.description
-            if existing_event.pitcher is None and event_pitcher is not None:
-                existing_event.pitcher = event_pitcher
-            if existing_event.batter is None and event_batter is not None:
-                existing_event.batter = event_batter
-            if event_in.metadata:
-                existing_metadata = existing_event.payload_json if isinstance(existing_event.payload_json, dict) else {}
-                merged_metadata = {**existing_metadata, **event_in.metadata}
-                existing_event.payload_json = merged_metadata
-            continue
-
-        if source_id in seen_in_batch:
-            duplicate_count += 1
+        if event_in.sourceEventId in rows_by_source:
             continue
+        event_pitcher = _metadata_player_name(event_in.metadata, _METADATA_PITCHER_KEYS) or fallback_pitcher
+        event_batter = _metadata_player_name(event_in.metadata, _METADATA_BATTER_KEYS) or fallback_batter
+        rows_by_source[event_in.sourceEventId] = {
+            "game_id": game_id,
+            "source_event_id": event_in.sourceEventId,
+            "event_type": normalize_event_type(event_in.type).value,
+            "description": event_in.description,
+            "event_time": ensure_utc(event_in.occurredAt),
+            "pitcher": event_pitcher,
+            "batter": event_batter,
+            "haptic_pattern": event_in.hapticPattern,
+            # 빈 metadata 는 SQL NULL 로 보내 "병합할 것 없음" 을 표현한다.
+            "payload_json": event_in.metadata if event_in.metadata else null(),
+            "created_at": batch_created_at,
+        }
 
-        seen_in_batch.add(source_id)
-        event = GameEvent(
-            game_id=game_id,
-            source_event_id=source_id,
-            event_type=normalized_event_type,
-            description=event_in.description,
-            event_time=ensure_utc(event_in.occurredAt),
-            pitcher=event_pitcher,
-            batter=event_batter,
-            haptic_pattern=event_in.hapticPattern,
-            payload_json=event_in.metadata,
-        )
-        db.add(event)
-        inserted.append(event)
+    rows = list(rows_by_source.values())
+    is_postgresql = _is_postgresql(db)
+    inserted: list[GameEvent] = []
+    for i in range(0, len(rows), _INSERT_EVENTS_CHUNK_SIZE):
+        chunk = rows[i : i + _INSERT_EVENTS_CHUNK_SIZE]
+        if is_postgresql:
+            stmt = _event_upsert_statement(db, chunk)
+            returned = db.execute(stmt, execution_options={"populate_existing": True}).all()
+            inserted.extend(event for event, was_inserted in returned if was_inserted)
+        else:
+            stmt = _event_upsert_statement(db, _merge_existing_event_payloads(db, game_id, chunk))
+            returned = db.scalars(stmt, execution_options={"populate_existing": True}).all()
+            inserted.extend(event for event in returned if ensure_utc(event.created_at) == batch_created_at)
 
-    db.flush()
-    return inserted, duplicate_count
+    inserted.sort(key=lambda event: event.cursor)
+    return inserted, len(events) - len(inserted)
 
 
 def _source_event_cursor_map(db: Session, game_id: str, source_ids: set[str]) -> dict[str, int]:
@@ -685,18 +846,21 @@ def _batter_stats_from_snapshot(db: Session, game_id: str, batter_stats: list[Cr
         )
 
 
+def _dedup_pitcher_stats(pitcher_stats: list[CrawlerPitcherStatIn]) -> list[CrawlerPitcherStatIn]:
+    dedup: dict[tuple[str, str], CrawlerPitcherStatIn] = {}
+    for stat in pitcher_stats:
+        dedup_key = stat.playerId or f"{stat.playerName}#{stat.appearanceOrder or 0}"
+        dedup[(stat.teamSide, dedup_key)] = stat
+    return list(dedup.values())
+
+
 def _pitcher_stats_from_snapshot(db: Session, game_id: str, pitcher_stats: list[CrawlerPitcherStatIn]) -> None:
     db.execute(delete(GamePitcherStat).where(GamePitcherStat.game_id == game_id))
     if not pitcher_stats:
         return
 
     game = db.get(Game, game_id)
-    dedup: dict[tuple[str, str], CrawlerPitcherStatIn] = {}
-    for stat in pitcher_stats:
-        dedup_key = stat.playerId or f"{stat.playerName}#{stat.appearanceOrder or 0}"
-        dedup[(stat.teamSide, dedup_key)] = stat
-
-    for stat in dedup.values():
+    for stat in _dedup_pitcher_stats(pitcher_stats):
         player_team, game_date, home_team, away_team = _resolve_team_context(game, stat.teamSide)
         db.add(
             GamePitcherStat(
@@ -1301,10 +1465,38 @@ def _normalize_state_for_three_outs(
     return ball, strike, out, base_first, base_second, base_third, inning
 
 
+def record_snapshot_projection(
+    game: Game,
+    *,
+    previous_updated_at: datetime | None,
+    payload: CrawlerSnapshotRequest,
+    inserted_events: list[GameEvent],
+) -> None:
+    """ingest 결과를 in-memory 상태 projection 에 증분 반영해 build_game_state 의 DB 조회를 없앤다."""
+    pitch_counts = None
+    if payload.pitcherStats:
+        pitch_counts = pitch_counts_from_rows(
+            [
+                (stat.playerName, stat.appearanceOrder, stat.pitchesThrown)
+                for stat in _dedup_pitcher_stats(payload.pitcherStats)
+            ]
+        )
+    game_state_projections.apply_ingest(
+        game.id,
+        previous_version=previous_updated_at,
+        version=game.updated_at,
+        inserted_events=inserted_events,
+        event_types={event.sourceEventId: normalize_event_type(event.type).value for event in payload.events},
+        pitch_counts=pitch_counts,
+    )
+
+
 def build_game_state(db: Session, game: Game) -> GameStateOut:
-    latest_event = db.execute(
-        select(GameEvent).where(GameEvent.game_id == game.id).order_by(GameEvent.cursor.desc()).limit(1)
-    ).scalar_one_or_none()
+    # games row 외의 파생 값(마지막 이벤트, 활성 투수 투구수)은 projection 에서 읽는다.
+    # 미보유/버전 불일치(cold start, 다른 워커의 ingest)일 때만 DB 에서 재구성.
+    projection = game_state_projections.get(game.id, game.updated_at)
+    if projection is None:
+        projection = game_state_projections.load(db, game.id, game.updated_at)
     game_status = normalize_status(game.status)
     if game_status in {GameStatus.FINISHED, GameStatus.CANCELED, GameStatus.POSTPONED}:
         ball, strike, out = 0, 0, 0
@@ -1322,14 +1514,7 @@ def build_game_state(db: Session, game: Game) -> GameStateOut:
     pitcher_pitch_count: int | None = None
     if game.pitcher and game_status == GameStatus.LIVE:
         # 동명이인 가능성에 대비해 가장 최근 등판(appearance_order desc)을 활성 투수로 본다.
-        active = db.execute(
-            select(GamePitcherStat.pitches_thrown)
-            .where(GamePitcherStat.game_id == game.id, GamePitcherStat.player_name == game.pitcher)
-            .order_by(GamePitcherStat.appearance_order.desc().nullslast())
-            .limit(1)
-        ).scalar_one_or_none()
-        if active is not None:
-            pitcher_pitch_count = active
+        pitcher_pitch_count = projection.pitch_counts.get(game.pitcher)
 
     return GameStateOut(
         gameId=game.id,
@@ -1346,7 +1531,7 @@ def build_game_state(db: Session, game: Game) -> GameStateOut:
         pitcher=game.pitcher,
         batter=game.batter,
         pitcherPitchCount=pitcher_pitch_count,
-        lastEventType=normalize_event_type(latest_event.event_type) if latest_event else None,
-        lastEventAt=latest_event.event_time if latest_event else None,
+        lastEventType=normalize_event_type(projection.last_event_type) if projection.last_event_type else None,
+        lastEventAt=projection.last_event_at,
         updatedAt=game.updated_at,
     )
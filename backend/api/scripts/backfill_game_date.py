@@ -0,0 +1,98 @@
+"""games.game_date 가 비어 있는 기존 행을 1회 채우는 작업.
+
+채운 행 수와, `/games?date=` 조회가 LIKE fallback 쿼리에서 game_date 인덱스 조회로
+바뀐 실행 계획을 함께 출력한다. LIKE fallback 을 뺀 버전을 배포하기 전에 먼저 실행해야 한다.
+id 에 날짜가 없으면 실제로 열린 경기의 live_started_at 만 근거로 쓰고, 예정/취소/연기 경기와
+시작 시각이 없는 경기는 비워 둔다 (예정 경기는 시작된 뒤 snapshot 이 채운다).
+
+    python scripts/backfill_game_date.py [--date 2026-04-11] [--dry-run]
+"""
+import argparse
+import os
+from datetime import date
+from pathlib import Path
+
+
+API_ROOT = Path(__file__).resolve().parents[1]
+os.chdir(API_ROOT)
+
+import sys
+
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal, init_db
+from app.models import Game
+from app.services import backfill_game_dates
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Backfill games.game_date and report the query plan change")
+    parser.add_argument("--date", default=date.today().isoformat(), help="실행 계획 비교에 쓸 조회 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="채울 행 수와 실행 계획만 출력")
+    return parser
+
+
+def _legacy_date_query(target: date):
+    # backfill 전 list_games 의 날짜 조건 (game_date 가 비면 id prefix LIKE)
+    return select(Game.id).where(
+        or_(
+            Game.game_date == target.isoformat(),
+            and_(Game.game_date.is_(None), Game.id.like(f"{target.strftime('%Y%m%d')}%")),
+        )
+    ).order_by(Game.updated_at.desc())
+
+
+def _indexed_date_query(target: date):
+    return select(Game.id).where(Game.game_date == target.isoformat()).order_by(Game.updated_at.desc(), Game.id.desc())
+
+
+def _explain(db: Session, statement) -> list[str]:
+    dialect = db.get_bind().dialect
+    compiled = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN" if dialect.name == "sqlite" else "EXPLAIN"
+    rows = db.connection().exec_driver_sql(f"{prefix} {compiled}").all()
+    # sqlite: (id, parent, notused, detail), postgres: (QUERY PLAN,)
+    return [str(row[-1]) for row in rows]
+
+
+def _count_missing(db: Session) -> int:
+    return db.execute(select(func.count()).select_from(Game).where(Game.game_date.is_(None))).scalar_one()
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    target = date.fromisoformat(args.date)
+    init_db()
+
+    with SessionLocal() as db:
+        missing_before = _count_missing(db)
+        plan_before = _explain(db, _legacy_date_query(target))
+        print(f"[backfill] games without game_date: {missing_before}")
+
+        if args.dry_run:
+            result = {"fixed": 0, "from_game_id": 0, "from_live_started_at": 0, "skipped": 0}
+        else:
+            result = backfill_game_dates(db, batch_size=args.batch_size)
+        missing_after = _count_missing(db)
+        plan_after = _explain(db, _indexed_date_query(target))
+
+    print(
+        f"[backfill] fixed={result['fixed']} (from game id={result['from_game_id']}, "
+        f"from live_started_at={result['from_live_started_at']}) "
+        f"skipped without start date={result['skipped']} remaining={missing_after}"
+    )
+    print(f"[plan] before (game_date OR id LIKE, date={target.isoformat()}):")
+    for line in plan_before:
+        print(f"  {line}")
+    print("[plan] after (game_date = :date):")
+    for line in plan_after:
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
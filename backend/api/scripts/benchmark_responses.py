@@ -0,0 +1,151 @@
+"""응답 직렬화/압축 설정별 p50/p99 지연과 전송 bytes 비교.
+
+모드마다 설정(env)을 바꾼 하위 프로세스에서 임시 SQLite DB 에 경기/이벤트를 넣고
+TestClient 로 같은 요청을 반복한다. 지연은 프로세스 내부 처리 시간(네트워크 제외)이다.
+
+    python scripts/benchmark_responses.py [--requests 300] [--events 200] [--games 100]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+API_ROOT = Path(__file__).resolve().parents[1]
+
+MODES: dict[str, dict[str, str]] = {
+    "default": {"fast_json": "false", "compression": "false", "accept": "identity"},
+    "orjson": {"fast_json": "true", "compression": "false", "accept": "identity"},
+    "orjson+gzip": {"fast_json": "true", "compression": "true", "accept": "gzip"},
+    "orjson+br": {"fast_json": "true", "compression": "true", "accept": "br"},
+}
+BENCH_GAME_ID = "20260401BENCH0001"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization / compression modes")
+    parser.add_argument("--requests", type=int, default=300, help="경로별 측정 요청 수")
+    parser.add_argument("--events", type=int, default=200, help="벤치 경기에 넣을 이벤트 수")
+    parser.add_argument("--games", type=int, default=100, help="목록용 경기 수")
+    parser.add_argument("--min-bytes", type=int, default=1024, help="압축 최소 크기")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    return parser
+
+
+def _snapshot(index: int, events: int) -> dict:
+    return {
+        "homeTeam": "DOOSAN",
+        "awayTeam": "LG",
+        "status": "LIVE",
+        "inning": "7회말",
+        "homeScore": 3,
+        "awayScore": 2,
+        "ball": 1,
+        "strike": 2,
+        "out": 1,
+        "bases": {"first": True, "second": False, "third": False},
+        "pitcher": "김투수",
+        "batter": "이타자",
+        "observedAt": "2026-04-01T10:00:00Z",
+        "events": [
+            {
+                "sourceEventId": f"bench-{index}-{seq}",
+                "type": "BALL" if seq % 3 else "STRIKE",
+                "description": f"{seq}구 볼 - 바깥쪽 높은 직구 145km",
+                "occurredAt": "2026-04-01T09:59:00Z",
+                "hapticPattern": "BALL",
+            }
+            for seq in range(events)
+        ],
+    }
+
+
+def _percentile(samples: list[float], ratio: float) -> float:
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))], 2)
+
+
+def run_worker(mode: str, args: argparse.Namespace) -> dict:
+    # 설정은 app import 시점에 읽히므로 env 는 부모 프로세스가 넣어 준다.
+    sys.path.insert(0, str(API_ROOT))
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    accept = MODES[mode]["accept"]
+    headers = {"X-API-Key": os.environ["BASEHAPTIC_CRAWLER_API_KEY"]}
+    results: dict[str, dict] = {}
+    with TestClient(app) as client:
+        client.post(f"/internal/crawler/games/{BENCH_GAME_ID}/snapshot", headers=headers, json=_snapshot(0, args.events))
+        for index in range(1, args.games):
+            client.post(f"/internal/crawler/games/20260401BENCH{index:04d}/snapshot", headers=headers, json=_snapshot(index, 0))
+
+        paths = [
+            f"/games/{BENCH_GAME_ID}/events?limit=200",
+            "/games?limit=100",
+            f"/games/{BENCH_GAME_ID}/state",
+        ]
+        for path in paths:
+            for _ in range(10):
+                client.get(path, headers={"Accept-Encoding": accept})
+            samples: list[float] = []
+            wire_bytes = 0
+            for _ in range(args.requests):
+                started = time.perf_counter()
+                response = client.get(path, headers={"Accept-Encoding": accept})
+                samples.append((time.perf_counter() - started) * 1000)
+                wire_bytes = int(response.headers.get("content-length", len(response.content)))
+            results[path] = {
+                "p50Ms": _percentile(samples, 0.5),
+                "p99Ms": _percentile(samples, 0.99),
+                "bytes": wire_bytes,
+                "encoding": response.headers.get("content-encoding", "identity"),
+            }
+    return results
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args)))
+        return
+
+    from app.compression import BROTLI_AVAILABLE
+
+    report: dict[str, dict] = {}
+    for mode, options in MODES.items():
+        if options["accept"] == "br" and not BROTLI_AVAILABLE:
+            print(f"[bench] skip {mode}: brotli package not installed")
+            continue
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "BASEHAPTIC_DATABASE_URL": f"sqlite+pysqlite:///{Path(tmp, 'bench.db').as_posix()}",
+                "BASEHAPTIC_REDIS_URL": "",
+                "BASEHAPTIC_CRAWLER_API_KEY": "bench-key",
+                "BASEHAPTIC_FAST_JSON_RESPONSES": options["fast_json"],
+                "BASEHAPTIC_RESPONSE_COMPRESSION": options["compression"],
+                "BASEHAPTIC_RESPONSE_COMPRESSION_MIN_BYTES": str(args.min_bytes),
+            }
+            command = [
+                sys.executable, __file__, "--worker", mode,
+                "--requests", str(args.requests), "--events", str(args.events), "--games", str(args.games),
+            ]
+            completed = subprocess.run(command, env=env, cwd=API_ROOT, capture_output=True, text=True, check=True)
+            report[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    print(f"{'path':<44} {'mode':<12} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>9} encoding")
+    for path in next(iter(report.values())):
+        for mode, results in report.items():
+            row = results[path]
+            print(f"{path:<44} {mode:<12} {row['p50Ms']:>8} {row['p99Ms']:>8} {row['bytes']:>9} {row['encoding']}")
+
+
+if __name__ == "__main__":
+    if str(API_ROOT) not in sys.path:
+        sys.path.insert(0, str(API_ROOT))
+    main()
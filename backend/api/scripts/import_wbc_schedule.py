@@ -17,6 +17,7 @@ if str(API_ROOT) not in sys.path:
     sys.path.insert(0, str(API_ROOT))
 
 from app.db import SessionLocal, init_db
+from app.ingest_coordinator import ingest_coordinator
 from app.schemas import BaseStatus, CrawlerSnapshotRequest
 from app.services import upsert_game_from_snapshot
 
@@ -217,6 +218,9 @@ def main() -> None:
 
     init_db()
     with SessionLocal() as db:
+        # 라이브 ingest 와 같은 gameId advisory lock 을 잡아 row lock 경합 대신 순서대로 대기한다.
+        game_ids = [str(game.get("gameId") or "").strip() for game in games]
+        ingest_coordinator.lock_transaction(db, [game_id for game_id in game_ids if game_id])
         upserted = 0
         for game in games:
             game_id = str(game.get("gameId") or "").strip()
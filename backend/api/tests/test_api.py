@@ -1,8 +1,16 @@
+import asyncio
+import json
 import os
+import random
 import sys
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import patch
 
+import httpx
 from fastapi.testclient import TestClient
 from sqlalchemy.exc import OperationalError
 
@@ -21,9 +29,28 @@ os.environ["BASEHAPTIC_CORS_ALLOW_ORIGINS"] = "*"
 
 from app.main import app  # noqa: E402
 from app import main as main_module  # noqa: E402
+from app import apns as apns_module  # noqa: E402
+from app import fcm as fcm_module  # noqa: E402
+from app import responses as responses_module  # noqa: E402
+from app import services as services_module  # noqa: E402
 from app.db import SessionLocal  # noqa: E402
+from app.event_bus import GameEventBus  # noqa: E402
+from app.game_event_replay import GameEventReplayBuffer  # noqa: E402
+from app.live_activity_throttle import LiveActivityThrottle  # noqa: E402
+from app.push_coalescer import GamePushCoalescer  # noqa: E402
+from app.push_token_pruning import classify_fcm_error_code  # noqa: E402
+from app.read_cache import TwoTierCache  # noqa: E402
+from app.redis_bus import RedisBroadcastRelay  # noqa: E402
+from app.ingest_coordinator import SnapshotIngestCoordinator  # noqa: E402
 from app.models import Game, GameBatterStat, GameEvent, GameLineupSlot, GameNote, GamePitcherStat, TeamRecord  # noqa: E402
-from app.services import _event_out_count, normalize_event_type, normalize_status  # noqa: E402
+from app.schemas import CrawlerSnapshotRequest  # noqa: E402
+from app.services import (  # noqa: E402
+    _event_out_count,
+    backfill_game_dates,
+    merge_snapshots,
+    normalize_event_type,
+    normalize_status,
+)
 
 
 def sample_snapshot() -> dict:
@@ -807,6 +834,132 @@ def test_duplicate_events_upgrade_other_to_half_inning_change() -> None:
             assert stored.payload_json.get("defenseTeam") == "Korea"
 
 
+def test_bulk_event_upsert_spans_chunks_and_merges_metadata() -> None:
+    with TestClient(app) as client:
+        game_id = "20250501SSSK02025_BULK"
+        payload = sample_snapshot()
+        payload["events"] = [
+            {
+                "sourceEventId": f"bulk-{index:04d}",
+                "type": "BALL",
+                "description": f"pitch {index}",
+                "occurredAt": f"2026-02-17T08:{index // 60 % 60:02d}:{index % 60:02d}Z",
+                "metadata": {"seq": index},
+            }
+            for index in range(620)
+        ]
+        payload["events"].append(dict(payload["events"][0]))
+
+        first = client.post(
+            f"/internal/crawler/games/{game_id}/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=payload,
+        )
+        assert first.status_code == 200
+        assert first.json()["insertedEvents"] == 620
+        assert first.json()["duplicateEvents"] == 1
+
+        rerun = sample_snapshot()
+        rerun["events"] = [dict(payload["events"][0], metadata={"extra": True, "note": None, "pitch": {"speed": 145}})]
+        second = client.post(
+            f"/internal/crawler/games/{game_id}/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=rerun,
+        )
+        assert second.status_code == 200
+        assert second.json()["insertedEvents"] == 0
+        assert second.json()["duplicateEvents"] == 1
+
+        # PG 의 jsonb || 와 같은 얕은 병합: null 값 key 는 남고, 중첩 object 는 통째로 교체
+        rerun["events"] = [dict(payload["events"][0], metadata={"pitch": {"type": "FB"}})]
+        assert client.post(
+            f"/internal/crawler/games/{game_id}/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=rerun,
+        ).json()["insertedEvents"] == 0
+
+        with SessionLocal() as db:
+            events = (
+                db.query(GameEvent)
+                .filter(GameEvent.game_id == game_id)
+                .order_by(GameEvent.cursor.asc())
+                .all()
+            )
+            assert [event.source_event_id for event in events[:2]] == ["bulk-0000", "bulk-0001"]
+            assert events[0].payload_json == {"seq": 0, "extra": True, "note": None, "pitch": {"type": "FB"}}
+
+
+def test_postgres_event_upsert_merges_payload_only_when_both_sides_are_objects() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    row = {
+        "game_id": "G1",
+        "source_event_id": "e1",
+        "event_type": "BALL",
+        "description": "",
+        "event_time": datetime(2026, 2, 17, tzinfo=UTC),
+        "pitcher": None,
+        "batter": None,
+        "haptic_pattern": None,
+        "payload_json": {"seq": 1},
+        "created_at": datetime(2026, 2, 17, tzinfo=UTC),
+    }
+    with SessionLocal() as db, patch.object(services_module, "_is_postgresql", return_value=True):
+        statement = services_module._event_upsert_statement(db, [row])
+    sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split()).replace("::VARCHAR", "")
+
+    # JSON null / 배열과 || 하면 배열이 되므로, 둘 다 object 일 때만 병합하고 아니면 새 값으로 교체한다.
+    assert (
+        "CASE WHEN (jsonb_typeof(CAST(game_events.payload_json AS JSONB)) = %(jsonb_typeof_1)s "
+        "AND jsonb_typeof(CAST(excluded.payload_json AS JSONB)) = %(jsonb_typeof_2)s) "
+        "THEN CAST(game_events.payload_json AS JSONB) || CAST(excluded.payload_json AS JSONB) "
+        "ELSE CAST(excluded.payload_json AS JSONB) END"
+    ) in sql
+    assert "coalesce(CAST(game_events.payload_json" not in sql
+
+
+def test_game_state_projection_applies_ingest_without_reload() -> None:
+    with TestClient(app) as client:
+        game_id = "20250501SSSK02025_PROJ"
+        first = client.post(
+            f"/internal/crawler/games/{game_id}/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=sample_snapshot(),
+        )
+        assert first.status_code == 200
+
+        payload = sample_snapshot()
+        payload["observedAt"] = "2026-02-17T09:01:00Z"
+        payload["events"] = [
+            {
+                "sourceEventId": "relay-003",
+                "type": "OUT",
+                "description": "fly out",
+                "occurredAt": "2026-02-17T09:00:50Z",
+            }
+        ]
+        payload["pitcherStats"][0]["pitchesThrown"] = 91
+        with patch.object(
+            main_module.game_state_projections, "load", side_effect=AssertionError("projection reloaded")
+        ):
+            second = client.post(
+                f"/internal/crawler/games/{game_id}/snapshot",
+                headers={"X-API-Key": "test-key"},
+                json=payload,
+            )
+            assert second.status_code == 200
+            state = client.get(f"/games/{game_id}/state")
+
+        assert state.status_code == 200
+        assert state.json()["lastEventType"] == "OUT"
+        assert state.json()["pitcherPitchCount"] == 91
+
+        main_module.game_state_projections.invalidate(game_id)
+        reloaded = client.get(f"/games/{game_id}/state")
+        assert reloaded.json()["lastEventType"] == "OUT"
+        assert reloaded.json()["pitcherPitchCount"] == 91
+
+
 def test_list_games_filters_by_date() -> None:
     with TestClient(app) as client:
         payload_a = sample_snapshot()
@@ -863,6 +1016,76 @@ def test_list_games_filters_by_game_date_column() -> None:
         assert "WBCGAMEB001" not in ids
 
 
+def test_game_date_is_always_set_and_backfilled() -> None:
+    with TestClient(app) as client:
+        payload = sample_snapshot()
+        payload["observedAt"] = "2026-05-01T16:30:00Z"  # KST 5/2 01:30
+        response = client.post(
+            "/internal/crawler/games/CUSTOMGAME-NODATE/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=payload,
+        )
+        assert response.status_code == 200
+        ids = [item["id"] for item in client.get("/games?date=2026-05-02").json()]
+        assert "CUSTOMGAME-NODATE" in ids
+
+        # 예정 경기는 관측/현재 시각으로 날짜를 만들지 않는다 → 나중에 실제 근거가 오면 그때 채움
+        scheduled = sample_snapshot()
+        scheduled.update(status="SCHEDULED", observedAt="2026-05-01T01:00:00Z")
+        assert client.post(
+            "/internal/crawler/games/CUSTOMGAME-PREANNOUNCED/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=scheduled,
+        ).status_code == 200
+        with SessionLocal() as db:
+            assert db.get(Game, "CUSTOMGAME-PREANNOUNCED").game_date is None
+        scheduled["gameDate"] = "2026-05-04"
+        assert client.post(
+            "/internal/crawler/games/CUSTOMGAME-PREANNOUNCED/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=scheduled,
+        ).status_code == 200
+        assert "CUSTOMGAME-PREANNOUNCED" in [item["id"] for item in client.get("/games?date=2026-05-04").json()]
+
+        # 연기된 경기는 열리지 않았으므로 관측 시각으로 날짜를 만들지 않는다.
+        postponed = sample_snapshot()
+        postponed.update(status="POSTPONED", observedAt="2026-05-05T01:00:00Z")
+        assert client.post(
+            "/internal/crawler/games/CUSTOMGAME-POSTPONED/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=postponed,
+        ).status_code == 200
+        with SessionLocal() as db:
+            assert db.get(Game, "CUSTOMGAME-POSTPONED").game_date is None
+
+    with SessionLocal() as db:
+        db.add(Game(id="20260503BKFL0", home_team="a", away_team="b"))
+        # 18:30 KST 에 시작해 자정을 넘겨 끝난 경기: 마지막 관측 시각이 아니라 시작 시각의 날짜.
+        db.add(Game(
+            id="LEGACY-BKFL", home_team="a", away_team="b", status="FINISHED",
+            live_started_at=datetime(2026, 5, 3, 9, 30, tzinfo=UTC),
+            observed_at=datetime(2026, 5, 3, 15, 20, tzinfo=UTC),
+        ))
+        db.add(Game(
+            id="LEGACY-BKFL-NOSTART", home_team="a", away_team="b", status="FINISHED",
+            observed_at=datetime(2026, 5, 3, 15, 20, tzinfo=UTC),
+        ))
+        db.add(Game(id="LEGACY-BKFL-SCHEDULED", home_team="a", away_team="b", observed_at=datetime(2026, 5, 3, 3, 0, tzinfo=UTC)))
+        db.add(Game(
+            id="LEGACY-BKFL-POSTPONED", home_team="a", away_team="b", status="POSTPONED",
+            observed_at=datetime(2026, 5, 3, 3, 0, tzinfo=UTC),
+        ))
+        db.commit()
+        result = backfill_game_dates(db, batch_size=1)
+        assert result["fixed"] >= 2 and result["from_game_id"] >= 1 and result["from_live_started_at"] >= 1
+        assert result["skipped"] >= 3
+        assert db.get(Game, "20260503BKFL0").game_date == "2026-05-03"
+        assert db.get(Game, "LEGACY-BKFL").game_date == "2026-05-03"
+        assert db.get(Game, "LEGACY-BKFL-NOSTART").game_date is None
+        assert db.get(Game, "LEGACY-BKFL-SCHEDULED").game_date is None
+        assert db.get(Game, "LEGACY-BKFL-POSTPONED").game_date is None
+
+
 def test_list_games_filters_by_new_status_values() -> None:
     with TestClient(app) as client:
         canceled_payload = sample_snapshot()
@@ -899,6 +1122,100 @@ def test_list_games_filters_by_new_status_values() -> None:
         assert "20260220STAT0001" not in postponed_ids
 
 
+def test_list_games_paginates_with_cursor_and_etag() -> None:
+    with TestClient(app) as client:
+        for index in range(5):
+            payload = sample_snapshot()
+            payload["gameDate"] = "2026-04-11"
+            response = client.post(
+                f"/internal/crawler/games/20260411PAGE000{index}/snapshot",
+                headers={"X-API-Key": "test-key"},
+                json=payload,
+            )
+            assert response.status_code == 200
+
+        for query in ("date=2026-04-11&limit=2", "limit=2"):
+            seen: list[str] = []
+            first = client.get(f"/games?{query}")
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+            cached = client.get(f"/games?{query}", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.content == b""
+
+            response = first
+            while True:
+                seen.extend(item["id"] for item in response.json())
+                next_cursor = response.headers.get("x-next-cursor")
+                if not next_cursor:
+                    break
+                response = client.get(f"/games?{query}&cursor={next_cursor}")
+                assert response.status_code == 200
+            assert len(seen) == len(set(seen))
+            # (gameDate, id) 내림차순 (날짜 없는 목록에는 다른 테스트 경기도 섞여 있다)
+            assert [game_id for game_id in seen if "PAGE" in game_id] == [
+                f"20260411PAGE000{index}" for index in range(4, -1, -1)
+            ]
+
+        # 목록에 들어 있는 경기가 갱신되면 ETag 가 바뀐다.
+        full = client.get("/games?date=2026-04-11&limit=5")
+        assert full.status_code == 200
+        payload = sample_snapshot()
+        payload["gameDate"] = "2026-04-11"
+        payload["homeScore"] = 9
+        payload["observedAt"] = "2026-02-17T09:05:00Z"
+        response = client.post(
+            "/internal/crawler/games/20260411PAGE0000/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=payload,
+        )
+        assert response.status_code == 200
+        refreshed = client.get("/games?date=2026-04-11&limit=5", headers={"If-None-Match": full.headers["etag"]})
+        assert refreshed.status_code == 200
+        assert refreshed.json()[-1]["id"] == "20260411PAGE0000"
+        assert refreshed.json()[-1]["homeScore"] == 9
+        assert client.get("/games?cursor=not-a-cursor").status_code == 400
+
+
+def test_list_games_cursor_is_stable_when_rows_update_between_pages() -> None:
+    with TestClient(app) as client:
+        game_ids = [f"20260412MOVE000{index}" for index in range(5)]
+        for game_id in game_ids:
+            payload = sample_snapshot()
+            payload["gameDate"] = "2026-04-12"
+            response = client.post(
+                f"/internal/crawler/games/{game_id}/snapshot", headers={"X-API-Key": "test-key"}, json=payload,
+            )
+            assert response.status_code == 200
+
+        for query in ("date=2026-04-12&limit=2", "status=LIVE&limit=2"):
+            first = client.get(f"/games?{query}")
+            seen = [item["id"] for item in first.json()]
+            next_cursor = first.headers["x-next-cursor"]
+
+            # 1페이지를 받은 뒤 뒤 페이지의 경기가 live ingest 로 갱신되어도 페이지 사이를 옮겨 다니지 않는다.
+            for game_id in game_ids:
+                if game_id not in seen:
+                    payload = sample_snapshot()
+                    payload["gameDate"] = "2026-04-12"
+                    payload["homeScore"] += 1
+                    payload["observedAt"] = datetime.now(UTC).isoformat()
+                    response = client.post(
+                        f"/internal/crawler/games/{game_id}/snapshot", headers={"X-API-Key": "test-key"}, json=payload,
+                    )
+                    assert response.status_code == 200
+                    break
+
+            while next_cursor:
+                response = client.get(f"/games?{query}&cursor={next_cursor}")
+                assert response.status_code == 200
+                seen.extend(item["id"] for item in response.json())
+                next_cursor = response.headers.get("x-next-cursor")
+
+            assert len(seen) == len(set(seen))
+            assert [game_id for game_id in seen if "MOVE" in game_id] == game_ids[::-1]
+
+
 def test_ingest_snapshot_does_not_regress_status_to_scheduled() -> None:
     with TestClient(app) as client:
         game_live = "20260221STAT0001"
@@ -1093,7 +1410,41 @@ def test_snapshot_ingest_retries_on_lock_timeout_and_succeeds() -> None:
 
         with (
             patch.object(main_module, "upsert_game_from_snapshot", side_effect=flaky_upsert),
-            patch.object(main_module.time, "sleep", return_value=None),
+            patch.object(main_module.time, "sleep", return_value=None) as sleep,
+        ):
+            response = client.post(
+                f"/internal/crawler/games/{game_id}/snapshot",
+                headers={"X-API-Key": "test-key"},
+                json=payload,
+            )
+
+        assert response.status_code == 200
+        assert calls["count"] == 2
+        # SQLite: 첫 재시도 전 0.2s 기준 equal jitter backoff (0.1 ~ 0.2s).
+        assert sleep.call_count == 1
+        (delay,) = sleep.call_args.args
+        assert 0.1 <= delay <= 0.2
+
+
+def test_snapshot_ingest_lock_timeout_retry_does_not_sleep_with_advisory_lock() -> None:
+    with TestClient(app) as client:
+        game_id = "20250501SSSK02025_PGRETRY"
+        payload = sample_snapshot()
+        original_upsert = main_module.upsert_game_from_snapshot
+        calls = {"count": 0}
+
+        def flaky_upsert(db, game_id: str, payload):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise _make_lock_timeout_error()
+            return original_upsert(db, game_id=game_id, payload=payload)
+
+        # PostgreSQL 경로 흉내: advisory lock 큐가 대기를 맡으므로 요청 스레드는 sleep 하지 않아야 한다.
+        with (
+            patch.object(main_module, "upsert_game_from_snapshot", side_effect=flaky_upsert),
+            patch.object(main_module.ingest_coordinator, "uses_advisory_lock", return_value=True),
+            patch.object(main_module.ingest_coordinator, "lock_transaction", return_value=True),
+            patch.object(main_module.time, "sleep", return_value=None) as sleep,
         ):
             response = client.post(
                 f"/internal/crawler/games/{game_id}/snapshot",
@@ -1103,6 +1454,7 @@ def test_snapshot_ingest_retries_on_lock_timeout_and_succeeds() -> None:
 
         assert response.status_code == 200
         assert calls["count"] == 2
+        sleep.assert_not_called()
 
 
 def test_snapshot_ingest_returns_503_when_lock_timeout_persists() -> None:
@@ -1127,6 +1479,976 @@ def test_snapshot_ingest_returns_503_when_lock_timeout_persists() -> None:
         assert response.json()["detail"] == "snapshot ingest busy; retry shortly"
 
 
+def test_snapshot_batch_ingest_applies_each_game() -> None:
+    with TestClient(app) as client:
+        unauthorized = client.post(
+            "/internal/crawler/snapshots",
+            headers={"X-API-Key": "wrong-key"},
+            json={"items": [{"gameId": "20250501SSSK02025_BATCH1", "snapshot": sample_snapshot()}]},
+        )
+        assert unauthorized.status_code == 401
+
+        second_payload = sample_snapshot()
+        second_payload["homeScore"] = 5
+        response = client.post(
+            "/internal/crawler/snapshots",
+            headers={"X-API-Key": "test-key"},
+            json={
+                "items": [
+                    {"gameId": "20250501SSSK02025_BATCH1", "snapshot": sample_snapshot()},
+                    {"gameId": "20250501SSSK02025_BATCH2", "snapshot": second_payload},
+                    {"gameId": "20250501SSSK02025_BATCH1", "snapshot": sample_snapshot()},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["gameId"] for item in items] == [
+            "20250501SSSK02025_BATCH1",
+            "20250501SSSK02025_BATCH2",
+            "20250501SSSK02025_BATCH1",
+        ]
+        assert [item["insertedEvents"] for item in items] == [2, 2, 0]
+        assert items[2]["duplicateEvents"] == 2
+
+        state = client.get("/games/20250501SSSK02025_BATCH2/state")
+        assert state.status_code == 200
+        assert state.json()["homeScore"] == 5
+
+        empty = client.post("/internal/crawler/snapshots", headers={"X-API-Key": "test-key"}, json={"items": []})
+        assert empty.status_code == 422
+
+
+def test_ingest_coordinator_retry_delay_is_jittered_with_floor() -> None:
+    coordinator = SnapshotIngestCoordinator(rng=random.Random(7))
+
+    delays = [coordinator.retry_delay(1.0) for _ in range(50)]
+
+    assert all(0.5 <= delay <= 1.0 for delay in delays)
+    assert len({round(delay, 6) for delay in delays}) > 1
+    assert coordinator.retry_delay(0.0) == 0.0
+    assert coordinator.snapshot_stats()["retry_backoffs"] == 51
+
+
+def test_ingest_coordinator_evicts_idle_game_locks() -> None:
+    coordinator = SnapshotIngestCoordinator()
+
+    with coordinator.hold(["G2", "G1", "G2"]):
+        assert coordinator.snapshot_stats()["active_games"] == 2
+    stats = coordinator.snapshot_stats()
+    assert stats["active_games"] == 0
+    assert stats["evicted"] == 2
+
+    with SessionLocal() as db:
+        assert coordinator.lock_transaction(db, ["G1"]) is False
+
+
+def test_ingest_coordinator_coalesces_queued_snapshots() -> None:
+    coordinator = SnapshotIngestCoordinator()
+    outcomes: dict[str, tuple[bool, list, object]] = {}
+
+    def queued_request(name: str) -> None:
+        with coordinator.claim("G1", name) as claim:
+            payloads = claim.payloads
+            if not claim.absorbed:
+                claim.resolve(f"write:{'+'.join(payloads)}")
+            outcomes[name] = (claim.absorbed, payloads, claim.ticket.result)
+
+    with coordinator.claim("G1", "first") as first:
+        assert first.payloads == ["first"]
+        second = threading.Thread(target=queued_request, args=("second",))
+        second.start()
+        while len(coordinator._locks["G1"].pending) < 1:
+            time.sleep(0.001)
+        third = threading.Thread(target=queued_request, args=("third",))
+        third.start()
+        while len(coordinator._locks["G1"].pending) < 2:
+            time.sleep(0.001)
+        first.resolve("write:first")
+
+    second.join(timeout=5)
+    third.join(timeout=5)
+    # 락을 먼저 잡은 쪽(순서 비보장)이 두 스냅샷을 병합해 한 번만 쓴다.
+    assert sorted(outcomes.values()) == [
+        (False, ["second", "third"], "write:second+third"),
+        (True, [], "write:second+third"),
+    ]
+    stats = coordinator.snapshot_stats()
+    assert stats["coalesced"] == 1
+    assert stats["active_games"] == 0
+
+
+def test_merge_snapshots_keeps_newest_state_and_event_union() -> None:
+    older = sample_snapshot()
+    newer = sample_snapshot()
+    newer["observedAt"] = "2026-02-17T09:00:05Z"
+    newer["homeScore"] = 4
+    newer["lineupSlots"] = None
+    newer["events"] = [
+        {
+            "sourceEventId": "relay-003",
+            "type": "OUT",
+            "description": "fly out",
+            "occurredAt": "2026-02-17T09:00:03Z",
+        }
+    ]
+
+    newer["pitcher"] = "Park Reliever"
+    newer["batter"] = "Lee Pinch"
+    older["events"][1]["metadata"] = {"batter": "Choi Leadoff"}
+
+    merged = merge_snapshots([CrawlerSnapshotRequest(**newer), CrawlerSnapshotRequest(**older)])
+
+    assert merged.homeScore == 4
+    assert merged.pitcher == "Park Reliever"
+    assert [event.sourceEventId for event in merged.events] == ["relay-003", "relay-001", "relay-002"]
+    assert merged.lineupSlots is not None and len(merged.lineupSlots) == 2
+    # 이전 스냅샷 이벤트는 자기 스냅샷의 투수/타자로 남는다. metadata 에 있던 값은 그대로 둔다.
+    players = {event.sourceEventId: event.metadata for event in merged.events}
+    assert players["relay-003"] is None
+    assert players["relay-001"] == {"inning": 7, "half": "bottom", "pitcher": "Kim Starter", "batter": "Moon Batter"}
+    assert players["relay-002"] == {"batter": "Choi Leadoff", "pitcher": "Kim Starter"}
+
+
+def test_snapshot_ingest_releases_game_lock_after_request() -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/internal/crawler/games/20250501SSSK02025_EVICT/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=sample_snapshot(),
+        )
+        assert response.status_code == 200
+        assert main_module.ingest_coordinator.snapshot_stats()["active_games"] == 0
+
+
+async def _wait_until(predicate: Callable[[], bool]) -> None:
+    while not predicate():
+        await asyncio.sleep(0)
+
+
+def test_event_bus_broadcast_encodes_frame_once() -> None:
+    class FakeWebSocket:
+        def __init__(self) -> None:
+            self.frames: list[str] = []
+
+        async def send_text(self, data: str) -> None:
+            self.frames.append(data)
+
+    async def scenario() -> tuple[GameEventBus, list[FakeWebSocket]]:
+        bus = GameEventBus()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for websocket in sockets:
+            await bus.register("G1", websocket)
+        await bus.broadcast("G1", {"type": "state", "payload": {"homeTeam": "두산", "homeScore": 3}})
+        await asyncio.wait_for(_wait_until(lambda: bus.stats["send_ok"] == 3), timeout=1)
+        return bus, sockets
+
+    bus, sockets = asyncio.run(scenario())
+
+    assert bus.stats["frames_encoded"] == 1
+    assert bus.stats["send_ok"] == 3
+    frames = {websocket.frames[0] for websocket in sockets}
+    assert len(frames) == 1
+    assert json.loads(frames.pop()) == {"type": "state", "payload": {"homeTeam": "두산", "homeScore": 3}}
+
+
+def test_event_bus_safe_send_reports_delivery_and_skips_dropped_sockets() -> None:
+    class FlakyWebSocket:
+        def __init__(self) -> None:
+            self.frames: list[str] = []
+            self.fail = False
+
+        async def send_text(self, data: str) -> None:
+            if self.fail:
+                raise RuntimeError("client gone")
+            self.frames.append(data)
+
+    async def scenario() -> tuple[GameEventBus, FlakyWebSocket, list[bool]]:
+        bus = GameEventBus()
+        websocket = FlakyWebSocket()
+        await bus.register("G1", websocket)
+        results = [await bus.safe_send(websocket, {"type": "pong"})]
+        websocket.fail = True
+        results.append(await bus.safe_send(websocket, {"type": "pong"}))
+        # 끊긴 뒤에는 writer 를 다시 만들지 않는다
+        results.append(await bus.safe_send(websocket, {"type": "pong"}))
+        await bus.broadcast("G1", {"type": "state", "payload": {}})
+        return bus, websocket, results
+
+    bus, websocket, results = asyncio.run(scenario())
+
+    assert results == [True, False, False]
+    assert len(websocket.frames) == 1
+    assert bus.snapshot_stats()["writers"] == 0
+
+
+def test_event_bus_drops_superseded_state_and_evicts_slow_consumer() -> None:
+    class StalledWebSocket:
+        def __init__(self) -> None:
+            self.release = asyncio.Event()
+            self.frames: list[dict] = []
+            self.closed_code: int | None = None
+
+        async def send_text(self, data: str) -> None:
+            await self.release.wait()
+            self.frames.append(json.loads(data))
+
+        async def close(self, code: int = 1000) -> None:
+            self.closed_code = code
+
+    async def scenario() -> tuple[GameEventBus, StalledWebSocket, StalledWebSocket, dict]:
+        bus = GameEventBus(max_pending_frames=4)
+        slow = StalledWebSocket()
+        stuck = StalledWebSocket()
+        await bus.register("G1", slow)
+        await bus.register("G1", stuck)
+        await bus.broadcast("G1", {"type": "events", "payload": {"items": [1]}})
+        await asyncio.sleep(0)  # writer 가 첫 프레임을 꺼내 send 에서 대기
+        for score in range(3):
+            await bus.broadcast("G1", {"type": "state", "payload": {"homeScore": score}})
+        await bus.broadcast("G1", {"type": "events", "payload": {"items": [2]}})
+        lag_stats = bus.snapshot_stats()
+
+        slow.release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        for index in range(3):
+            await bus.broadcast("G1", {"type": "events", "payload": {"items": [index]}})
+        await asyncio.sleep(0)
+        return bus, slow, stuck, lag_stats
+
+    bus, slow, stuck, lag_stats = asyncio.run(scenario())
+
+    assert lag_stats["connections_lagging"] == 2
+    assert lag_stats["slowest_connections"][0]["queuedFrames"] == 2
+    assert [frame["type"] for frame in slow.frames[:3]] == ["events", "state", "events"]
+    assert slow.frames[1]["payload"]["homeScore"] == 2
+    assert bus.stats["frames_superseded"] == 4
+    assert bus.stats["slow_consumer_evicted"] == 1
+    assert stuck.closed_code == 1013
+    assert bus.snapshot_stats()["connections_total"] == 1
+
+
+def test_redis_relay_subscribes_only_to_games_with_local_sockets() -> None:
+    class FakePubSub:
+        def __init__(self) -> None:
+            self.channels: set[str] = set()
+
+        async def subscribe(self, *channels: str) -> None:
+            self.channels.update(channels)
+
+        async def unsubscribe(self, *channels: str) -> None:
+            self.channels.difference_update(channels)
+
+    class FakeWebSocket:
+        async def send_text(self, data: str) -> None:
+            return None
+
+    async def settle() -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def scenario() -> tuple[set[str], set[str]]:
+        # 경기별 publish 가 꺼져 있어도 구독은 한다 (설정을 켜는 rolling restart 중 누락 방지)
+        relay = RedisBroadcastRelay(redis_url="redis://unused", channel="live", per_game_channels=False)
+        relay._pubsub = FakePubSub()
+        bus = GameEventBus()
+        bus.set_channel_listener(relay.watch, relay.unwatch)
+        first, second, other = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await bus.register("G1", first)
+        await bus.register("G1", second)
+        await bus.register("G2", other)
+        await settle()
+        after_register = set(relay._pubsub.channels)
+
+        await bus.disconnect("G1", first)
+        await settle()
+        assert relay._pubsub.channels == after_register
+        await bus.disconnect("G1", second)
+        await settle()
+        return after_register, set(relay._pubsub.channels)
+
+    after_register, after_disconnect = asyncio.run(scenario())
+
+    assert after_register == {"live:G1", "live:G2"}
+    assert after_disconnect == {"live:G2"}
+    assert RedisBroadcastRelay(redis_url="redis://unused", channel="live")._channel_for("G1") == "live"
+    assert RedisBroadcastRelay(
+        redis_url="redis://unused", channel="live", per_game_channels=True,
+    )._channel_for("G1") == "live:G1"
+
+
+def test_cache_game_data_appends_events_in_one_pipeline() -> None:
+    class FakePipeline:
+        def __init__(self, store: dict, log: list) -> None:
+            self.store, self.log, self.commands = store, log, []
+
+        def __getattr__(self, name: str):
+            return lambda *args, **kwargs: self.commands.append((name, args))
+
+        async def execute(self) -> list:
+            self.log.append([name for name, _ in self.commands])
+            results = []
+            for name, args in self.commands:
+                key = args[0]
+                if name == "set":
+                    self.store[key] = args[1]
+                elif name == "rpush":
+                    self.store.setdefault(key, []).extend(args[1:])
+                elif name == "ltrim":
+                    self.store[key] = self.store.get(key, [])[args[1]:]
+                elif name == "get":
+                    results.append(self.store.get(key))
+                elif name == "lrange":
+                    results.append(self.store.get(key, [])[args[1]:])
+            return results
+
+    class FakeRedis:
+        def __init__(self) -> None:
+            self.store: dict = {}
+            self.pipelines: list = []
+
+        def pipeline(self, transaction: bool = True) -> FakePipeline:
+            return FakePipeline(self.store, self.pipelines)
+
+    async def scenario() -> tuple:
+        fake = FakeRedis()
+        relay = RedisBroadcastRelay(redis_url="redis://unused", channel="live")
+        relay._publisher = fake
+        with patch.object(main_module, "redis_relay", relay):
+            for start in (1, 16):
+                events = [{"cursor": cursor} for cursor in range(start, start + 15)]
+                await main_module._cache_game_data("G1", {"status": "LIVE", "last": start}, events)
+            loaded = await main_module._load_game_initial_data_cached("G1")
+        return fake.pipelines, loaded
+
+    pipelines, (state, events) = asyncio.run(scenario())
+
+    assert pipelines[0] == ["set", "rpush", "ltrim", "expire"]
+    assert pipelines[-1] == ["get", "lrange"]
+    assert state == {"status": "LIVE", "last": 16}
+    assert [event["cursor"] for event in events] == list(range(11, 31))
+
+
+def test_game_websocket_resumes_after_cursor() -> None:
+    game_id = "20250501SSSK02025_REPLAY"
+    with TestClient(app) as client:
+        response = client.post(
+            f"/internal/crawler/games/{game_id}/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=sample_snapshot(),
+        )
+        assert response.status_code == 200
+        events = client.get(f"/games/{game_id}/events").json()["items"]
+        first_cursor, second_cursor = events[0]["cursor"], events[1]["cursor"]
+
+        main_module.game_event_replay.discard(game_id)
+        for expected_hits in (0, 1):  # 1회차: DB fallback 후 seed, 2회차: replay buffer
+            hits_before = main_module.game_event_replay.stats["hits"]
+            with client.websocket_connect(f"/ws/games/{game_id}?after={first_cursor}") as ws:
+                state = ws.receive_json()
+                assert state["type"] == "state"
+                replayed = ws.receive_json()
+                assert replayed["type"] == "events"
+                assert [item["cursor"] for item in replayed["payload"]["items"]] == [second_cursor]
+            assert main_module.game_event_replay.stats["hits"] - hits_before == expected_hits
+
+
+def test_game_event_replay_buffer_reports_gaps_as_miss() -> None:
+    buffer = GameEventReplayBuffer(max_events_per_game=2)
+    buffer.append("G1", [{"cursor": 10}, {"cursor": 12}], epoch=1)
+    assert buffer.replay("G1", 9, epoch=1) == [{"cursor": 10}, {"cursor": 12}]
+    assert buffer.replay("G1", 5, epoch=1) is None  # 10 이전 이벤트는 보장 못 함
+
+    buffer.append("G1", [{"cursor": 15}], epoch=1)  # 용량 2 → cursor 10 이 밀려남
+    assert buffer.replay("G1", 9, epoch=1) is None
+    assert buffer.replay("G1", 10, epoch=1) == [{"cursor": 12}, {"cursor": 15}]
+
+    assert buffer.replay("G1", 12, epoch=2) is None  # 재구독 → 그 사이 이벤트를 놓쳤을 수 있음
+    assert buffer.snapshot_stats()["games"] == 0
+    buffer.append("G2", [{"cursor": 20}], epoch=None)
+    assert buffer.snapshot_stats()["games"] == 0
+
+
+def test_game_event_replay_buffer_handles_out_of_order_batches() -> None:
+    buffer = GameEventReplayBuffer()
+    buffer.append("G1", [{"cursor": 10}, {"cursor": 11}], epoch=1)
+    buffer.append("G1", [{"cursor": 14}], epoch=1)
+    buffer.append("G1", [{"cursor": 13}, {"cursor": 12}], epoch=1)  # 먼저 만들어진 배치가 늦게 도착
+    buffer.append("G1", [{"cursor": 13}], epoch=1)  # 중복은 무시
+    assert [event["cursor"] for event in buffer.replay("G1", 10, epoch=1)] == [11, 12, 13, 14]
+    assert buffer.stats["reordered"] == 2
+
+    # floor(9) 이하 cursor 가 늦게 오면 "빠짐없음" 을 보장할 수 없어 DB 로 넘긴다
+    buffer.append("G1", [{"cursor": 8}], epoch=1)
+    assert buffer.replay("G1", 10, epoch=1) is None
+    assert buffer.stats["late_discards"] == 1
+
+
+def test_read_cache_single_flight_and_invalidation() -> None:
+    loads: list[int] = []
+
+    async def loader() -> dict:
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return {"version": len(loads)}
+
+    async def scenario() -> tuple:
+        cache = TwoTierCache(RedisBroadcastRelay(redis_url=None, channel="live"), ttl_sec=60)
+        concurrent = await asyncio.gather(*(cache.get_or_load("game:state:G1", loader) for _ in range(5)))
+        cached = await cache.get_or_load("game:state:G1", loader)
+        await cache.invalidate(keys=["game:state:G1"])
+        reloaded = await cache.get_or_load("game:state:G1", loader)
+        remote = cache.handle_relay_message({"type": "cache_invalidate", "payload": {"prefixes": ["game:"]}})
+        return concurrent, cached, reloaded, remote, cache.snapshot_stats()
+
+    concurrent, cached, reloaded, remote, stats = asyncio.run(scenario())
+
+    assert concurrent == [{"version": 1}] * 5
+    assert cached == {"version": 1}
+    assert reloaded == {"version": 2}
+    assert remote is True
+    assert stats["loads"] == 2
+    assert stats["coalesced"] == 4
+    assert stats["local_hits"] == 1
+    assert stats["entries"] == 0
+
+
+def test_ws_initial_load_misses_share_one_db_load() -> None:
+    calls: list[str] = []
+
+    def slow_load(game_id: str) -> tuple:
+        calls.append(game_id)
+        time.sleep(0.05)
+        return {"gameId": game_id}, [{"cursor": 1}]
+
+    async def scenario() -> list:
+        return await asyncio.gather(*(main_module._load_game_initial_data_cached("G-HERD") for _ in range(20)))
+
+    with patch.object(main_module, "_load_game_initial_data", side_effect=slow_load):
+        results = asyncio.run(scenario())
+        again = asyncio.run(main_module._load_game_initial_data_cached("G-HERD"))
+
+    assert calls == ["G-HERD", "G-HERD"]  # 동시 20건 → 1회, 끝난 뒤 새 접속은 다시 조회 (결과는 보관 안 함)
+    assert all(result == results[0] for result in results)
+    assert again == results[0]
+
+
+def test_game_state_read_is_refreshed_by_ingest() -> None:
+    game_id = "20250501SSSK02025_CACHE"
+    with TestClient(app) as client:
+        payload = sample_snapshot()
+        assert client.post(
+            f"/internal/crawler/games/{game_id}/snapshot", headers={"X-API-Key": "test-key"}, json=payload,
+        ).status_code == 200
+        assert client.get(f"/games/{game_id}/state").json()["homeScore"] == 3
+
+        payload["homeScore"] = 4
+        payload["observedAt"] = "2026-02-17T09:01:00Z"
+        assert client.post(
+            f"/internal/crawler/games/{game_id}/snapshot", headers={"X-API-Key": "test-key"}, json=payload,
+        ).status_code == 200
+        with patch.object(main_module, "_load_game_state_payload", side_effect=AssertionError("cache miss")):
+            assert client.get(f"/games/{game_id}/state").json()["homeScore"] == 4
+
+
+def test_apns_dispatcher_bounds_concurrency_and_patches_my_team() -> None:
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+            self.bodies: dict[str, list[dict]] = {}
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.001)
+            self.active -= 1
+            self.bodies.setdefault(url.rsplit("/", 1)[-1], []).append(json.loads(content))
+            return FakeResponse()
+
+    client = FakeClient()
+    dispatcher = apns_module.ApnsDispatcher(max_concurrency=4)
+    targets = [
+        apns_module.SilentPushTarget(token=f"tok{i}", my_team="베어스" if i % 2 else "트윈스", use_sandbox=False)
+        for i in range(30)
+    ]
+    payloads = [{"game_id": "G1", "event_cursor": 1}, {"game_id": "G1", "event_cursor": 2}]
+
+    with patch.object(apns_module, "_get_http_client", return_value=client), \
+            patch.object(apns_module, "_create_jwt_token", return_value="jwt"):
+        result = asyncio.run(dispatcher.send_silent(targets, payloads, label="test"))
+
+    assert result.sent == 30 and result.failed == 0 and result.requests == 60
+    assert client.peak <= 4
+    assert [body["event_cursor"] for body in client.bodies["tok1"]] == [1, 2]
+    assert client.bodies["tok1"][0] == {"aps": {"content-available": 1}, "game_id": "G1", "event_cursor": 1, "my_team": "베어스"}
+    assert client.bodies["tok2"][0]["my_team"] == "트윈스"
+    batch = dispatcher.snapshot_stats()["recent_batches"][-1]
+    assert batch["label"] == "test" and sum(batch["histogram"].values()) == 60
+
+
+def test_apns_visible_batch_uses_bounded_workers() -> None:
+    active = 0
+    peak = 0
+    tasks: set[asyncio.Task] = set()
+
+    async def fake_send_visible_push(token: str, **_: object) -> bool:
+        nonlocal active, peak
+        tasks.add(asyncio.current_task())
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return not token.endswith("7")
+
+    dispatcher = apns_module.ApnsDispatcher(max_concurrency=4)
+    tokens = [(f"visible{i}", False) for i in range(30)]
+    with patch.object(apns_module, "send_visible_push", side_effect=fake_send_visible_push):
+        failed = asyncio.run(dispatcher.send_visible(tokens, title="t", body="b"))
+
+    assert sorted(failed) == ["visible17", "visible27", "visible7"]
+    assert peak <= 4 and len(tasks) <= 4  # 토큰당 task 가 아니라 worker 4개
+    assert dispatcher.stats["visible_sent"] == 27 and dispatcher.stats["visible_failed"] == 3
+
+
+def test_apns_environment_fallback_is_persisted() -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int, text: str = "") -> None:
+            self.status_code = status_code
+            self.text = text
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.urls: list[str] = []
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            self.urls.append(url)
+            if url.startswith(apns_module.APNS_SANDBOX_URL):
+                return FakeResponse(200)
+            return FakeResponse(400, '{"reason":"BadEnvironmentKeyInToken"}')
+
+    token = "env-mismatch-token"
+    with TestClient(app) as client:
+        for game_id in ("G-ENV-1", "G-ENV-2"):
+            response = client.post(
+                "/device-tokens",
+                json={"token": token, "game_id": game_id, "my_team": "DOOSAN", "is_sandbox": False},
+            )
+            assert response.status_code == 200
+
+    fake = FakeClient()
+    events = [{"type": "HIT", "cursor": 1}, {"type": "SCORE", "cursor": 2}]
+    with patch.object(apns_module, "_get_http_client", return_value=fake), \
+            patch.object(apns_module, "_create_jwt_token", return_value="jwt"):
+        asyncio.run(main_module._send_push_for_game_events("G-ENV-1", {"gameId": "G-ENV-1"}, events))
+
+    # 첫 이벤트에서 production → sandbox 폴백, 같은 배치의 다음 이벤트는 sandbox 로 바로
+    assert [url.startswith(apns_module.APNS_SANDBOX_URL) for url in fake.urls] == [False, True, True]
+    with SessionLocal() as db:
+        rows = db.query(main_module.DeviceToken).filter(main_module.DeviceToken.token == token).all()
+        assert {row.game_id: row.is_sandbox for row in rows} == {"G-ENV-1": True, "G-ENV-2": True}
+
+
+def test_unregistered_push_tokens_are_pruned() -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int, text: str = "") -> None:
+            self.status_code = status_code
+            self.text = text
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.urls: list[str] = []
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            self.urls.append(url)
+            if url.endswith("/dead-token"):
+                return FakeResponse(410, '{"reason":"Unregistered"}')
+            return FakeResponse(200)
+
+    game_id = "G-PRUNE"
+    with TestClient(app) as client:
+        for token in ("dead-token", "live-token"):
+            assert client.post("/device-tokens", json={"token": token, "game_id": game_id}).status_code == 200
+        assert client.post("/live-activity-tokens", json={"token": "dead-token", "game_id": game_id}).status_code == 200
+        assert client.post("/team-subscriptions", json={"token": "dead-token", "my_team": "LG"}).status_code == 200
+
+    fake = FakeClient()
+    pruned_before = main_module.invalid_push_tokens.stats["pruned_device_tokens"]
+    events = [{"type": "HIT", "cursor": 1}, {"type": "SCORE", "cursor": 2}]
+    with patch.object(apns_module, "_get_http_client", return_value=fake), \
+            patch.object(apns_module, "_create_jwt_token", return_value="jwt"):
+        asyncio.run(main_module._send_push_for_game_events(game_id, {"gameId": game_id}, events))
+
+    assert sum(url.endswith("/dead-token") for url in fake.urls) == 1
+    assert sum(url.endswith("/live-token") for url in fake.urls) == 2
+    with SessionLocal() as db:
+        assert [row.token for row in db.query(main_module.DeviceToken).filter_by(game_id=game_id)] == ["live-token"]
+        assert db.query(main_module.LiveActivityToken).filter_by(token="dead-token").count() == 0
+        assert db.query(main_module.TeamSubscriptionToken).filter_by(token="dead-token").count() == 0
+    assert main_module.invalid_push_tokens.stats["pruned_device_tokens"] - pruned_before == 1
+    assert main_module.invalid_push_tokens.snapshot_stats()["pending"] == 0
+
+
+def test_bad_device_token_retries_other_environment_before_pruning() -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int, text: str = "") -> None:
+            self.status_code = status_code
+            self.text = text
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.urls: list[str] = []
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            self.urls.append(url)
+            # sandbox 토큰은 production 에서 BadDeviceToken, dead 토큰은 두 환경 모두 BadDeviceToken
+            if url.endswith("/sandbox-as-prod") and url.startswith(apns_module.APNS_SANDBOX_URL):
+                return FakeResponse(200)
+            return FakeResponse(400, '{"reason":"BadDeviceToken"}')
+
+    game_id = "G-BAD-TOKEN"
+    with TestClient(app) as client:
+        for token in ("sandbox-as-prod", "bad-everywhere"):
+            assert client.post(
+                "/device-tokens", json={"token": token, "game_id": game_id, "is_sandbox": False},
+            ).status_code == 200
+
+    fake = FakeClient()
+    with patch.object(apns_module, "_get_http_client", return_value=fake), \
+            patch.object(apns_module, "_create_jwt_token", return_value="jwt"):
+        asyncio.run(main_module._send_push_for_game_events(game_id, {"gameId": game_id}, [{"type": "HIT", "cursor": 1}]))
+
+    assert sum(url.endswith("/sandbox-as-prod") for url in fake.urls) == 2
+    assert sum(url.endswith("/bad-everywhere") for url in fake.urls) == 2
+    with SessionLocal() as db:
+        rows = {row.token: row.is_sandbox for row in db.query(main_module.DeviceToken).filter_by(game_id=game_id)}
+    assert rows == {"sandbox-as-prod": True}
+
+
+def test_push_coalescer_merges_events_within_window() -> None:
+    flushed: list[tuple[str, dict, list[int]]] = []
+
+    async def flush(game_id: str, state_payload: dict, events: list[dict]) -> None:
+        flushed.append((game_id, state_payload, [event["cursor"] for event in events]))
+
+    async def scenario() -> None:
+        coalescer = GamePushCoalescer(flush, window_sec=0.05)
+        await coalescer.submit("G1", {"homeScore": 0}, [{"type": "HIT", "cursor": 1}])
+        await coalescer.submit("G1", {"homeScore": 2}, [{"type": "SCORE", "cursor": 3}, {"type": "SCORE", "cursor": 2}])
+        await coalescer.submit("G2", {"homeScore": 0}, [{"type": "OUT", "cursor": 4}])
+        assert flushed == []  # submit 은 window 를 기다리지 않고 바로 반환
+        await asyncio.sleep(0.2)
+        assert len(flushed) == 2
+
+        # 다음 window 는 close() 가 기다리지 않고 바로 flush
+        await coalescer.submit("G1", {"homeScore": 2}, [{"type": "OUT", "cursor": 5}])
+        await asyncio.wait_for(coalescer.close(), timeout=0.04)
+        stats = coalescer.snapshot_stats()
+        assert stats["flushes"] == 3 and stats["merged"] == 1 and stats["pending_games"] == 0
+        assert stats["inflight_tasks"] == 0
+
+    asyncio.run(scenario())
+    assert flushed == [
+        ("G1", {"homeScore": 2}, [1, 2, 3]),
+        ("G2", {"homeScore": 0}, [4]),
+        ("G1", {"homeScore": 2}, [5]),
+    ]
+
+
+def test_coalesced_silent_push_carries_ordered_event_types() -> None:
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.bodies: list[dict] = []
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            self.bodies.append(json.loads(content))
+            return FakeResponse()
+
+    game_id = "G-COALESCE"
+    with TestClient(app) as client:
+        assert client.post("/device-tokens", json={"token": "coalesce-token", "game_id": game_id}).status_code == 200
+
+    fake = FakeClient()
+    events = [{"type": "HIT", "cursor": 11}, {"type": "SCORE", "cursor": 12}, {"type": "SCORE", "cursor": 13}]
+    with patch.object(apns_module, "_get_http_client", return_value=fake), \
+            patch.object(apns_module, "_create_jwt_token", return_value="jwt"), \
+            patch.object(main_module.settings, "push_coalesce_events", True):
+        asyncio.run(main_module._send_push_for_game_events(game_id, {"gameId": game_id, "homeScore": 3}, events))
+
+    assert len(fake.bodies) == 1
+    body = fake.bodies[0]
+    assert body["event_types"] == ["HIT", "SCORE", "SCORE"]
+    assert (body["event_type"], body["event_cursor"], body["home_score"]) == ("SCORE", 13, 3)
+
+
+def test_live_activity_throttle_diffs_and_rate_limits_per_game() -> None:
+    sent: list[tuple[str, str, int, str]] = []
+
+    async def send(game_id: str, content_state: dict, event_type: str, priority: int) -> None:
+        sent.append((game_id, content_state["inning"], priority, event_type))
+
+    def state(inning: str, home_score: int = 0) -> dict:
+        return {"homeScore": home_score, "awayScore": 0, "inning": inning}
+
+    async def scenario() -> LiveActivityThrottle:
+        throttle = LiveActivityThrottle(send, min_interval_sec=0.05)
+        await throttle.submit("G1", state("1회초"))
+        await throttle.submit("G1", state("1회초"))  # 변경 없음
+        started = time.monotonic()
+        await throttle.submit("G1", state("1회말"))  # 간격 안: 미룸
+        await throttle.submit("G1", state("2회초"))  # 미룬 상태를 최신으로 교체
+        # 미룬 전송은 throttle 의 task 가 맡으므로 호출자는 interval 만큼 기다리지 않는다.
+        assert time.monotonic() - started < 0.04
+        assert throttle.snapshot_stats()["inflight_tasks"] == 1
+        await asyncio.sleep(0.1)
+        await throttle.submit("G1", state("2회초", home_score=1))  # 점수 변경: 간격과 무관하게 바로
+        await throttle.submit("G1", state("2회초", home_score=1), "end")  # end 는 항상
+        return throttle
+
+    throttle = asyncio.run(scenario())
+    assert sent == [
+        ("G1", "1회초", 5, "update"),
+        ("G1", "2회초", 5, "update"),
+        ("G1", "2회초", 10, "update"),
+        ("G1", "2회초", 10, "end"),
+    ]
+    stats = throttle.snapshot_stats()
+    assert stats["skipped_unchanged"] == 1 and stats["sent_trailing"] == 1 and stats["games"] == 0
+    assert stats["inflight_tasks"] == 0
+
+
+def test_live_activity_throttle_close_flushes_held_update() -> None:
+    sent: list[tuple[str, str, int]] = []
+
+    async def send(game_id: str, content_state: dict, event_type: str, priority: int) -> None:
+        sent.append((game_id, content_state["inning"], priority))
+
+    async def scenario() -> LiveActivityThrottle:
+        throttle = LiveActivityThrottle(send, min_interval_sec=30.0)
+        await throttle.submit("G1", {"homeScore": 0, "awayScore": 0, "inning": "1회초"})
+        await throttle.submit("G1", {"homeScore": 0, "awayScore": 0, "inning": "1회말"})
+        started = time.monotonic()
+        await throttle.close()  # 30초를 기다리지 않고 미룬 상태를 바로 보낸다.
+        assert time.monotonic() - started < 1.0
+        return throttle
+
+    throttle = asyncio.run(scenario())
+    assert sent == [("G1", "1회초", 5), ("G1", "1회말", 5)]
+    stats = throttle.snapshot_stats()
+    assert stats["sent_trailing"] == 1 and stats["pending_games"] == 0 and stats["inflight_tasks"] == 0
+
+
+def test_game_start_notification_uses_team_index_and_stages_sends() -> None:
+    class FakeRedis:
+        def __init__(self) -> None:
+            self.store: dict = {}
+
+        async def get(self, key: str):
+            return self.store.get(key)
+
+        async def set(self, key: str, value, ex: int | None = None) -> None:
+            self.store[key] = value
+
+        async def delete(self, key: str) -> None:
+            self.store.pop(key, None)
+
+    with TestClient(app) as client:
+        for index in range(5):
+            response = client.post("/team-subscriptions", json={"token": f"hanwha-ios-{index}", "my_team": "HANWHA"})
+            assert response.status_code == 200
+        response = client.post(
+            "/team-subscriptions", json={"token": "hanwha-android", "my_team": "한화", "platform": "android"},
+        )
+        assert response.status_code == 200
+        assert client.post("/team-subscriptions", json={"token": "ssg-ios", "my_team": "SSG"}).status_code == 200
+
+    ios_stages: list[list[str]] = []
+
+    async def fake_send_visible(self, tokens_with_sandbox, **_: object) -> list[str]:
+        ios_stages.append([token for token, _ in tokens_with_sandbox])
+        return []
+
+    async def fake_send_fcm(tokens: list[str], **_: object) -> list[str]:
+        android.extend(tokens)
+        return []
+
+    android: list[str] = []
+    original_load = main_module._load_team_subscriptions
+
+    async def scenario() -> list[int]:
+        relay = RedisBroadcastRelay(redis_url="redis://unused", channel="live")
+        relay._publisher = FakeRedis()
+        loads: list[int] = []
+        with patch.object(main_module, "redis_relay", relay), \
+                patch.object(main_module, "GAME_START_PUSH_STAGE_SIZE", 2), \
+                patch.object(main_module, "_load_team_subscriptions", side_effect=original_load) as load, \
+                patch.object(apns_module.ApnsDispatcher, "send_visible", fake_send_visible), \
+                patch.object(main_module, "send_fcm_visible_push_to_tokens", side_effect=fake_send_fcm):
+            await main_module._send_game_start_notification("G-START", "이글스", "SSG")
+            loads.append(load.call_count)
+            await main_module._send_game_start_notification("G-START-2", "HANWHA", "SSG")
+            loads.append(load.call_count)
+            await main_module._invalidate_team_subscriber_cache({"한화"})
+            await main_module._send_game_start_notification("G-START-3", "HANWHA", "KT")
+            loads.append(load.call_count)
+        return loads
+
+    loads = asyncio.run(scenario())
+    assert loads == [2, 2, 4]  # 팀별 1회 조회 후 캐시, 무효화된 한화와 처음 보는 KT 만 다시 조회
+    assert sorted(len(stage) for stage in ios_stages[:4]) == [1, 1, 2, 2]  # 한화 5개는 2개씩, SSG 1개
+    assert sorted(token for stage in ios_stages[:4] for token in stage) == [
+        *(f"hanwha-ios-{index}" for index in range(5)), "ssg-ios",
+    ]
+    assert android == ["hanwha-android"] * 3
+
+
+def test_fcm_sends_chunks_over_http_v1_and_maps_failures() -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int, error_code: str = "") -> None:
+            self.status_code = status_code
+            self.text = json.dumps({
+                "error": {
+                    "status": "NOT_FOUND",
+                    "details": [{"@type": "type.googleapis.com/google.firebase.fcm.v1.FcmError", "errorCode": error_code}],
+                }
+            }) if error_code else ""
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.tokens: list[str] = []
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            token = json.loads(content)["message"]["token"]
+            self.tokens.append(token)
+            if token == "fcm-7":
+                return FakeResponse(404, "UNREGISTERED")
+            if token == "fcm-8":
+                return FakeResponse(500, "INTERNAL")
+            if token == "fcm-1100":
+                raise httpx.ConnectError("connection reset")
+            return FakeResponse(200)
+
+    chunk_sizes: list[int] = []
+    original_send_http_v1 = fcm_module._send_http_v1
+
+    async def counting_send_http_v1(tokens: list[str], **kwargs: object) -> list[str]:
+        chunk_sizes.append(len(tokens))
+        return await original_send_http_v1(tokens, **kwargs)
+
+    client = FakeClient()
+    tokens = [f"fcm-{i}" for i in range(1200)]
+    main_module.invalid_push_tokens.drain()
+    with patch.object(fcm_module, "_ensure_initialized", return_value=True), \
+            patch.object(fcm_module, "_get_http_client", return_value=client), \
+            patch.object(fcm_module, "_get_access_token_blocking", return_value="token"), \
+            patch.object(fcm_module, "_send_http_v1", side_effect=counting_send_http_v1):
+        failed = asyncio.run(fcm_module.send_visible_push_to_tokens(tokens, title="t", body="b", data={"n": 1}))
+
+    assert chunk_sizes == [500, 500, 200]
+    assert sorted(client.tokens) == sorted(tokens)
+    assert failed == ["fcm-7", "fcm-8", "fcm-1100"]
+    assert main_module.invalid_push_tokens.drain() == {"fcm-7": "Unregistered"}
+
+
+def test_fcm_http_v1_error_code_is_classified() -> None:
+    body = json.dumps({
+        "error": {
+            "status": "NOT_FOUND",
+            "details": [{"@type": "type.googleapis.com/google.firebase.fcm.v1.FcmError", "errorCode": "UNREGISTERED"}],
+        }
+    })
+    assert fcm_module._http_v1_error_code(body) == "UNREGISTERED"
+    assert fcm_module._http_v1_error_code('{"error": {"status": "INTERNAL"}}') == "INTERNAL"
+    assert classify_fcm_error_code("UNREGISTERED") == "Unregistered"
+    assert classify_fcm_error_code("INTERNAL") is None
+
+
+def test_fcm_http_v1_concurrency_limit_is_process_wide() -> None:
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+
+        async def post(self, url: str, *, content: bytes, headers: dict) -> FakeResponse:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.001)
+            self.active -= 1
+            return FakeResponse()
+
+    async def scenario() -> list[list[str]]:
+        # 경기 3개의 fallback 이 동시에 돌아도 합쳐서 상한(2) 이하
+        return await asyncio.gather(*(
+            fcm_module._send_http_v1([f"g{game}-t{i}" for i in range(5)], title="t", body="b", data={})
+            for game in range(3)
+        ))
+
+    client = FakeClient()
+    with patch.object(fcm_module, "_get_http_client", return_value=client), \
+            patch.object(fcm_module, "_get_access_token_blocking", return_value="token"), \
+            patch.object(fcm_module.get_settings(), "fcm_max_concurrent_requests", 2):
+        results = asyncio.run(scenario())
+
+    assert results == [[], [], []]
+    assert client.peak == 2
+
+
+def test_large_json_responses_are_compressed_above_threshold() -> None:
+    with TestClient(app) as client:
+        for index in range(20):
+            response = client.post(
+                f"/internal/crawler/games/20260420GZIP{index:04d}/snapshot",
+                headers={"X-API-Key": "test-key"},
+                json=sample_snapshot(),
+            )
+            assert response.status_code == 200
+
+        large = client.get("/games?limit=100", headers={"Accept-Encoding": "gzip"})
+        assert large.status_code == 200
+        assert large.headers["content-encoding"] == "gzip"
+        assert int(large.headers["content-length"]) < len(large.content)  # 전송 bytes < 원본
+        assert "Accept-Encoding" in large.headers["vary"]
+        assert large.headers["etag"].startswith('W/"')
+        assert len(large.json()) >= 20
+        assert client.get(
+            "/games?limit=100", headers={"Accept-Encoding": "gzip", "If-None-Match": large.headers["etag"]},
+        ).status_code == 304
+
+        small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+        identity = client.get("/games?limit=100", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in identity.headers
+
+
+def test_prerendered_response_matches_default_serialization() -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/internal/crawler/games/20260421ORJS0001/snapshot",
+            headers={"X-API-Key": "test-key"},
+            json=sample_snapshot(),
+        )
+        assert response.status_code == 200
+        default_body = client.get("/games/20260421ORJS0001/events").json()
+        with patch.object(responses_module, "fast_json_enabled", return_value=True):
+            fast = client.get("/games/20260421ORJS0001/events")
+    assert fast.status_code == 200
+    assert fast.json() == default_body
+    assert default_body["items"]
+
+
 def test_rollback_session_safely_success() -> None:
     class DummySession:
         def __init__(self) -> None:
@@ -3,8 +3,9 @@ import hashlib
 import json
 import re
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests
 
@@ -16,6 +17,7 @@ except ImportError:
     _HAS_EXCEL = False
 
 from backend_sender import build_snapshot_payload, post_snapshot_to_backend
+from poll_scheduler import DEFAULT_MAX_INTERVAL_SEC, DEFAULT_MIN_INTERVAL_SEC, AdaptivePollScheduler
 
 
 BASE_URL = "https://api-gw.sports.naver.com"
@@ -37,6 +39,20 @@ FINAL_STATUS = {
 }
 
 
+@dataclass
+class RelayFetchState:
+    """Per-game relay cache kept across polls in incremental mode.
+
+    Innings listed in ``frozen_innings`` are closed and are never fetched again;
+    their relay payload and parsed rows are reused from this cache.
+    """
+
+    relays_by_inning: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    parsed_by_inning: Dict[int, Dict[str, List[Dict[str, Any]]]] = field(default_factory=dict)
+    frozen_innings: Set[int] = field(default_factory=set)
+    last_fetched_innings: List[int] = field(default_factory=list)
+
+
 def fetch_json(url: str) -> Dict[str, Any]:
     response = requests.get(
         url,
@@ -135,7 +151,7 @@ def _inject_preview_lineup_into_relays(relays_by_inning: Dict[int, Dict[str, Any
     merged["awayEntry"] = away_entry
     relays_by_inning[1] = merged
 
-def _current_inning_number(game_data: Dict[str, Any]) -> int:
+def _parse_inning_number(game_data: Dict[str, Any]) -> Optional[int]:
     text = str(game_data.get("statusInfo") or game_data.get("currentInning") or "").strip()
     match = re.search(r"(\d+)", text)
     if match:
@@ -143,7 +159,35 @@ def _current_inning_number(game_data: Dict[str, Any]) -> int:
             return max(1, int(match.group(1)))
         except ValueError:
             pass
-    return 9
+    return None
+
+
+def _current_inning_number(game_data: Dict[str, Any]) -> int:
+    inning = _parse_inning_number(game_data)
+    return inning if inning is not None else 9
+
+
+def _innings_to_fetch(game_data: Dict[str, Any], relay_state: Optional[RelayFetchState]) -> List[int]:
+    inning_limit = max(9, _current_inning_number(game_data))
+    if relay_state is None:
+        return list(range(1, inning_limit + 1))
+
+    # Innings after the current one are always empty, so skip them once the live inning is known.
+    live_inning = _parse_inning_number(game_data)
+    if live_inning is not None:
+        inning_limit = live_inning
+    return [inning for inning in range(1, inning_limit + 1) if inning not in relay_state.frozen_innings]
+
+
+def _freeze_closed_innings(game_data: Dict[str, Any], relay_state: RelayFetchState) -> None:
+    live_inning = _parse_inning_number(game_data)
+    if live_inning is None:
+        return
+    # Keep re-fetching the previous inning too: late corrections (video review, scoring changes)
+    # can still land there right after the half-inning switch.
+    for inning, relay_data in relay_state.relays_by_inning.items():
+        if inning < live_inning - 1 and relay_data.get("textRelays"):
+            relay_state.frozen_innings.add(inning)
 
 
 def build_player_map(relay_data: Dict[str, Any]) -> Dict[str, str]:
@@ -459,40 +503,72 @@ def build_output_name(game_id: str) -> str:
     return f"relay_{game_id}_{timestamp}.xlsx"
 
 
+def _store_inning_relay(
+    state: RelayFetchState,
+    inning: int,
+    relay_payload: Dict[str, Any],
+    teams: Dict[str, str],
+) -> None:
+    relay_data = relay_payload.get("result", {}).get("textRelayData") or {}
+    state.relays_by_inning[inning] = relay_data
+    state.parsed_by_inning[inning] = parse_relay(relay_data, teams)
+
+
+def _assemble_relay_state(
+    state: RelayFetchState,
+) -> Tuple[Dict[int, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    # Copy so preview lineup injection never leaks into the cached inning payloads.
+    relays_by_inning: Dict[int, Dict[str, Any]] = {
+        inning: state.relays_by_inning[inning] for inning in sorted(state.relays_by_inning)
+    }
+    combined: Dict[str, List[Dict[str, Any]]] = {
+        "at_bats": [],
+        "pinch_hitters": [],
+        "pitcher_changes": [],
+    }
+    for inning in sorted(state.parsed_by_inning):
+        parsed = state.parsed_by_inning[inning]
+        combined["at_bats"].extend(parsed["at_bats"])
+        combined["pinch_hitters"].extend(parsed["pinch_hitters"])
+        combined["pitcher_changes"].extend(parsed["pitcher_changes"])
+    return relays_by_inning, combined
+
+
+def _needs_preview_lineup(relays_by_inning: Dict[int, Dict[str, Any]]) -> bool:
+    return not any(
+        isinstance(relay, dict) and (
+            relay.get("homeLineup") or relay.get("awayLineup") or relay.get("homeEntry") or relay.get("awayEntry")
+        )
+        for relay in relays_by_inning.values()
+    )
+
+
 def crawl_once_detailed(
     game_id: str,
     base_url: str = BASE_URL,
+    relay_state: Optional[RelayFetchState] = None,
 ) -> Tuple[Dict[str, Any], Dict[int, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
     game_url = f"{base_url}/schedule/games/{game_id}"
     game_data = fetch_json(game_url).get("result", {}).get("game", {})
     if not game_data:
         raise ValueError(f"No game data found for game_id={game_id}")
 
-    relays_by_inning: Dict[int, Dict[str, Any]] = {}
     teams = get_team_names(game_data)
-    combined = {
-        "at_bats": [],
-        "pinch_hitters": [],
-        "pitcher_changes": [],
-    }
+    state = relay_state or RelayFetchState()
 
-    inning_limit = max(9, _current_inning_number(game_data))
-    for inning in range(1, inning_limit + 1):
+    fetched_innings = _innings_to_fetch(game_data, relay_state)
+    for inning in fetched_innings:
         relay_url = f"{base_url}/schedule/games/{game_id}/relay?inning={inning}"
-        relay_data = fetch_json(relay_url).get("result", {}).get("textRelayData") or {}
-        relays_by_inning[inning] = relay_data
-        parsed = parse_relay(relay_data, teams)
-        combined["at_bats"].extend(parsed["at_bats"])
-        combined["pinch_hitters"].extend(parsed["pinch_hitters"])
-        combined["pitcher_changes"].extend(parsed["pitcher_changes"])
+        _store_inning_relay(state, inning, fetch_json(relay_url), teams)
+    state.last_fetched_innings = fetched_innings
+
+    if relay_state is not None:
+        _freeze_closed_innings(game_data, relay_state)
+
+    relays_by_inning, combined = _assemble_relay_state(state)
 
     # Pregame lineup can be exposed in preview endpoint before relay text is available.
-    if not any(
-        isinstance(relay, dict) and (
-            relay.get("homeLineup") or relay.get("awayLineup") or relay.get("homeEntry") or relay.get("awayEntry")
-        )
-        for relay in relays_by_inning.values()
-    ):
+    if _needs_preview_lineup(relays_by_inning):
         preview_url = f"{base_url}/schedule/games/{game_id}/preview"
         try:
             preview_payload = fetch_json(preview_url)
@@ -537,6 +613,23 @@ def _snapshot_state_signature(snapshot: Dict[str, Any]) -> str:
     return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
 
+def _source_event_ids(events: List[Dict[str, Any]]) -> List[str]:
+    return [
+        str(event.get("sourceEventId")).strip()
+        for event in events
+        if str(event.get("sourceEventId") or "").strip()
+    ]
+
+
+def _select_delta_events(events: List[Dict[str, Any]], posted_source_event_ids: Set[str]) -> List[Dict[str, Any]]:
+    return [
+        event
+        for event in events
+        if str(event.get("sourceEventId") or "").strip()
+        and str(event.get("sourceEventId") or "").strip() not in posted_source_event_ids
+    ]
+
+
 def run(
     game_id: str,
     output_path: Optional[str],
@@ -547,18 +640,34 @@ def run(
     backend_api_key: Optional[str] = None,
     backend_timeout: float = 10.0,
     backend_retries: int = 3,
+    incremental_relay: bool = False,
+    adaptive_interval: bool = False,
+    min_interval: float = DEFAULT_MIN_INTERVAL_SEC,
+    max_interval: float = DEFAULT_MAX_INTERVAL_SEC,
 ) -> None:
     posted_source_event_ids: set[str] = set()
     last_posted_state_signature: str | None = None
+    relay_state = RelayFetchState() if incremental_relay else None
+    scheduler = AdaptivePollScheduler(interval, min_interval, max_interval) if adaptive_interval else None
+
+    def poll_interval() -> float:
+        return scheduler.interval if scheduler is not None else interval
 
     while True:
         try:
-            game_data, relays_by_inning, combined = crawl_once_detailed(game_id=game_id, base_url=base_url)
+            game_data, relays_by_inning, combined = crawl_once_detailed(
+                game_id=game_id,
+                base_url=base_url,
+                relay_state=relay_state,
+            )
         except requests.RequestException as exc:
             print(f"[crawl][warn] gameId={game_id} fetch_failed error={exc}", flush=True)
             if not watch:
                 raise
-            time.sleep(interval)
+            if scheduler is not None:
+                response = getattr(exc, "response", None)
+                scheduler.observe(rate_limited=response is not None and response.status_code == 429)
+            time.sleep(poll_interval())
             continue
 
         if output_path:
@@ -576,20 +685,24 @@ def run(
             f"atBats={len(combined['at_bats'])} pitcherChanges={len(combined['pitcher_changes'])}",
             flush=True,
         )
+        if relay_state is not None:
+            print(
+                f"[crawl] gameId={game_id} relayFetched={','.join(map(str, relay_state.last_fetched_innings)) or '-'} "
+                f"frozen={len(relay_state.frozen_innings)}",
+                flush=True,
+            )
         if output_path:
             print(f"[output] excel={output_path}", flush=True)
 
+        if scheduler is not None and not backend_base_url:
+            scheduler.observe(state_signature=str(relay_count))
+
         if backend_base_url:
             if not backend_api_key:
                 raise ValueError("--backend-api-key is required when --backend-base-url is set")
             snapshot = build_snapshot_payload(game_data=game_data, relays_by_inning=relays_by_inning)
             all_events = snapshot.get("events") or []
-            delta_events = [
-                event
-                for event in all_events
-                if str(event.get("sourceEventId") or "").strip()
-                and str(event.get("sourceEventId") or "").strip() not in posted_source_event_ids
-            ]
+            delta_events = _select_delta_events(all_events, posted_source_event_ids)
             snapshot["events"] = delta_events
             print(
                 f"[snapshot] gameDate={snapshot.get('gameDate')} startTime={snapshot.get('startTime')} "
@@ -597,6 +710,11 @@ def run(
                 flush=True,
             )
             state_signature = _snapshot_state_signature(snapshot)
+            if scheduler is not None:
+                scheduler.observe(
+                    state_signature=state_signature,
+                    event_types=[str(event.get("type") or "") for event in delta_events],
+                )
             if not delta_events and state_signature == last_posted_state_signature:
                 print(
                     f"[backend] gameId={game_id} skipped reason=no-delta-no-state-change",
@@ -604,7 +722,7 @@ def run(
                 )
                 if not watch or status in FINAL_STATUS:
                     break
-                time.sleep(interval)
+                time.sleep(poll_interval())
                 continue
             try:
                 last_error: requests.RequestException | None = None
@@ -638,11 +756,7 @@ def run(
                     f"duplicates={result.get('duplicateEvents')}",
                     flush=True,
                 )
-                posted_source_event_ids.update(
-                    str(event.get("sourceEventId")).strip()
-                    for event in delta_events
-                    if str(event.get("sourceEventId") or "").strip()
-                )
+                posted_source_event_ids.update(_source_event_ids(delta_events))
                 last_posted_state_signature = state_signature
             except requests.RequestException as exc:
                 print(f"[backend][error] gameId={game_id} ingest_failed error={exc}", flush=True)
@@ -651,7 +765,9 @@ def run(
 
         if not watch or status in FINAL_STATUS:
             break
-        time.sleep(interval)
+        if scheduler is not None:
+            print(f"[poll] gameId={game_id} nextInterval={scheduler.interval:.1f}s inBreak={scheduler.in_break}", flush=True)
+        time.sleep(poll_interval())
 
 
 def main() -> None:
@@ -686,6 +802,28 @@ def main() -> None:
         default=3,
         help="number of backend ingest retries per poll",
     )
+    parser.add_argument(
+        "--incremental-relay",
+        action="store_true",
+        help="cache closed innings in memory and only re-fetch the current/previous inning each poll",
+    )
+    parser.add_argument(
+        "--adaptive-interval",
+        action="store_true",
+        help="adapt the watch interval to game phase (shorter mid at-bat, longer during breaks, back off on 429)",
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=DEFAULT_MIN_INTERVAL_SEC,
+        help="lower bound for --adaptive-interval in seconds",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=DEFAULT_MAX_INTERVAL_SEC,
+        help="upper bound for --adaptive-interval in seconds",
+    )
 
     args = parser.parse_args()
     if args.backend_base_url and not args.backend_api_key:
@@ -701,6 +839,10 @@ def main() -> None:
         backend_api_key=args.backend_api_key,
         backend_timeout=args.backend_timeout,
         backend_retries=args.backend_retries,
+        incremental_relay=args.incremental_relay,
+        adaptive_interval=args.adaptive_interval,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
     )
 
 
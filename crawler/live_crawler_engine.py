@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import traceback
+from concurrent.futures import CancelledError, Future
+from datetime import datetime
+from typing import Any, Callable, TextIO
+
+import httpx
+
+from backend_sender import build_snapshot_payload
+from crawler import (
+    DEFAULT_USER_AGENT,
+    FINAL_STATUS,
+    RelayFetchState,
+    _assemble_relay_state,
+    _freeze_closed_innings,
+    _inject_preview_lineup_into_relays,
+    _innings_to_fetch,
+    _needs_preview_lineup,
+    _select_delta_events,
+    _snapshot_state_signature,
+    _source_event_ids,
+    _store_inning_relay,
+    get_team_names,
+)
+from poll_scheduler import DEFAULT_MAX_INTERVAL_SEC, DEFAULT_MIN_INTERVAL_SEC, AdaptivePollScheduler, RequestBudget
+
+DEFAULT_UPSTREAM_CONCURRENCY = 4
+
+
+class GameTaskHandle:
+    """Popen-like view of one in-process game task, so the dispatcher can treat it like a subprocess."""
+
+    def __init__(self, game_id: str, future: Future[None]) -> None:
+        self.game_id = game_id
+        self.pid = os.getpid()
+        self._future = future
+
+    def poll(self) -> int | None:
+        if not self._future.done():
+            return None
+        try:
+            self._future.result()
+        except CancelledError:
+            return -15
+        except Exception:
+            return 1
+        return 0
+
+    def terminate(self) -> None:
+        self._future.cancel()
+
+
+class LiveCrawlerEngine:
+    """Runs every live game as an asyncio task on one event loop thread.
+
+    All games share a single pooled HTTP/2 client for both the upstream relay API
+    and backend ingest, instead of one interpreter + requests session per game.
+    Upstream requests in flight are capped engine-wide (`upstream_concurrency`), so a poll that
+    re-fetches every inning does not burst even when no requests-per-second budget is set.
+    """
+
+    def __init__(
+        self,
+        *,
+        source_base_url: str,
+        backend_base_url: str,
+        backend_api_key: str,
+        interval_sec: int,
+        backend_timeout: float,
+        backend_retries: int,
+        incremental_relay: bool = False,
+        fetch_timeout: float = 20.0,
+        max_connections: int = 20,
+        transport: httpx.AsyncBaseTransport | None = None,
+        adaptive_interval: bool = False,
+        min_interval: float = DEFAULT_MIN_INTERVAL_SEC,
+        max_interval: float = DEFAULT_MAX_INTERVAL_SEC,
+        upstream_requests_per_sec: float | None = None,
+        upstream_concurrency: int = DEFAULT_UPSTREAM_CONCURRENCY,
+    ) -> None:
+        self.source_base_url = source_base_url.rstrip("/")
+        self.backend_base_url = backend_base_url.rstrip("/")
+        self.backend_api_key = backend_api_key
+        self.interval_sec = interval_sec
+        self.backend_timeout = max(1.0, float(backend_timeout))
+        self.backend_retries = max(1, int(backend_retries))
+        self.incremental_relay = incremental_relay
+        self.fetch_timeout = fetch_timeout
+        self.max_connections = max(1, int(max_connections))
+        self._transport = transport
+        self.adaptive_interval = adaptive_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.upstream_requests_per_sec = upstream_requests_per_sec
+        self.upstream_concurrency = max(1, int(upstream_concurrency))
+        self._budget: RequestBudget | None = None
+        self._upstream_slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run_loop, name="live-crawler-engine", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        if self.upstream_requests_per_sec:
+            self._budget = RequestBudget(self.upstream_requests_per_sec)
+        self._upstream_slots = asyncio.Semaphore(self.upstream_concurrency)
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            transport=self._transport,
+        )
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(self._client.aclose())
+            loop.close()
+
+    def submit(self, game_id: str, log_handle: TextIO) -> GameTaskHandle:
+        if self._loop is None:
+            raise RuntimeError("engine is not started")
+
+        def log(message: str) -> None:
+            log_handle.write(message + "\n")
+            log_handle.flush()
+
+        async def run() -> None:
+            try:
+                await self._run_game(game_id, log)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # handle.poll() 은 exit code 1 만 돌려주므로 원인은 경기 로그에 남긴다.
+                log(f"[crawl][error] gameId={game_id} task_failed\n{traceback.format_exc().rstrip()}")
+                raise
+
+        future = asyncio.run_coroutine_threadsafe(run(), self._loop)
+        return GameTaskHandle(game_id, future)
+
+    def stop(self) -> None:
+        loop = self._loop
+        if loop is None or self._thread is None:
+            return
+
+        async def cancel_all() -> None:
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(cancel_all(), loop).result(timeout=30)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=30)
+        self._thread = None
+        self._loop = None
+
+    async def _fetch_json(self, url: str) -> dict[str, Any]:
+        assert self._client is not None and self._upstream_slots is not None
+        async with self._upstream_slots:
+            if self._budget is not None:
+                await self._budget.acquire()
+            response = await self._client.get(url, timeout=self.fetch_timeout)
+        response.raise_for_status()
+        return response.json()
+
+    async def crawl_once_detailed(
+        self,
+        game_id: str,
+        relay_state: RelayFetchState | None = None,
+    ) -> tuple[dict[str, Any], dict[int, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+        base_url = self.source_base_url
+        game_payload = await self._fetch_json(f"{base_url}/schedule/games/{game_id}")
+        game_data = game_payload.get("result", {}).get("game", {})
+        if not game_data:
+            raise ValueError(f"No game data found for game_id={game_id}")
+
+        teams = get_team_names(game_data)
+        state = relay_state or RelayFetchState()
+
+        fetched_innings = _innings_to_fetch(game_data, relay_state)
+        relay_payloads = await asyncio.gather(
+            *(
+                self._fetch_json(f"{base_url}/schedule/games/{game_id}/relay?inning={inning}")
+                for inning in fetched_innings
+            )
+        )
+        for inning, relay_payload in zip(fetched_innings, relay_payloads):
+            _store_inning_relay(state, inning, relay_payload, teams)
+        state.last_fetched_innings = fetched_innings
+
+        if relay_state is not None:
+            _freeze_closed_innings(game_data, relay_state)
+
+        relays_by_inning, combined = _assemble_relay_state(state)
+
+        if _needs_preview_lineup(relays_by_inning):
+            try:
+                preview_payload = await self._fetch_json(f"{base_url}/schedule/games/{game_id}/preview")
+            except httpx.HTTPError:
+                preview_payload = {}
+            if isinstance(preview_payload, dict):
+                _inject_preview_lineup_into_relays(relays_by_inning, preview_payload)
+
+        return game_data, relays_by_inning, combined
+
+    async def _post_snapshot(self, game_id: str, payload: dict[str, Any], log: Callable[[str], None]) -> dict[str, Any]:
+        assert self._client is not None
+        endpoint = f"{self.backend_base_url}/internal/crawler/games/{game_id}/snapshot"
+        last_error: httpx.HTTPError | None = None
+        for attempt in range(1, self.backend_retries + 1):
+            try:
+                response = await self._client.post(
+                    endpoint,
+                    headers={"X-API-Key": self.backend_api_key},
+                    json=payload,
+                    timeout=self.backend_timeout,
+                )
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPError as exc:
+                last_error = exc
+                log(f"[backend][warn] gameId={game_id} ingest_retry={attempt}/{self.backend_retries} error={exc}")
+                if attempt < self.backend_retries:
+                    await asyncio.sleep(min(5, attempt))
+        raise last_error or httpx.HTTPError("backend ingest failed")
+
+    async def _run_game(self, game_id: str, log: Callable[[str], None]) -> None:
+        posted_source_event_ids: set[str] = set()
+        last_posted_state_signature: str | None = None
+        relay_state = RelayFetchState() if self.incremental_relay else None
+        scheduler = (
+            AdaptivePollScheduler(self.interval_sec, self.min_interval, self.max_interval)
+            if self.adaptive_interval
+            else None
+        )
+
+        def poll_interval() -> float:
+            return scheduler.interval if scheduler is not None else self.interval_sec
+
+        while True:
+            try:
+                game_data, relays_by_inning, combined = await self.crawl_once_detailed(game_id, relay_state)
+            except httpx.HTTPError as exc:
+                log(f"[crawl][warn] gameId={game_id} fetch_failed error={exc}")
+                if scheduler is not None:
+                    rate_limited = isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+                    scheduler.observe(rate_limited=rate_limited)
+                await asyncio.sleep(poll_interval())
+                continue
+
+            status = (game_data.get("statusCode") or "").upper()
+            inning = (game_data.get("statusInfo") or game_data.get("currentInning") or "-").strip()
+            relay_count = sum(len((relay.get("textRelays") or [])) for relay in relays_by_inning.values())
+            log(
+                f"[crawl] at={datetime.now().isoformat(timespec='seconds')} "
+                f"gameId={game_id} status={status or '-'} inning={inning or '-'} "
+                f"score={game_data.get('awayTeamScore')}:{game_data.get('homeTeamScore')} relayFrames={relay_count} "
+                f"atBats={len(combined['at_bats'])} pitcherChanges={len(combined['pitcher_changes'])}"
+            )
+
+            snapshot = build_snapshot_payload(game_data=game_data, relays_by_inning=relays_by_inning)
+            all_events = snapshot.get("events") or []
+            delta_events = _select_delta_events(all_events, posted_source_event_ids)
+            snapshot["events"] = delta_events
+            state_signature = _snapshot_state_signature(snapshot)
+            if scheduler is not None:
+                scheduler.observe(
+                    state_signature=state_signature,
+                    event_types=[str(event.get("type") or "") for event in delta_events],
+                )
+            if not delta_events and state_signature == last_posted_state_signature:
+                log(f"[backend] gameId={game_id} skipped reason=no-delta-no-state-change")
+            else:
+                try:
+                    result = await self._post_snapshot(game_id, snapshot, log)
+                    log(
+                        f"[backend] gameId={result.get('gameId')} "
+                        f"received={result.get('receivedEvents')} "
+                        f"inserted={result.get('insertedEvents')} "
+                        f"duplicates={result.get('duplicateEvents')}"
+                    )
+                    posted_source_event_ids.update(_source_event_ids(delta_events))
+                    last_posted_state_signature = state_signature
+                except httpx.HTTPError as exc:
+                    log(f"[backend][error] gameId={game_id} ingest_failed error={exc}")
+
+            if status in FINAL_STATUS:
+                return
+            if scheduler is not None:
+                log(f"[poll] gameId={game_id} nextInterval={scheduler.interval:.1f}s inBreak={scheduler.in_break}")
+            await asyncio.sleep(poll_interval())
@@ -10,12 +10,15 @@ import time
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time as dt_time, timedelta
 from pathlib import Path
-from typing import Any, TextIO
+from typing import TYPE_CHECKING, Any, TextIO
 from urllib.parse import parse_qs, urlparse
 from zoneinfo import ZoneInfo
 
 import requests
 
+if TYPE_CHECKING:
+    from live_crawler_engine import GameTaskHandle, LiveCrawlerEngine
+
 
 KST = ZoneInfo("Asia/Seoul")
 LIVE_STATUS_CODES = {"LIVE", "ING", "PLAYING", "IN_PROGRESS", "STARTED"}
@@ -24,6 +27,7 @@ CANCELED_STATUS_CODES = {"CANCELED", "CANCELLED", "CANCEL", "RAIN_CANCEL", "NO_G
 POSTPONED_STATUS_CODES = {"POSTPONED", "PPD", "SUSPENDED", "DELAYED"}
 TERMINAL_STATUS_CODES = FINAL_STATUS_CODES | CANCELED_STATUS_CODES | POSTPONED_STATUS_CODES
 RETRYABLE_HTTP_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+DEFAULT_CRAWLER_UPSTREAM_RPS = 5.0
 LOGGER = logging.getLogger("baseball_dispatcher")
 LEAGUE_PRESETS: dict[str, tuple[str, str]] = {
     "wbc": ("wbaseball", "wbc"),
@@ -56,7 +60,7 @@ class RelayCheckWindow:
 @dataclass
 class RunningCrawler:
     game_id: str
-    process: subprocess.Popen[str]
+    process: subprocess.Popen[str] | GameTaskHandle
     log_path: Path
     log_handle: Any
     started_at: datetime
@@ -1028,6 +1032,7 @@ def _start_crawler(
     crawler_backend_timeout_sec: float,
     crawler_backend_retries: int,
     log_dir: Path,
+    crawler_incremental_relay: bool = False,
 ) -> RunningCrawler:
     crawler_script = repo_root / "crawler" / "crawler.py"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -1056,6 +1061,8 @@ def _start_crawler(
         "--backend-retries",
         str(normalized_backend_retries),
     ]
+    if crawler_incremental_relay:
+        cmd.append("--incremental-relay")
     process = subprocess.Popen(
         cmd,
         cwd=str(repo_root),
@@ -1075,6 +1082,45 @@ def _start_crawler(
     )
 
 
+def _start_engine_crawler(
+    engine: LiveCrawlerEngine,
+    game_id: str,
+    log_dir: Path,
+) -> RunningCrawler:
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_path = log_dir / f"live_crawler_{game_id}.log"
+    log_handle = log_path.open("a", encoding="utf-8")
+    return RunningCrawler(
+        game_id=game_id,
+        process=engine.submit(game_id, log_handle),
+        log_path=log_path,
+        log_handle=log_handle,
+        started_at=datetime.now(KST),
+    )
+
+
+def _create_crawler_engine(args: argparse.Namespace) -> LiveCrawlerEngine:
+    from live_crawler_engine import LiveCrawlerEngine
+
+    engine = LiveCrawlerEngine(
+        source_base_url=args.source_base_url,
+        backend_base_url=args.backend_base_url,
+        backend_api_key=args.backend_api_key,
+        interval_sec=args.crawler_interval_sec,
+        backend_timeout=args.crawler_backend_timeout_sec,
+        backend_retries=args.crawler_backend_retries,
+        incremental_relay=args.crawler_incremental_relay,
+        max_connections=args.crawler_max_connections,
+        adaptive_interval=args.crawler_adaptive_interval,
+        min_interval=args.crawler_min_interval_sec,
+        max_interval=args.crawler_max_interval_sec,
+        upstream_requests_per_sec=args.crawler_upstream_rps or None,
+        upstream_concurrency=args.crawler_upstream_concurrency,
+    )
+    engine.start()
+    return engine
+
+
 def _cleanup_finished_processes(running: dict[str, RunningCrawler]) -> list[tuple[str, int]]:
     stopped: list[tuple[str, int]] = []
     for game_id, running_crawler in list(running.items()):
@@ -1140,6 +1186,10 @@ def run_dispatcher(args: argparse.Namespace) -> None:
 
     windows: dict[str, RelayCheckWindow] = {}
     running: dict[str, RunningCrawler] = {}
+    engine: LiveCrawlerEngine | None = None
+    if args.crawler_engine == "async":
+        engine = _create_crawler_engine(args)
+        LOGGER.info("[dispatcher] crawler_engine=async maxConnections=%s", args.crawler_max_connections)
     imported_date: date | None = None
     last_import_attempt_at: datetime | None = None
     last_import_success_at: datetime | None = None
@@ -1318,18 +1368,22 @@ def run_dispatcher(args: argparse.Namespace) -> None:
                     is_final,
                 )
                 if available:
-                    running_crawler = _start_crawler(
-                        repo_root=repo_root,
-                        python_executable=python_executable,
-                        game_id=game_id,
-                        source_base_url=args.source_base_url,
-                        crawler_interval_sec=args.crawler_interval_sec,
-                        backend_base_url=args.backend_base_url,
-                        backend_api_key=args.backend_api_key,
-                        crawler_backend_timeout_sec=args.crawler_backend_timeout_sec,
-                        crawler_backend_retries=args.crawler_backend_retries,
-                        log_dir=log_dir,
-                    )
+                    if engine is not None:
+                        running_crawler = _start_engine_crawler(engine=engine, game_id=game_id, log_dir=log_dir)
+                    else:
+                        running_crawler = _start_crawler(
+                            repo_root=repo_root,
+                            python_executable=python_executable,
+                            game_id=game_id,
+                            source_base_url=args.source_base_url,
+                            crawler_interval_sec=args.crawler_interval_sec,
+                            backend_base_url=args.backend_base_url,
+                            backend_api_key=args.backend_api_key,
+                            crawler_backend_timeout_sec=args.crawler_backend_timeout_sec,
+                            crawler_backend_retries=args.crawler_backend_retries,
+                            log_dir=log_dir,
+                            crawler_incremental_relay=args.crawler_incremental_relay,
+                        )
                     running[game_id] = running_crawler
                     window.launched = True
                     LOGGER.info(
@@ -1372,6 +1426,9 @@ def run_dispatcher(args: argparse.Namespace) -> None:
         for running_crawler in running.values():
             if running_crawler.process.poll() is None:
                 running_crawler.process.terminate()
+        if engine is not None:
+            engine.stop()
+        for running_crawler in running.values():
             running_crawler.log_handle.close()
         _release_dispatcher_lock(lock_handle)
 
@@ -1448,6 +1505,52 @@ def build_parser() -> argparse.ArgumentParser:
         default=2,
         help="Backend ingest retries passed to crawler.py (--backend-retries).",
     )
+    parser.add_argument(
+        "--crawler-incremental-relay",
+        action="store_true",
+        help="Run crawler.py with --incremental-relay (re-fetch only the live innings each poll).",
+    )
+    parser.add_argument(
+        "--crawler-engine",
+        choices=["subprocess", "async"],
+        default="subprocess",
+        help=(
+            "How live games are crawled: one crawler.py process per game (subprocess) or "
+            "asyncio tasks in this process sharing one HTTP/2 client (async)."
+        ),
+    )
+    parser.add_argument(
+        "--crawler-max-connections",
+        type=int,
+        default=20,
+        help="Connection pool size of the shared HTTP client when --crawler-engine=async.",
+    )
+    parser.add_argument(
+        "--crawler-adaptive-interval",
+        action="store_true",
+        help=(
+            "Adapt each game's poll interval to game phase: shorter during at-bats, longer after "
+            "half-inning/pitcher changes, backing off on HTTP 429. Requires --crawler-engine=async and a "
+            "non-zero --crawler-upstream-rps, since the min interval can poll faster than --crawler-interval-sec."
+        ),
+    )
+    parser.add_argument("--crawler-min-interval-sec", type=float, default=3.0)
+    parser.add_argument("--crawler-max-interval-sec", type=float, default=60.0)
+    parser.add_argument(
+        "--crawler-upstream-rps",
+        type=float,
+        default=DEFAULT_CRAWLER_UPSTREAM_RPS,
+        help=(
+            "Upstream requests-per-second budget shared by all games. Only enforced by --crawler-engine=async "
+            "(subprocess crawlers each poll on their own); 0 disables it."
+        ),
+    )
+    parser.add_argument(
+        "--crawler-upstream-concurrency",
+        type=int,
+        default=4,
+        help="Max Naver requests in flight across all games (--crawler-engine=async only).",
+    )
     parser.add_argument(
         "--dispatcher-lock-file",
         default="log/dispatcher.lock",
@@ -1507,9 +1610,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    # adaptive interval 은 min interval(기본 3초)까지 poll 을 당기므로 공유 upstream budget 없이는 켜지 않는다.
+    if args.crawler_adaptive_interval and args.crawler_engine != "async":
+        parser.error("--crawler-adaptive-interval requires --crawler-engine async (the upstream budget is shared only there)")
+    if args.crawler_adaptive_interval and args.crawler_upstream_rps <= 0:
+        parser.error("--crawler-adaptive-interval requires a non-zero --crawler-upstream-rps")
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    validate_args(parser, args)
     run_dispatcher(args)
 
 
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Iterable
+
+
+# Events after which the game pauses (side switch, mound visit + warmup pitches).
+BREAK_EVENT_TYPES = {"HALF_INNING_CHANGE", "PITCHER_CHANGE"}
+DEFAULT_MIN_INTERVAL_SEC = 3.0
+DEFAULT_MAX_INTERVAL_SEC = 60.0
+QUIET_GROWTH_FACTOR = 1.5
+RATE_LIMIT_BACKOFF_FACTOR = 2.0
+
+
+class AdaptivePollScheduler:
+    """Per-game poll interval driven by what the last poll observed.
+
+    - state changed (new pitch/at-bat result): poll at ``min_interval``
+    - break event (half-inning / pitcher change): jump to ``max_interval`` until play resumes
+    - nothing changed: grow by 1.5x, capped at ``base_interval`` mid at-bat and ``max_interval`` in a break
+    - upstream HTTP 429: double the interval (at least ``base_interval``), up to ``max_interval``
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float = DEFAULT_MIN_INTERVAL_SEC,
+        max_interval: float = DEFAULT_MAX_INTERVAL_SEC,
+    ) -> None:
+        self.base_interval = max(0.1, float(base_interval))
+        self.min_interval = max(0.1, min(float(min_interval), self.base_interval))
+        self.max_interval = max(self.base_interval, float(max_interval))
+        self.interval = self.base_interval
+        self.in_break = False
+        self._last_signature: str | None = None
+
+    def observe(
+        self,
+        *,
+        state_signature: str | None = None,
+        event_types: Iterable[str] = (),
+        rate_limited: bool = False,
+    ) -> float:
+        if rate_limited:
+            self.interval = min(self.max_interval, max(self.interval, self.base_interval) * RATE_LIMIT_BACKOFF_FACTOR)
+            return self.interval
+
+        types = [str(event_type or "").upper() for event_type in event_types]
+        changed = state_signature is not None and state_signature != self._last_signature
+        if state_signature is not None:
+            self._last_signature = state_signature
+
+        if types and types[-1] in BREAK_EVENT_TYPES:
+            self.in_break = True
+            self.interval = self.max_interval
+        elif changed or types:
+            self.in_break = False
+            self.interval = self.min_interval
+        else:
+            ceiling = self.max_interval if self.in_break else self.base_interval
+            self.interval = min(ceiling, max(self.interval, self.min_interval) * QUIET_GROWTH_FACTOR)
+        return self.interval
+
+
+class RequestBudget:
+    """Token bucket shared by all games of one engine to cap upstream requests per second."""
+
+    def __init__(self, requests_per_sec: float, burst: float | None = None) -> None:
+        self.rate = max(0.01, float(requests_per_sec))
+        self.capacity = max(1.0, float(burst if burst is not None else requests_per_sec))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        async with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                await asyncio.sleep((cost - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= cost
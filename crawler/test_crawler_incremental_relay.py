@@ -0,0 +1,97 @@
+from typing import Any, Dict, List
+
+import crawler
+from crawler import RelayFetchState, crawl_once_detailed
+
+
+def _relay_payload(inning: int) -> Dict[str, Any]:
+    return {
+        "result": {
+            "textRelayData": {
+                "homeLineup": {"batter": [{"pcode": "h1", "name": "HomeB1"}], "pitcher": []},
+                "awayLineup": {"batter": [{"pcode": "a1", "name": "AwayB1"}], "pitcher": []},
+                "textRelays": [
+                    {
+                        "no": 1,
+                        "inn": inning,
+                        "homeOrAway": "0",
+                        "textOptions": [
+                            {"seqno": 1, "type": 8, "text": "1번타자 AwayB1", "batterRecord": {"pcode": "a1", "name": "AwayB1"}},
+                            {"seqno": 2, "type": 13, "text": "AwayB1 : 중견수 플라이 아웃"},
+                        ],
+                    }
+                ],
+            }
+        }
+    }
+
+
+def _install_fake_fetch(monkeypatch, status_info: Dict[str, str]) -> List[str]:
+    requested: List[str] = []
+
+    def fake_fetch_json(url: str) -> Dict[str, Any]:
+        requested.append(url)
+        if "/relay?inning=" in url:
+            return _relay_payload(int(url.rsplit("=", 1)[1]))
+        return {
+            "result": {
+                "game": {
+                    "homeTeamName": "Home",
+                    "awayTeamName": "Away",
+                    "statusCode": "STARTED",
+                    "statusInfo": status_info["value"],
+                }
+            }
+        }
+
+    monkeypatch.setattr(crawler, "fetch_json", fake_fetch_json)
+    return requested
+
+
+def _relay_innings(requested: List[str]) -> List[int]:
+    return [int(url.rsplit("=", 1)[1]) for url in requested if "/relay?inning=" in url]
+
+
+def test_full_mode_fetches_every_inning(monkeypatch) -> None:
+    status_info = {"value": "3회말"}
+    requested = _install_fake_fetch(monkeypatch, status_info)
+
+    _, relays_by_inning, _ = crawl_once_detailed("G1", base_url="http://mock")
+
+    assert _relay_innings(requested) == list(range(1, 10))
+    assert sorted(relays_by_inning) == list(range(1, 10))
+
+
+def test_incremental_mode_only_refetches_live_innings(monkeypatch) -> None:
+    status_info = {"value": "7회초"}
+    requested = _install_fake_fetch(monkeypatch, status_info)
+    relay_state = RelayFetchState()
+
+    crawl_once_detailed("G1", base_url="http://mock", relay_state=relay_state)
+    assert _relay_innings(requested) == list(range(1, 8))
+    assert relay_state.frozen_innings == {1, 2, 3, 4, 5}
+
+    requested.clear()
+    status_info["value"] = "8회초"
+    _, relays_by_inning, combined = crawl_once_detailed("G1", base_url="http://mock", relay_state=relay_state)
+
+    assert _relay_innings(requested) == [6, 7, 8]
+    assert relay_state.frozen_innings == {1, 2, 3, 4, 5, 6}
+    assert sorted(relays_by_inning) == list(range(1, 9))
+    assert [at_bat["inning"] for at_bat in combined["at_bats"]] == list(range(1, 9))
+
+    requested.clear()
+    crawl_once_detailed("G1", base_url="http://mock", relay_state=relay_state)
+
+    assert _relay_innings(requested) == [7, 8]
+
+
+def test_incremental_mode_does_not_freeze_when_inning_unknown(monkeypatch) -> None:
+    status_info = {"value": "경기전"}
+    requested = _install_fake_fetch(monkeypatch, status_info)
+    relay_state = RelayFetchState()
+
+    crawl_once_detailed("G1", base_url="http://mock", relay_state=relay_state)
+
+    assert _relay_innings(requested) == list(range(1, 10))
+    assert relay_state.frozen_innings == set()
@@ -0,0 +1,174 @@
+import asyncio
+import io
+import json
+import time
+
+import httpx
+
+from live_crawler_engine import LiveCrawlerEngine
+
+
+def _mock_handler(posted: list[dict]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST":
+            body = json.loads(request.content)
+            posted.append({"path": path, "events": len(body["events"])})
+            return httpx.Response(
+                200,
+                json={"gameId": path.split("/")[-2], "receivedEvents": len(body["events"]), "insertedEvents": 0, "duplicateEvents": 0},
+            )
+        if path.endswith("/relay"):
+            return httpx.Response(
+                200,
+                json={
+                    "result": {
+                        "textRelayData": {
+                            "homeLineup": {"batter": [], "pitcher": [{"pcode": "p1", "name": "HomeP"}]},
+                            "textRelays": [],
+                        }
+                    }
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "result": {
+                    "game": {
+                        "homeTeamName": "Home",
+                        "awayTeamName": "Away",
+                        "statusCode": "RESULT",
+                        "statusInfo": "9회말",
+                        "gameDateTime": "2026-05-08T18:30:00+09:00",
+                    }
+                }
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def _wait_for_exit(handle, timeout: float = 5.0) -> int | None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        code = handle.poll()
+        if code is not None:
+            return code
+        time.sleep(0.01)
+    return None
+
+
+def test_engine_runs_games_as_tasks_and_routes_logs_per_game() -> None:
+    posted: list[dict] = []
+    engine = LiveCrawlerEngine(
+        source_base_url="http://mock",
+        backend_base_url="http://backend",
+        backend_api_key="k",
+        interval_sec=1,
+        backend_timeout=5,
+        backend_retries=1,
+        transport=_mock_handler(posted),
+    )
+    engine.start()
+    try:
+        logs = {game_id: io.StringIO() for game_id in ("G1", "G2")}
+        handles = {game_id: engine.submit(game_id, log) for game_id, log in logs.items()}
+
+        assert {game_id: _wait_for_exit(handle) for game_id, handle in handles.items()} == {"G1": 0, "G2": 0}
+    finally:
+        engine.stop()
+
+    assert sorted(item["path"] for item in posted) == [
+        "/internal/crawler/games/G1/snapshot",
+        "/internal/crawler/games/G2/snapshot",
+    ]
+    assert "gameId=G1 status=RESULT" in logs["G1"].getvalue()
+    assert "G2" not in logs["G1"].getvalue()
+    assert "[backend] gameId=G2" in logs["G2"].getvalue()
+
+
+def test_engine_handle_terminate_reports_cancelled() -> None:
+    engine = LiveCrawlerEngine(
+        source_base_url="http://mock",
+        backend_base_url="http://backend",
+        backend_api_key="k",
+        interval_sec=60,
+        backend_timeout=5,
+        backend_retries=1,
+        transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+    )
+    engine.start()
+    try:
+        handle = engine.submit("G1", io.StringIO())
+        assert handle.poll() is None
+        handle.terminate()
+        assert _wait_for_exit(handle) == -15
+    finally:
+        engine.stop()
+
+
+def test_engine_logs_traceback_of_unexpected_task_error() -> None:
+    engine = LiveCrawlerEngine(
+        source_base_url="http://mock",
+        backend_base_url="http://backend",
+        backend_api_key="k",
+        interval_sec=1,
+        backend_timeout=5,
+        backend_retries=1,
+        transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+    )
+
+    async def broken_crawl(game_id: str, relay_state=None):
+        raise KeyError("homeTeamName")
+
+    engine.crawl_once_detailed = broken_crawl
+    engine.start()
+    try:
+        log = io.StringIO()
+        handle = engine.submit("G1", log)
+        assert _wait_for_exit(handle) == 1
+    finally:
+        engine.stop()
+
+    output = log.getvalue()
+    assert "[crawl][error] gameId=G1 task_failed" in output
+    assert "Traceback (most recent call last)" in output
+    assert "KeyError: 'homeTeamName'" in output
+
+
+def test_engine_caps_upstream_requests_in_flight() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"result": {"textRelayData": {"textRelays": []}}})
+
+    engine = LiveCrawlerEngine(
+        source_base_url="http://mock",
+        backend_base_url="http://backend",
+        backend_api_key="k",
+        interval_sec=1,
+        backend_timeout=5,
+        backend_retries=1,
+        transport=httpx.MockTransport(handler),
+        upstream_concurrency=2,
+    )
+    engine.start()
+    try:
+        assert engine._loop is not None
+        urls = [f"http://mock/schedule/games/G1/relay?inning={inning}" for inning in range(1, 10)]
+
+        async def fetch_all() -> list:
+            return await asyncio.gather(*(engine._fetch_json(url) for url in urls))
+
+        results = asyncio.run_coroutine_threadsafe(fetch_all(), engine._loop).result(timeout=5)
+    finally:
+        engine.stop()
+
+    assert len(results) == 9
+    assert peak == 2
@@ -1,6 +1,8 @@
 import argparse
 from datetime import date
 
+import pytest
+
 from live_wbc_dispatcher import (
     _build_schedule_import_dates,
     _build_team_record_payload,
@@ -11,6 +13,7 @@ from live_wbc_dispatcher import (
     _resolve_schedule_targets,
     _should_skip_schedule_snapshot,
     build_parser,
+    validate_args,
 )
 
 
@@ -230,6 +233,58 @@ def test_parser_crawler_backend_retry_options_default_and_override() -> None:
     assert args_custom.crawler_backend_retries == 9
 
 
+def test_parser_crawler_incremental_relay_flag_default_and_enable() -> None:
+    parser = build_parser()
+    args_default = parser.parse_args(["--backend-base-url", "http://localhost:8080", "--backend-api-key", "x"])
+    assert args_default.crawler_incremental_relay is False
+
+    args_enabled = parser.parse_args(
+        ["--backend-base-url", "http://localhost:8080", "--backend-api-key", "x", "--crawler-incremental-relay"]
+    )
+    assert args_enabled.crawler_incremental_relay is True
+
+
+def test_parser_crawler_engine_default_and_async() -> None:
+    parser = build_parser()
+    args_default = parser.parse_args(["--backend-base-url", "http://localhost:8080", "--backend-api-key", "x"])
+    assert args_default.crawler_engine == "subprocess"
+    assert args_default.crawler_max_connections == 20
+
+    args_async = parser.parse_args(
+        [
+            "--backend-base-url",
+            "http://localhost:8080",
+            "--backend-api-key",
+            "x",
+            "--crawler-engine",
+            "async",
+            "--crawler-max-connections",
+            "8",
+        ]
+    )
+    assert args_async.crawler_engine == "async"
+    assert args_async.crawler_max_connections == 8
+
+
+def test_adaptive_interval_requires_async_engine_and_upstream_budget() -> None:
+    parser = build_parser()
+    base = ["--backend-base-url", "http://localhost:8080", "--backend-api-key", "x"]
+
+    args_default = parser.parse_args(base)
+    assert args_default.crawler_upstream_rps == 5.0
+    validate_args(parser, args_default)
+
+    args_async = parser.parse_args([*base, "--crawler-engine", "async", "--crawler-adaptive-interval"])
+    validate_args(parser, args_async)
+
+    for extra in (
+        ["--crawler-adaptive-interval"],
+        ["--crawler-engine", "async", "--crawler-adaptive-interval", "--crawler-upstream-rps", "0"],
+    ):
+        with pytest.raises(SystemExit):
+            validate_args(parser, parser.parse_args([*base, *extra]))
+
+
 def test_parser_dispatcher_singleton_options() -> None:
     parser = build_parser()
     args_default = parser.parse_args(["--backend-base-url", "http://localhost:8080", "--backend-api-key", "x"])
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from poll_scheduler import AdaptivePollScheduler, RequestBudget
+
+
+def test_scheduler_shrinks_on_state_change_and_grows_when_quiet() -> None:
+    scheduler = AdaptivePollScheduler(base_interval=15, min_interval=3, max_interval=60)
+
+    assert scheduler.observe(state_signature="a", event_types=["BALL"]) == 3
+    assert scheduler.observe(state_signature="a") == 4.5
+    assert scheduler.observe(state_signature="a") == 6.75
+    for _ in range(10):
+        scheduler.observe(state_signature="a")
+    assert scheduler.interval == 15
+
+
+def test_scheduler_stretches_during_breaks_until_play_resumes() -> None:
+    scheduler = AdaptivePollScheduler(base_interval=15, min_interval=3, max_interval=60)
+
+    assert scheduler.observe(state_signature="a", event_types=["OUT", "HALF_INNING_CHANGE"]) == 60
+    assert scheduler.in_break is True
+    assert scheduler.observe(state_signature="a") == 60
+
+    assert scheduler.observe(state_signature="b", event_types=["STRIKE"]) == 3
+    assert scheduler.in_break is False
+
+
+def test_scheduler_backs_off_on_rate_limit() -> None:
+    scheduler = AdaptivePollScheduler(base_interval=10, min_interval=3, max_interval=60)
+    scheduler.observe(state_signature="a", event_types=["BALL"])
+
+    assert scheduler.observe(rate_limited=True) == 20
+    assert scheduler.observe(rate_limited=True) == 40
+    assert scheduler.observe(rate_limited=True) == 60
+
+
+def test_request_budget_spaces_requests_beyond_burst() -> None:
+    async def scenario() -> float:
+        budget = RequestBudget(requests_per_sec=20, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            await budget.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(scenario()) >= 0.09
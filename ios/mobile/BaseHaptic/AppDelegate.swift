@@ -80,10 +80,20 @@ class AppDelegate: NSObject, UIApplicationDelegate, UNUserNotificationCenterDele
         }
 
         // 햅틱 이벤트 워치로 전달 (마스터 스위치 OFF 시 차단)
+        // 백엔드가 짧은 구간의 이벤트를 push 1번으로 합치면 event_types 에 발생 순서대로 전체 목록이 온다.
+        // event_type / event_cursor 는 마지막 이벤트 기준이라 event_types 가 있으면 그 순서대로 모두 전달.
         let liveHapticEnabled = UserDefaults.standard.bool(forKey: "live_haptic_enabled")
         if liveHapticEnabled {
             let cursor = userInfo["event_cursor"] as? Int64
-            WatchGameSyncManager.shared.sendHapticEvent(eventType: eventType, cursor: cursor)
+            let eventTypes = (userInfo["event_types"] as? [String])?.filter { !$0.isEmpty } ?? []
+            if eventTypes.isEmpty {
+                WatchGameSyncManager.shared.sendHapticEvent(eventType: eventType, cursor: cursor)
+            } else {
+                for (index, type) in eventTypes.enumerated() {
+                    let isLast = index == eventTypes.count - 1
+                    WatchGameSyncManager.shared.sendHapticEvent(eventType: type, cursor: isLast ? cursor : nil)
+                }
+            }
         }
 
         // 게임 상태도 함께 왔으면 워치 UI 업데이트
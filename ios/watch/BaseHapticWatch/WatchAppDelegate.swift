@@ -54,10 +54,15 @@ class WatchAppDelegate: NSObject, WKApplicationDelegate, UNUserNotificationCente
             return
         }
 
-        // 햅틱 이벤트 처리
-        print("⌚ [APNs] Haptic event from push: \(eventType)")
+        // 햅틱 이벤트 처리. 합쳐진 push 는 event_types 에 발생 순서대로 전체 목록이 온다 (event_type 은 마지막 이벤트).
+        let eventTypes = (userInfo["event_types"] as? [String])?.filter { !$0.isEmpty } ?? []
+        print("⌚ [APNs] Haptic event from push: \(eventTypes.isEmpty ? [eventType] : eventTypes)")
         DispatchQueue.main.async {
-            WatchConnectivityManager.shared.handleDirectPushHapticEvent(eventType: eventType)
+            if eventTypes.isEmpty {
+                WatchConnectivityManager.shared.handleDirectPushHapticEvent(eventType: eventType)
+            } else {
+                WatchConnectivityManager.shared.handleDirectPushHapticEvents(eventTypes)
+            }
             // 게임 상태도 함께 왔으면 UI 업데이트
             if let gameData = self.parseGameData(from: userInfo) {
                 WatchConnectivityManager.shared.handleDirectPushGameData(gameData)
@@ -329,6 +329,18 @@ final class WatchConnectivityManager: NSObject, ObservableObject, WCSessionDeleg
         triggerHaptic(eventType: eventType)
     }
 
+    /// 합쳐진 push 의 event_types 를 순서대로 재생. 패턴이 겹치지 않도록 간격을 둔다.
+    func handleDirectPushHapticEvents(_ eventTypes: [String]) {
+        for (index, eventType) in eventTypes.enumerated() {
+            DispatchQueue.main.asyncAfter(deadline: .now() + Double(index) * Self.mergedEventInterval) {
+                self.handleDirectPushHapticEvent(eventType: eventType)
+            }
+        }
+    }
+
+    /// 합쳐진 이벤트 사이 간격 (SCORE/HOMERUN 패턴 길이 0.6초보다 길게)
+    private static let mergedEventInterval: TimeInterval = 0.8
+
     /// APNs push에서 직접 받은 게임 데이터 처리
     func handleDirectPushGameData(_ message: [String: Any]) {
         print("⌚ [WatchConn] Direct push game_data")